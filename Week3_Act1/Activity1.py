@@ -23,6 +23,10 @@ graph search and third, A* as Tree search.
 This script provides users with the option to excecute each search and visualises the
 search process and result. Classes are stored in the classes directory.
 """
+import os
+import sys
+## the classes are configurations of the searches in algorithms/, make the repository importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 
 from classes.GBFS import GBFS
 from classes.Astar_tree import AStarTree
@@ -4,116 +4,84 @@ Purpose: Solve Activity 1 from Week 3 in AIML - navigate a robot around obstacle
 Apply Tree Search for A* Algorithm with Manhattan Distance as heuristic
 """
 # import packages
-import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-import copy
-from algorithm.utils.TreeNode import TreeNode
+from algorithms.utils.TreeSearch import TreeSearch
+from algorithms.utils.SMAStar import SMAStarEngine
+from algorithms.utils.SearchStats import make_stats
+from algorithms.utils.Problem import Solution
 
-class AStarTree:
+class AStarTree(TreeSearch):
     """
     A class representing a graph used for heuristic-based pathfinding via search Tree.
+    The frontier is ranked by the heuristic values summed along the path from the root (∑h(x)).
+    `solve` ranks by f(x) = g(x) + h(x). With a `memory` budget it runs SMA* instead: ranked by f(x) = g(x) + h(x), the search
+    tree never holds more than `memory` nodes and the solution is the cheapest one that fits.
 
     Attributes:
         _graph (nx.Graph): The NetworkX graph representation.
         _end_node (str): The goal node.
         _step (int): A counter to track search steps.
         _frames (list): Stores frames for visualization.
-        _frontier (list): The list of nodes to explore.
         _path (list): The solution path.
     """
-
-    def __init__(self, nodes: dict, edges: tuple, start_node: str = "a", end_node: str = "h"):
-        """
-        Initializes the MyGraph object.
-
-        Args:
-            nodes (dict): A dictionary mapping node names to heuristic values.
-            edges (tuple): A tuple of edges where each edge is (node1, node2, stepcost).
-            start_node (str, optional): The starting node (default: "a").
-            end_node (str, optional): The goal node (default: "h").
+    algorithm = "AStarTree"
+    policy = "sum_h"
+    problem_policy = "g+h"
+    frame_on_select = True
+
+    def __init__(self, nodes: dict,
+                 edges: tuple,
+                 start_node: str = "a",
+                 end_node: str = "h",
+                 limit=None,
+                 stats: bool = False,
+                 show: bool = True,
+                 prune: str = None,
+                 table_size: int = None,
+                 memory: int = None,
+                 budget=None,
+                 trace: str = None,
+                 live: bool = False):
         """
-        self._end_node = end_node
-        self._step = 0
-        self._graph = nx.Graph()
-        self._fill_graph(edges, nodes)
-        self._frames = []
-        self._frontier = []
-        self._path = []
-        self._search(start_node, end_node)
-        self._get_path_cost()
-        self.visualise()
-
-    def _search(self, current_node, goal):
-        """
-        implements A* search algorithm with a search tree
         Args:
-             current_node: determines start of the path
-             goal: determines goal state
+            memory (int, optional): Node budget of SMA*, cannot be combined with limit or prune
+                (default: None, plain tree search).
         """
-        ##set initial first node that is explored (start_node)
-        current_node = TreeNode(current_node,
-                                heuristic=0,
-                                neighbors=self._graph.neighbors(current_node)
-                                )
-        current_node.set_step(self._step) ##set search step
-        current_node.toggle_start()
-        self._root = current_node ##set root for search tree
-        self._frontier.append(current_node) ##expand frontier
-        while current_node: ##start search loop
-            current_node.toggle_occupied() ##toogle node to occupied
-            current_node.set_step(self._step) ##set search step (redundand for start node, but needed earlier)
-            self._frames.append(copy.deepcopy(self._root))  ##append snapshot of current search tree for animation
-            ## check if reached goal
-            if current_node.name == goal:
-                self._end_leaf = current_node
-                while current_node:##generate solution
-                    self._path.append(current_node._id) ##add node to path solution
-                    ##find parent of node or None(for the start node)
-                    current_node.edge_color = "red" ##set path color for later visualisation
-                    current_node = current_node.parent ##switch to next node on path
-                self._path = list(reversed(list(self._path))) ##reverse path to have right order
-                self._frames.append(self._root) ##append a last snapshot of solved tree
-                return None
-
-            ## remove from frontier
-            self._frontier.remove(current_node)
-            current_node.toggle_occupied() ##to to unoccupied
-            current_node.toggle_explored() ##set as explored
-            ## expand frontier and save parent for newly added nodes
-            for node in current_node._neighbors: ##get neighbors to expand frontier
-                    node_data = self._graph.nodes[node] ##get attributes of node (h(x), neighbors)
-                    self._frontier.append( ##add node to frontier
-                        TreeNode(
-                            node,
-                            heuristic=node_data["heuristic"], ##h(x) heuristic value of node
-                            neighbors=self._graph.neighbors(node), ##neighbors for later expansion of frontier
-                            parent=current_node, ##parent, for tree struktur and later path generation
-                            path_cost=self._graph.get_edge_data(current_node.name,
-                                                                node)["stepcost"], ##cost to get to the node from parent
-                        )
-                    )
-            ## define next node based on heuristic
-            current_node = self._find_next()
-
-    def _find_next(self):
-        """determiens the node in the frontier with the lowest cumulative heuristic value"""
-        self._step += 1 ##increase search step
-        if len(self._frontier) == 0:
-            return False  ##if there is no solution
-        min_ = float("inf") ##variable to determine the cheapest next node
-        min_node = None ##next node
-        for node in self._frontier: ##go over all nodes in frontier to find the
-            ##node with the cheapest cumulative heuristic value from root to self
-            ## Difference to GBFS -> find minimal path sum
-            ##GBFS would just find the node with cheapest individual heuristic
-            if node.sum_heuristic < min_: ##if heuristic value is lower set node as new node
-                min_ = node.sum_heuristic
-                min_node = node
-        return min_node
+        if memory is not None and (limit is not None or prune is not None):
+            raise ValueError("memory cannot be combined with limit or prune")
+        self._memory = memory
+        super().__init__(nodes, edges, start_node, end_node, limit, stats, show, prune, table_size, budget, trace, live)
+
+    def _make_engine(self, limit, prune, table_size, budget):
+        if self._memory is None:
+            return super()._make_engine(limit, prune, table_size, budget)
+        return SMAStarEngine(self._successors, self._is_goal, self._memory, make_node=self._make_node,
+                             heuristic=self._heuristic, observer=self, stats=self._stats, budget=budget)
+
+    @classmethod
+    def solve(cls, problem, limit=None, stats=False, prune=None, table_size=None, memory=None, budget=None):
+        """Like `TreeSearch.solve`, with `memory` it runs SMA* with that node budget."""
+        if memory is None:
+            return super().solve(problem, limit, stats, prune, table_size, budget)
+        if limit is not None or prune is not None:
+            raise ValueError("memory cannot be combined with limit or prune")
+        search_stats = make_stats(stats, cls.algorithm)
+        if problem.solvable() is False:
+            return Solution(None, search_stats, expanded=0, generated=0)
+        engine = SMAStarEngine(problem.successors, problem.is_goal, memory, heuristic=problem.h,
+                               key=problem.key, stats=search_stats, budget=budget)
+        return Solution.of(engine, engine.run(problem.initial), search_stats)
+
+    def _heuristic(self, node):
+        return self._graph.nodes[node]["heuristic"]
+
+    def get_dropped(self):
+        """Returns the number of leaves SMA* dropped to stay within `memory` (0 without a budget)."""
+        return getattr(self._engine, "dropped", 0)
 
     def _get_path_cost(self):
         """Generates Dictionary with the heuristic approximiated costs and actual costs and prints it"""
+        if not self._end_leaf:
+            return
         self._path_cost = {
             "heuristic": self._end_leaf.sum_heuristic,
             "stepcost": self._end_leaf.sum_path_cost
@@ -136,72 +104,14 @@ class AStarTree:
                                  explored=False, occupied=False)
         for node1, node2, stepcost in edges:
             ## add each edges with its stepcost
-            self._graph.add_edge(node1, node2, stepcost=stepcost, color="gray")
-
-    def visualise(self):
-        """Vidualise the search process animates a growing search tree to
-        let user see how the algorithm traverses the tree in order to find a solution.
-        The finished tree shows explored nodes in light green, the goal node in green and
-        unexplored nodes in lightblue, the solving path is red. Each node displays
-        its cumulative heuristic cost, unique id and search step. Unexplored nodes have no search step.
-        Actual pathcosts are displayed at the respective edge."""
-        fig, ax = plt.subplots(figsize=(8, 6)) ##initialise the plt objective
-
-        def _plot_frame(frame):
-            ax.clear() ##clear tzhe graph for each animation frame
-
-            G = nx.DiGraph() ##initialise graph to be turned into tree
-            edge_labels = {} ##edgelabels are generated in the next function
-
-            def add_edges(node):
-                """Recursive function to add nodes and edges to the graph."""
-                if not node in G.nodes():
-                    G.add_node(node._id,
-                               label=node.name,
-                               occupied=node._occupied,
-                               explored=node._explored,
-                               sum_heuristic=node.sum_heuristic,
-                               step=node.step,
-                               start=node.start)
-                for child in node.children:
-                    G.add_edge(node._id, child._id, color=child.edge_color)
-                    edge_labels[(node._id, child._id)] = child.path_cost
-                    add_edges(child)
-
-            add_edges(frame)
-            #determine edge colors, always the same except in the last frame
-            edge_colors = [edge[2]['color'] for edge in G.edges(data=True)]
-            ##determine node color and label
-            node_colors = []
-            node_labels = {}
-            for node, data in G.nodes(data=True):
-                node_labels[node] = (f"{data.get('label')}\n" +
-                                     f"∑h(x): {data.get('sum_heuristic')}\n" +
-                                     f"id: {node}\n" +
-                                     f"step: {data.get('step')}")
-                if data.get("start", False):
-                    node_colors.append("yellow")
-                elif data.get("occupied", False):
-                    node_colors.append("green")
-                elif data.get("explored", False):
-                    node_colors.append("lightgreen")
-                else:
-                    node_colors.append("lightblue")
-            ## Tree layout (Graphviz better for hierarchical structures)
-            try:
-                pos = nx.nx_agraph.graphviz_layout(G, prog="dot")  # Needs pygraphviz
-            except ImportError:
-                pos = nx.planar_layout(G)  # Fallback layout
-
-            nx.draw(G, pos, with_labels=False, node_color=node_colors, edge_color=edge_colors, edge_cmap=plt.cm.Blues,
-                    node_size=2000, ax=ax)
-            nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=9, label_pos=0.5, ax=ax)
-            nx.draw_networkx_labels(G, pos, labels=node_labels, font_weight="bold", font_size=10, ax=ax)
-
-        ani = animation.FuncAnimation(fig, _plot_frame,
-                                      frames=self._frames, interval=1000, repeat=False)
-        plt.axis("off")
-        plt.show()
+            self._add_edge(node1, node2, stepcost=stepcost, color="gray")
+
+    @staticmethod
+    def _node_label(node):
+        return (f"{node.name}\n" +
+                f"∑h(x): {node.sum_heuristic}\n" +
+                f"id: {node._id}\n" +
+                f"step: {node.step}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+"""
+Sliding-tile puzzle (8-puzzle, 15-puzzle) as Problem for the `solve` method of the
+search classes, with additive pattern database heuristics.
+
+A state is one integer: the low 64 bits hold the tile on each cell (4 bits per cell,
+0 is the blank), the bits above hold the cell of each tile (4 bits per tile, tile 0
+first). Both halves are updated by a few bit operations per move, so successors are
+generated in O(1) and the cells of a group of consecutive tiles are one bit field.
+
+The pattern databases are stored in $AIML_PDB_CACHE (default: ~/.cache/aiml_pub/pdb);
+the three 15-puzzle databases take a few seconds to build. With them AStar.solve
+handles 8-puzzles instantly and 15-puzzles with optimal solutions up to about 45
+moves in seconds; instances around 50 moves can take minutes and the hardest random
+instances (e.g. Korf's 100, 50-66 moves) are out of reach in pure Python.
+"""
+import os
+
+import numpy as np
+
+from algorithms.utils.Problem import Problem
+
+CACHE_DIR = os.environ.get("AIML_PDB_CACHE",
+                           os.path.join(os.path.expanduser("~"), ".cache", "aiml_pub", "pdb"))
+BOARD_BITS = 64  ##the cell -> tile half of a state, the tile -> cell half starts above it
+BOARD_MASK = (1 << BOARD_BITS) - 1
+UNREACHED = 255
+PARTITIONS = {2: (3,), 3: (4, 4), 4: (5, 5, 5)}  ##default tile groups of the pattern databases
+
+
+def neighbours(size):
+    """Returns the cells next to each cell of a size x size board, as tuple of tuples."""
+    cells = []
+    for cell in range(size * size):
+        row, col = divmod(cell, size)
+        cells.append(tuple(r * size + c for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+                           if 0 <= r < size and 0 <= c < size))
+    return tuple(cells)
+
+
+def pack(tiles):
+    """Packs the tiles in row-major order (0 for the blank) into a state integer."""
+    state = 0
+    for cell, tile in enumerate(tiles):
+        state |= tile << (cell << 2) | cell << (BOARD_BITS + (tile << 2))
+    return state
+
+
+def unpack(state, size):
+    """Returns the tiles of a state in row-major order."""
+    return tuple((state >> (cell << 2)) & 15 for cell in range(size * size))
+
+
+def build_pattern_database(size, first, count):
+    """
+    Breadth first search backwards from the goal over the cells of the tiles
+    first .. first+count-1. A pattern tile may move to any neighbouring cell not held by
+    another pattern tile and every such move costs 1, so the moves of the other tiles
+    are free and the values of disjoint tile groups can be added.
+
+    Args:
+        size (int): Board width, at most 4.
+        first (int): Smallest tile of the group.
+        count (int): Number of tiles in the group.
+
+    Returns:
+        np.ndarray: uint8 array of 16**count entries, indexed by the packed cells of the
+        group (4 bits per tile, tile `first` lowest). Unused indices hold 255.
+    """
+    table = np.array([cells + (-1,) * (4 - len(cells)) for cells in neighbours(size)] +
+                     [(-1,) * 4] * (16 - size * size), dtype=np.int64)
+    dist = np.full(16 ** count, UNREACHED, dtype=np.uint8)
+    layer = np.array([sum(tile << (4 * i) for i, tile in enumerate(range(first, first + count)))],
+                     dtype=np.int64)  ##in the goal tile t lies on cell t
+    dist[layer] = 0
+    depth = 0
+    while layer.size:
+        depth += 1
+        cells = [(layer >> (4 * i)) & 15 for i in range(count)]
+        children = []
+        for i in range(count):
+            for direction in range(4):
+                target = table[cells[i], direction]
+                free = target >= 0
+                for j in range(count):
+                    if j != i:
+                        free &= target != cells[j]
+                children.append(layer[free] + (target[free] - cells[i][free]) * 16 ** i)
+        layer = np.unique(np.concatenate(children))
+        layer = layer[dist[layer] == UNREACHED]
+        dist[layer] = depth
+    return dist
+
+
+def pattern_database(size, first, count, cache_dir=None):
+    """
+    Returns the pattern database of a tile group, memory-mapped from the cache
+    directory. It is built and stored on first use.
+
+    Args:
+        size (int): Board width.
+        first (int): Smallest tile of the group.
+        count (int): Number of tiles in the group.
+        cache_dir (str, optional): Cache directory (default: $AIML_PDB_CACHE or ~/.cache/aiml_pub/pdb).
+    """
+    directory = cache_dir or CACHE_DIR
+    path = os.path.join(directory, f"pdb-{size}x{size}-{first}-{first + count - 1}.npy")
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(tmp, build_pattern_database(size, first, count))
+        os.replace(tmp, path)  ##atomic, concurrent builders never see half written files
+    return np.load(path, mmap_mode="r")
+
+
+class SlidingTile(Problem):
+    """
+    The n-puzzle on a size x size board (size <= 4). The goal has tile t on cell t,
+    the blank in the top left corner. Every move costs 1.
+
+    Attributes:
+        size (int): Board width.
+        databases (list): (shift, mask, table) per tile group, table is a read-only memoryview
+            of the memory-mapped pattern database.
+    """
+
+    def __init__(self, tiles, size=None, partition=None, cache_dir=None):
+        """
+        Args:
+            tiles (sequence or int): Start tiles in row-major order (0 for the blank), or a packed state.
+            size (int, optional): Board width (default: derived from the number of tiles, required for packed states).
+            partition (tuple, optional): Sizes of the consecutive tile groups of the pattern
+                databases, e.g. (5, 5, 5) for tiles 1-5, 6-10, 11-15 (default: PARTITIONS[size]).
+            cache_dir (str, optional): Directory of the pattern database files.
+        """
+        if size is None:
+            if isinstance(tiles, int):
+                raise ValueError("the size of a packed state must be given")
+            size = int(round(len(tiles) ** 0.5))
+        if not 2 <= size <= 4:
+            raise ValueError("4 bits per tile hold boards of at most 4 x 4 cells")
+        initial = tiles if isinstance(tiles, int) else pack(tiles)
+        super().__init__(initial, pack(range(size * size)))
+        self.size = size
+        self._neighbours = neighbours(size)
+        self._partition = partition or PARTITIONS[size]
+        self._cache_dir = cache_dir
+        if sum(self._partition) != size * size - 1:
+            raise ValueError(f"the tile groups {self._partition} do not cover the {size * size - 1} tiles")
+        self._open_databases()
+
+    def _open_databases(self):
+        self.databases = []
+        first = 1
+        for count in self._partition:
+            table = memoryview(pattern_database(self.size, first, count, self._cache_dir))
+            self.databases.append((BOARD_BITS + 4 * first, 16 ** count - 1, table))
+            first += count
+
+    def __getstate__(self):
+        ## memory maps are not pickled, worker processes map the database files again
+        state = self.__dict__.copy()
+        del state["databases"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open_databases()
+
+    def successors(self, state):
+        blank = (state >> BOARD_BITS) & 15
+        children = []
+        for cell in self._neighbours[blank]:
+            tile = (state >> (cell << 2)) & 15
+            ## board: tile moves from cell to blank; cells: blank <-> cell for tile 0 and the tile
+            children.append((state ^ (tile << (cell << 2)) ^ (tile << (blank << 2))
+                             ^ (blank ^ cell) << BOARD_BITS
+                             ^ (blank ^ cell) << (BOARD_BITS + (tile << 2)), 1))
+        return children
+
+    def key(self, state):
+        """The cell -> tile half, it determines the state and fits into 64 bits."""
+        return state & BOARD_MASK
+
+    def from_key(self, key):
+        for cell in range(self.size * self.size):
+            key |= cell << (BOARD_BITS + (((key >> (cell << 2)) & 15) << 2))
+        return key
+
+    def h(self, state):
+        """Sum of the pattern database values of the tile groups."""
+        return sum(table[(state >> shift) & mask] for shift, mask, table in self.databases)
+
+    def manhattan(self, state):
+        """Sum of the manhattan distances of the tiles to their goal cells."""
+        size = self.size
+        distance = 0
+        for tile in range(1, size * size):
+            cell = (state >> (BOARD_BITS + (tile << 2))) & 15
+            distance += abs(cell // size - tile // size) + abs(cell % size - tile % size)
+        return distance
+
+    def solvable(self):
+        """Whether the goal can be reached from the initial state (permutation parity check)."""
+        tiles = [tile for tile in unpack(self.initial, self.size) if tile]
+        inversions = sum(1 for i, a in enumerate(tiles) for b in tiles[i + 1:] if a > b)
+        if self.size % 2:
+            return inversions % 2 == 0
+        blank_row = ((self.initial >> BOARD_BITS) & 15) // self.size
+        return (inversions + blank_row) % 2 == 0
+
+    def tiles(self, state):
+        """Returns the tiles of a state in row-major order."""
+        return unpack(state, self.size)
@@ -2,125 +2,60 @@
 Class to handle Best First Search, as graph.
 """
 # import packages
-import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from collections import deque
-class BFS:
-    def __init__(self, nodes: list,
-                 edges: tuple,
-                 start_node: str = "a",
-                 end_node: str = "h"):
-        self._end_node = end_node
-        self._step=0
-        self._graph = nx.Graph()
-        self._fill_graph(edges, nodes)
-        self._frames = []
-        self._frontier = deque() #create frontier
-        self._explored = [] #save explored nodes
-        self._came_from = {} #save the parent of a node
-        self._path = [] ##safe solution
-        self._search(start_node, end_node)
-        self._get_path_cost()
-        self.visualise()
+from algorithms.utils.GraphSearch import GraphSearch
+from algorithms.utils.CSRGraph import CSRGraph
+from algorithms.utils.ExternalBFS import ExternalBFS, csr_expander, problem_expander
+from algorithms.utils.LevelBFS import LevelBFS
+class BFS(GraphSearch):
+    """Breadth first search as graph search: expands the oldest frontier node first."""
+    algorithm = "BFS_graph"
+    policy = "fifo"
 
-    def _search(self, current_node, goal):
-        self._graph.nodes[current_node]["start"] = True
-        self._frontier.append(current_node)
-        while current_node:
-            current_node = self._frontier.popleft()
-            self._graph.nodes[current_node]["occupied"] = True
-            self._graph.nodes[current_node]["frontier"] = False
-            self._graph.nodes[current_node]["step"] = self._step
-            ## check if reached goal
-            if current_node == goal:
-                while current_node:
-                    self._path.append(current_node)
-                    ##find parent of node or None(for the start node)
-                    current_node = self._came_from.get(current_node)
-                self._path = list(self._path)
-                for node1, node2 in zip(
-                        self._path[:-1], self._path[1:]):
-                    self._graph[node1][node2]["color"] = "red"
-                self._frames.append(self._graph.copy())
-                return None
+    @staticmethod
+    def external(space, start=None, goal=None, directory=None, chunk_size=1 << 20, max_depth=None,
+                 directed=False, budget=None):
+        """
+        Breadth first search with the layers on disk instead of a frontier and reached
+        set in memory, for state spaces larger than RAM. See `ExternalBFS`.
 
-            ## add node to explored
-            self._explored.append(current_node)
-            ## expand frontier and save parent for newly added nodes
-            for node in self._graph.neighbors(current_node):
-                if not (node in self._frontier or
-                 node in self._explored):
-                    self._frontier.append(node)
-                    self._came_from[node] = current_node
-                    self._graph.nodes[node]["frontier"] = True
-            self._graph.nodes[current_node]["occupied"] = False
-            self._graph.nodes[current_node]["explored"] = True
-            self._step += 1
-            self._frames.append(self._graph.copy())
+        Args:
+            space (CSRGraph or Problem): The graph, or a problem with integer `key`/`from_key`.
+            start (str, optional): Start node name of a graph (default: the problem's initial state).
+            goal (optional): Stop at this node name or problem state (default: None, generate every
+                reachable layer, e.g. for reachability and depth analyses).
+            directory (str, optional): Work directory of the layer files (default: a temporary directory).
+            chunk_size (int, optional): Keys handled at once, bounds the RAM use (default: 2**20).
+            max_depth (int, optional): Number of layers to generate after the start (default: all).
+            directed (bool, optional): The problem's moves are not reversible, duplicates are
+                checked against all layers (default: False, a graph uses its own flag).
+            budget (Budget, optional): Run limits, see `ExternalBFS.run` (default: no limits).
 
-    def _get_path_cost(self):
-        self._path_cost = {
-            "stepcost": sum(
-                self._graph.get_edge_data(node1, node2)["stepcost"]
-                for node1, node2 in zip(
-                    self._path[:-1], self._path[1:]
-                )
-            )
-        }
-        print("The stepcost for the path is: ",
-              self._path_cost["stepcost"])
+        Returns:
+            ExternalBFS: Layer sizes, goal depth, the stop reason and the layer files.
+        """
+        if isinstance(space, CSRGraph):
+            search = ExternalBFS(csr_expander(space), directory, chunk_size, directed=space.directed)
+            start_key = space.index(start)
+            goal_key = space.index(goal) if goal is not None else None
+        else:
+            search = ExternalBFS(problem_expander(space), directory, chunk_size, directed=directed)
+            start_key = space.key(space.initial)
+            goal_key = space.key(goal) if goal is not None else None
+        search.run(start_key, goal_key, max_depth, budget)
+        return search
 
-    def _fill_graph(self, edges, nodes):
-        for node in nodes:
-            ## add each node with its heuristic
-            self._graph.add_node(node,
-                                 explored=False, occupied=False,
-                                 frontier=False,
-                                 step=""
-                                 )
-        for node1, node2, stepcost in edges:
-            ## add each edges with its stepcost
-            self._graph.add_edge(node1, node2, stepcost=stepcost, color="gray")
+    @staticmethod
+    def levels(graph, start, goal=None, max_depth=None):
+        """
+        Level-synchronous breadth first search on a CSRGraph: every BFS level is expanded
+        by array operations instead of node by node, for hop distances and fewest-edge
+        paths on large graphs. See `LevelBFS`, whose instances also reuse the adjacency
+        matrices for many queries.
 
-    def visualise(self):
-        fig, ax = plt.subplots(figsize=(8, 6))
-        pos = nx.kamada_kawai_layout(self._graph)  # Layout for positioning
-        def _plot_frame(frame):
-            ax.clear()
-
-            node_colors = []
-            for node, data in frame.nodes(data=True):
-                if data.get("start", False):
-                    node_colors.append("yellow")
-                elif data.get("occupied", False):
-                    node_colors.append("green")
-                elif data.get("explored", False):
-                    node_colors.append("lightgreen")
-                elif data.get("frontier", False):
-                    node_colors.append("pink")
-                else:
-                    node_colors.append("lightblue")
-            # Draw nodes
-            nx.draw_networkx_nodes(frame, pos, node_color=node_colors, node_size=2000,
-                                   edgecolors="black", ax=ax)
-            edge_colors = [edge[2]['color'] for edge in frame.edges(data=True)]
-            # Draw edges with weights
-            nx.draw_networkx_edges(frame, pos, width=1.5, edge_color=edge_colors)
-            # Add edge labels (step cost)
-            edge_labels = {(u, v): f"{d['stepcost']}" for u, v, d in frame.edges(data=True)}
-            nx.draw_networkx_edge_labels(frame, pos, edge_labels=edge_labels,
-                                         font_size=10, font_color="black", ax=ax)
-            # Add node labels (name + heuristic)
-            node_labels = {node: f"{node}\nstep: {data['step']}"
-                           for node, data in frame.nodes(data=True)}
-            nx.draw_networkx_labels(frame, pos, labels=node_labels,
-                                    font_size=12, font_color="black", ax=ax)
-
-        ani = animation.FuncAnimation(fig, _plot_frame,
-                                      frames=self._frames, interval=800, repeat=False)
-        plt.axis("off")
-        plt.show()
+        Returns:
+            tuple: (hops, pred) arrays indexed by node number, see `LevelBFS.run`.
+        """
+        return LevelBFS(graph).run(start, goal, max_depth)
 
 if __name__ == "__main__":
     def vacuum():
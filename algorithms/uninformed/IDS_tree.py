@@ -2,197 +2,17 @@
 Class to handle Best First Search, as graph.
 """
 # import packages
-import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from collections import deque
-from algorithm.utils.TreeNode import TreeNode
-import copy
-class IDS_tree:
-    def __init__(self, nodes: list,
-                 edges: tuple,
-                 start_node: str = "a",
-                 end_node: str = "h"):
-        self._end_node = end_node
-        self._start_node = start_node
-        self._end_leaf = None
-        self._step=0
-        self._limit = 0
-        self._graph = nx.Graph()
-        self._fill_graph(edges, nodes)
-        self._frames = []
-        self._frontier = deque() #create frontier
-        self._explored = [] #save explored nodes
-        self._came_from = {} #save the parent of a node
-        self._path = [] ##safe solution
-        self._search(start_node, end_node)
-        self._get_path_cost()
-        self.visualise()
-
-
-    def _search(self, current_node, goal):
-        """
-        implements A* search algorithm with a search tree
-        Args:
-             current_node: determines start of the path
-             goal: determines goal state
-        """
-        ##set initial first node that is explored (start_node)
-        current_node = TreeNode(current_node,
-                                neighbors=self._graph.neighbors(current_node),
-                                frontier=True,
-                                )
-        current_node.toggle_start()
-        current_node.set_step(self._step)
-        self._root = current_node ##set root for search tree
-        self._frontier.append(current_node) ##expand frontier
-        while not self._end_leaf: ##start search loop
-            current_node = self._frontier.pop()
-            current_node.toggle_frontier()
-            current_node.toggle_occupied() ##toogle node to occupied
-            current_node.set_step(self._step) ##set search step (redundand for start node, but needed earlier)
-            ## check if reached goal
-            if current_node.name == goal:
-                self._end_leaf = current_node
-                while current_node:##generate solution
-                    self._path.append(current_node._id) ##add node to path solution
-                    ##find parent of node or None(for the start node)
-                    current_node.edge_color = "red" ##set path color for later visualisation
-                    current_node = current_node.parent ##switch to next node on path
-                self._path = list(reversed(list(self._path))) ##reverse path to have right order
-                self._frames.append([self._root, self._frontier.copy(), copy.deepcopy(self._limit)]) ##append a last snapshot of solved tree
-                return None
-
-            current_node.toggle_occupied() ##to to unoccupied
-            current_node.toggle_explored() ##set as explored
-            ## expand frontier and save parent for newly added nodes
-            for node in current_node._neighbors: ##get neighbors to expand frontier
-                depth = []
-                dummy_node = TreeNode(
-                        node,
-                        frontier=True,
-                        neighbors=None, ##neighbors for later expansion of frontier
-                        parent=copy.deepcopy(current_node), ##parent, for tree struktur and later path generation
-                        path_cost=self._graph.get_edge_data(current_node.name,
-                                                            node)["stepcost"], ##cost to get to the node from parent
-                    )
-                while dummy_node:
-                    depth.append(dummy_node)
-                    dummy_node = dummy_node.parent
-                if len(depth) > self._limit:
-                    continue
-                self._frontier.append( ##add node to frontier
-                    TreeNode(
-                        node,
-                        frontier=True,
-                        neighbors=self._graph.neighbors(node), ##neighbors for later expansion of frontier
-                        parent=current_node, ##parent, for tree struktur and later path generation
-                        path_cost=self._graph.get_edge_data(current_node.name,
-                                                            node)["stepcost"], ##cost to get to the node from parent
-                    )
-                )
-            self._frames.append([copy.deepcopy(self._root), self._frontier.copy(), copy.deepcopy(self._limit)])  ##append snapshot of current search tree for animation
-            self._step += 1
-            if not self._frontier:
-                current_node.reset_id()
-                self._limit += 1
-                self._search(self._start_node, self._end_node)
-
-
-    def _get_path_cost(self):
-        if self._end_leaf:
-            self._path_cost = {
-                "stepcost": self._end_leaf.sum_path_cost
-            }
-            print("The stepcost for the path is: ",
-                  self._path_cost["stepcost"])
-
-    def _fill_graph(self, edges, nodes):
-        for node in nodes:
-            ## add each node with its heuristic
-            self._graph.add_node(node,
-                                 explored=False, occupied=False,
-                                 frontier=False,
-                                 step=""
-                                 )
-        for node1, node2, stepcost in edges:
-            ## add each edges with its stepcost
-            self._graph.add_edge(node1, node2, stepcost=stepcost, color="gray")
-
-
-    def visualise(self):
-        """Vidualise the search process animates a growing search tree to
-        let user see how the algorithm traverses the tree in order to find a solution.
-        The finished tree shows explored nodes in light green, the goal node in green and
-        unexplored nodes in lightblue, the solving path is red. Each node displays
-        its cumulative heuristic cost, unique id and search step. Unexplored nodes have no search step.
-        Actual pathcosts are displayed at the respective edge."""
-        fig, ax = plt.subplots(figsize=(8, 6)) ##initialise the plt objective
-
-        def _plot_frame(frame):
-            ax.clear() ##clear tzhe graph for each animation frame
-
-            G = nx.DiGraph() ##initialise graph to be turned into tree
-            edge_labels = {} ##edgelabels are generated in the next function
-
-            def add_edges(node):
-                """Recursive function to add nodes and edges to the graph."""
-                if not node in G.nodes():
-                    G.add_node(node._id,
-                               label=node.name,
-                               occupied=node._occupied,
-                               explored=node._explored,
-                               frontier=node._frontier,
-                               step=node.step,
-                               start=node.start)
-                for child in node.children:
-                    G.add_edge(node._id, child._id, color=child.edge_color)
-                    edge_labels[(node._id, child._id)] = child.path_cost
-                    add_edges(child)
-
-            add_edges(frame[0])
-            #determine edge colors, always the same except in the last frame
-            edge_colors = [edge[2]['color'] for edge in G.edges(data=True)]
-            ##determine node color and label
-            node_colors = []
-            node_labels = {}
-            for node, data in G.nodes(data=True):
-                node_labels[node] = (f"{data.get('label')}\n" +
-                                     f"id: {node}\n" +
-                                     f"step: {data.get('step')}")
-                if data.get("start", False):
-                    node_colors.append("yellow")
-                elif data.get("occupied", False):
-                    node_colors.append("green")
-                elif data.get("explored", False):
-                    node_colors.append("lightgreen")
-                elif data.get("frontier", False):
-                    node_colors.append("pink")
-                else:
-                    node_colors.append("lightblue")
-            ## Tree layout (Graphviz better for hierarchical structures)
-            #try:
-            pos = nx.nx_agraph.graphviz_layout(G, prog="dot")  # Needs pygraphviz
-           # except ImportError:
-            #    pos = nx.planar_layout(G)  # Fallback layout
-
-            nx.draw(G, pos, with_labels=False, node_color=node_colors, edge_color=edge_colors, edge_cmap=plt.cm.Blues,
-                    node_size=2000, ax=ax)
-            nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=9, label_pos=0.5, ax=ax)
-            nx.draw_networkx_labels(G, pos, labels=node_labels, font_weight="bold", font_size=10, ax=ax)
-            ax.text(pos[0][0], pos[0][1]+10, f"Frontier: {[ele.name for ele in frame[1]]}",
-                    horizontalalignment='center', fontsize=10, bbox=dict(facecolor='white', alpha=0.5))
-            if frame[1]:
-                ax.text(pos[0][0], 0, f"Limit: {frame[2]}",
-                        horizontalalignment='center', fontsize=10, bbox=dict(facecolor='white', alpha=0.5))
-            else:
-                ax.text(pos[0][0], 0, "No Solution found",
-                        horizontalalignment='center', fontsize=10, bbox=dict(facecolor='white', alpha=0.5))
-
-        ani = animation.FuncAnimation(fig, _plot_frame,
-                                      frames=self._frames, interval=1000, repeat=False)
-        plt.axis("off")
-        plt.show()
+from algorithms.utils.TreeSearch import TreeSearch
+class IDS_tree(TreeSearch):
+    """Iterative deepening search as tree search: depth limited searches with limit 0, 1, 2, ..."""
+    algorithm = "IDS_tree"
+    policy = "lifo"
+    iterative = True
+    captions = ((0.5, 0.02), (0.5, 0.95))
+
+    def _draw_frame(self, renderer, frame):
+        limit = f"Limit: {frame[2]}" if frame[1] else "No Solution found"
+        return renderer.update(frame[0], [f"Frontier: {frame[1]}", limit])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+"""
+Class to handle Uniform Cost Search, as graph.
+"""
+# import packages
+from algorithms.utils.GraphSearch import GraphSearch
+class UCS(GraphSearch):
+    """
+    Uniform cost search as graph search: expands the frontier node with the lowest
+    path cost g(x), so the first goal selected is reached on a cheapest path.
+    With end_node=None the search runs until every reachable node is expanded and
+    `shortest_path_tree` holds the cheapest path to all of them.
+    """
+    algorithm = "UCS"
+    policy = "g"
+    reopen = True
+
+    def on_generate(self, node):
+        super().on_generate(node)
+        self._graph.nodes[node.name]["path_cost"] = node.sum_path_cost
+
+    def shortest_path_tree(self):
+        """
+        Returns the shortest path tree of the search as (dist, pred) dictionaries:
+        node -> cost of the cheapest path from the start node and node -> previous node
+        on it (None for the start node). After an early stop at the goal only the
+        expanded nodes are final.
+        """
+        reached = self._engine.reached
+        dist = {name: node.sum_path_cost for name, node in reached.items()}
+        pred = {name: node.parent.name if node.parent is not None else None for name, node in reached.items()}
+        return dist, pred
+
+    @staticmethod
+    def _node_label(node, data):
+        # Node labels (name + path cost + search step)
+        return f"{node}\ng(x): {data.get('path_cost', 0 if data.get('start') else '')}\nstep: {data['step']}"
+
+if __name__ == "__main__":
+    # define nodes
+    nodes = [
+        "a", "b", "c", "d",
+        "e", "f", "g", "h"
+    ]
+    # define edges and stepcost
+    edges = (
+        ("a", "b", 3), ("a", "c", 3), ("b", "d", 2),
+        ("d", "e", 4), ("c", "f", 3), ("e", "f", 1),
+        ("e", "g", 2), ("f", "g", 3), ("g", "h", 2)
+    )
+
+    g = UCS(nodes, edges, "a", "h")
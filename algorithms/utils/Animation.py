@@ -0,0 +1,257 @@
+"""
+Helpers to play or export the recorded frames of a search class.
+
+A search class provides `_frames` (a list, or a TraceReader loading them from disk)
+and three hooks:
+    _make_renderer(ax): creates the artists once and returns a renderer.
+    _renderer_factories(blocks): for every block (a range of frame indices) a picklable
+        callable ax -> renderer for just these frames, used by the export workers.
+    _draw_frame(renderer, frame): updates the renderer to a frame and returns its dynamic artists.
+        It only reads the frame and class attributes, so the workers call it on a bare instance.
+Before a frame is drawn the renderer is told its position with `seek(index)`.
+
+In the live mode the search runs in a background thread and hands its frames to the
+window through a bounded FramePipe, the animation draws them while the search goes on.
+"""
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import matplotlib.pyplot as plt
+import matplotlib.animation as animation
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+FRAME_PATTERN = "frame_%06d.png"
+LIVE_FRAMES = 16  ##frames the search may run ahead of the live window
+POLL = 0.05  ##seconds the window waits for a frame before it handles its events again
+_END = object()  ##marks the last frame of a live search
+
+
+class FramePipe:
+    """
+    Bounded frame queue from a search running in a background thread to the live
+    animation. The search class uses it in place of its frame list: `append` blocks
+    while the queue is full, so the search stays at most `size` frames ahead of the
+    window and memory does not grow with the length of the search. Drawn frames are
+    dropped; with a `sink` (a TraceWriter) every frame is also kept on disk.
+
+    Attributes:
+        count (int): Number of appended frames.
+        closed (bool): The window is gone, further frames are dropped without waiting.
+    """
+
+    def __init__(self, size=LIVE_FRAMES, sink=None):
+        self._queue = queue.Queue(maxsize=size)
+        self._sink = sink
+        self.count = 0
+        self.closed = False
+
+    def __len__(self):
+        return self.count
+
+    def _put(self, item):
+        ## waits for room, but gives up when the window is closed meanwhile
+        while not self.closed:
+            try:
+                self._queue.put(item, timeout=POLL)
+                return
+            except queue.Full:
+                continue
+
+    def append(self, frame):
+        if self._sink is not None:
+            self._sink.append(frame)
+        self.count += 1
+        self._put(frame)
+
+    def finish(self):
+        """Called by the search thread after its last frame."""
+        self._put(_END)
+
+    def close(self):
+        """Called by the window side when it stops drawing."""
+        self.closed = True
+
+    def __iter__(self):
+        ## yields None while the search has no new frame, so the window stays responsive
+        while True:
+            try:
+                frame = self._queue.get(timeout=POLL)
+            except queue.Empty:
+                yield None
+                continue
+            if frame is _END:
+                return
+            yield frame
+
+
+def show_animation(search, interval=800):
+    """
+    Plays the frames of a search in a window. Blitting is used where the backend supports it.
+
+    Args:
+        search: A search class instance providing `_frames` and the renderer hooks.
+        interval (int, optional): Delay between frames in milliseconds (default: 800).
+    """
+    fig, ax = plt.subplots(figsize=(8, 6))
+    renderer = search._make_renderer(ax)
+
+    def draw(index):
+        renderer.seek(index)
+        return search._draw_frame(renderer, search._frames[index])  ##trace frames are loaded one at a time
+
+    ani = animation.FuncAnimation(fig, draw, frames=range(len(search._frames)), init_func=renderer.artists,
+                                  interval=interval, repeat=False, blit=True)
+    plt.show()
+    return ani
+
+
+def show_live(search, run, interval=800):
+    """
+    Runs a search in a background thread and plays its frames while they are recorded.
+    Without a display (or once the window is closed) the search finishes without drawing.
+
+    Args:
+        search: A search class instance whose `_frames` is a FramePipe.
+        run (callable): Runs the search, called in the background thread.
+        interval (int, optional): Delay between frames in milliseconds (default: 800).
+    """
+    pipe = search._frames
+    errors = []
+
+    def target():
+        try:
+            run()
+        except BaseException as error:  ##re-raised in the calling thread
+            errors.append(error)
+        finally:
+            pipe.finish()
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    renderer = search._make_renderer(ax)
+
+    def draw(frame):
+        return [] if frame is None else search._draw_frame(renderer, frame)
+
+    thread = threading.Thread(target=target, name="search", daemon=True)
+    thread.start()
+    ## no blitting: the tree renderer replaces its artists while the tree grows
+    ani = animation.FuncAnimation(fig, draw, frames=iter(pipe), init_func=renderer.artists,
+                                  interval=interval, repeat=False, blit=False, cache_frame_data=False)
+    plt.show()
+    pipe.close()
+    thread.join()
+    if errors:
+        raise errors[0]
+    return ani
+
+
+def _render_frames(cls, make_renderer, frames, offset, indices, directory, dpi):
+    """
+    Renders a block of frames of a search to PNG files with the Agg canvas, no display needed.
+    Runs inside the worker processes of `export_animation`, which get the renderer inputs
+    and their own frames (`frames[index - offset]`), not the whole search.
+    """
+    search = cls.__new__(cls)  ##only the drawing hook is called
+    fig = Figure(figsize=(8, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    renderer = make_renderer(ax)
+    for position, index in enumerate(indices):
+        renderer.seek(position)
+        search._draw_frame(renderer, frames[index - offset])
+        fig.savefig(os.path.join(directory, FRAME_PATTERN % index), dpi=dpi)
+    return len(indices)
+
+
+def render_frames(search, directory, workers=None, dpi=100):
+    """
+    Renders all frames of a search to a PNG sequence, spread over a process pool.
+    Every worker gets a contiguous block of frames, so renderers can reuse their artists.
+    Frames of a list are sent to the worker of their block only; a TraceReader is
+    reopened by the workers, which load their frames from the file.
+
+    Args:
+        search: A search class instance providing `_frames` and the renderer hooks.
+        directory (str): Directory for the PNG files, named frame_000000.png, frame_000001.png, ...
+        workers (int, optional): Number of processes (default: number of CPUs). 1 renders in this process.
+        dpi (int, optional): Resolution of the images (default: 100).
+
+    Returns:
+        list: Paths of the rendered frames, in order.
+    """
+    os.makedirs(directory, exist_ok=True)
+    frames = search._frames
+    total = len(frames)
+    if total == 0:
+        return []
+    workers = min(workers or os.cpu_count() or 1, total)
+    size = -(-total // workers)  ##ceil division, frames per worker
+    blocks = [range(start, min(start + size, total)) for start in range(0, total, size)]
+    factories = search._renderer_factories(blocks)
+    if isinstance(frames, list):
+        parts = [(frames[block.start:block.stop], block.start) for block in blocks]
+    else:
+        parts = [(frames, 0)] * len(blocks)
+    tasks = [(type(search), factory, part, offset, block, directory, dpi)
+             for factory, (part, offset), block in zip(factories, parts, blocks)]
+    if workers == 1:
+        for task in tasks:
+            _render_frames(*task)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            ## list() re-raises errors from the workers
+            list(pool.map(_render_frames, *zip(*tasks)))
+    return [os.path.join(directory, FRAME_PATTERN % index) for index in range(total)]
+
+
+def export_animation(search, path, fps=2, workers=None, dpi=100):
+    """
+    Exports the frames of a search without opening a window.
+    The output format is taken from the path: ".gif" writes a GIF (with Pillow),
+    ".mp4" a video (with ffmpeg), anything else is used as directory for a PNG sequence.
+    The frames of a GIF are read one at a time, so they are never all open at once.
+
+    Args:
+        search: A search class instance providing `_frames` and the renderer hooks.
+        path (str): Output file or directory.
+        fps (float, optional): Frames per second of GIF and MP4 output (default: 2).
+        workers (int, optional): Number of rendering processes (default: number of CPUs).
+        dpi (int, optional): Resolution of the frames (default: 100).
+
+    Returns:
+        str: The path written to.
+
+    Raises:
+        ValueError: A GIF or MP4 is requested for a search without frames.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in (".gif", ".mp4"):
+        render_frames(search, path, workers, dpi)
+        return path
+    if not len(search._frames):
+        raise ValueError("the search has no frames to export")
+    with tempfile.TemporaryDirectory() as directory:
+        frames = render_frames(search, directory, workers, dpi)
+        if extension == ".gif":
+            from PIL import Image  # Pillow is a dependency of matplotlib
+
+            def images():
+                ## Pillow copies each frame it writes, so the file can be closed afterwards
+                for frame in frames[1:]:
+                    with Image.open(frame) as image:
+                        yield image
+            with Image.open(frames[0]) as first:
+                first.save(path, save_all=True, append_images=images(),
+                           duration=int(1000 / fps), loop=0)
+        else:
+            subprocess.run([matplotlib.rcParams["animation.ffmpeg_path"], "-y", "-loglevel", "error",
+                            "-framerate", str(fps), "-i", os.path.join(directory, FRAME_PATTERN),
+                            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p", path],
+                           check=True)
+    return path
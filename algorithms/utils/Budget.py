@@ -0,0 +1,77 @@
+"""
+Run limits of the searches: a wall-clock deadline, an expansion budget, a node budget
+and a cooperative cancellation token. A search checks its Budget before every
+expansion; when a limit is hit it stops and reports the reason and the best node
+found so far instead of running until memory is exhausted.
+"""
+import threading
+from time import monotonic
+
+CANCELLED = "cancelled"
+DEADLINE = "deadline"
+EXPANSIONS = "expansions"
+NODES = "nodes"
+
+
+class CancelToken:
+    """
+    Cooperative cancellation: another thread (or a signal handler) calls `cancel`,
+    the search notices it at its next budget check. One token may stop several searches.
+    """
+
+    def __init__(self, cancelled=False):
+        self._event = threading.Event()
+        if cancelled:
+            self._event.set()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def __reduce__(self):
+        ## a copy in another process keeps the state but cannot be cancelled from here
+        return CancelToken, (self.cancelled,)
+
+
+class Budget:
+    """
+    Limits of one search run. Iterative deepening counts all iterations together.
+
+    Attributes:
+        deadline (float or None): Seconds the run may take.
+        max_expansions (int or None): Maximum number of expanded nodes.
+        max_nodes (int or None): Maximum number of search nodes held at once: the nodes
+            generated by the current iteration, for SMA* the nodes in memory.
+        token (CancelToken or None): Stops the run when cancelled.
+    """
+
+    def __init__(self, deadline=None, max_expansions=None, max_nodes=None, token=None):
+        self.deadline = deadline
+        self.max_expansions = max_expansions
+        self.max_nodes = max_nodes
+        self.token = token
+
+    def exceeded(self, started, expanded, nodes):
+        """
+        Returns the reason to stop, None while the run is within its limits.
+
+        Args:
+            started (float): `time.monotonic()` at the start of the run.
+            expanded (int): Nodes expanded so far.
+            nodes (int): Search nodes held.
+
+        Returns:
+            str or None: "cancelled", "deadline", "expansions" or "nodes".
+        """
+        if self.token is not None and self.token.cancelled:
+            return CANCELLED
+        if self.deadline is not None and monotonic() - started >= self.deadline:
+            return DEADLINE
+        if self.max_expansions is not None and expanded >= self.max_expansions:
+            return EXPANSIONS
+        if self.max_nodes is not None and nodes >= self.max_nodes:
+            return NODES
+        return None
@@ -0,0 +1,214 @@
+"""
+Compact graph representation for large graphs: nodes are numbered 0..n-1 and the
+successors of node i are targets[offsets[i]:offsets[i+1]] with the step costs in
+weights[offsets[i]:offsets[i+1]] (compressed sparse rows).
+"""
+import numpy as np
+import networkx as nx
+
+
+class CSRGraph:
+    """
+    Graph in compressed sparse row form. The structure is fixed, step costs can be changed with `set_stepcost`.
+
+    Attributes:
+        names (sequence): Node names, names[i] is the name of node i.
+        offsets (np.ndarray): n+1 row offsets into targets and weights.
+        targets (np.ndarray): Successor node indices.
+        weights (np.ndarray): Step cost of each edge in targets.
+        heuristics (np.ndarray or None): Heuristic value per node.
+        coords (np.ndarray or None): (n, 2) coordinates per node.
+        directed (bool): Whether edges were stored in one direction only.
+        version (int): Increased by every change of the graph, caches compare it to detect outdated results.
+        shared_name (str or None): Shared memory block the arrays live in, see SharedGraph.
+    """
+
+    def __init__(self, names, offsets, targets, weights, heuristics=None, coords=None, directed=False):
+        self.names = names
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.heuristics = heuristics
+        self.coords = coords
+        self.directed = directed
+        self.version = 0
+        self.shared_name = None
+        self._index = None
+        self._components = None  ##(graph version, labels, sizes), see `components`
+
+    def __reduce__(self):
+        if self.shared_name is not None:
+            ## graphs in shared memory travel to other processes as the block name only
+            from algorithms.utils.SharedGraph import attach_graph
+            return attach_graph, (self.shared_name,)
+        return super().__reduce__()
+
+    @classmethod
+    def from_arrays(cls, names, sources, targets, weights, heuristics=None, coords=None, directed=False):
+        """
+        Builds the CSR arrays from parallel edge arrays.
+
+        Args:
+            names (sequence): Node names, indexed by node number.
+            sources (np.ndarray): Start node index of every edge.
+            targets (np.ndarray): End node index of every edge.
+            weights (np.ndarray): Step cost of every edge.
+            heuristics (np.ndarray, optional): Heuristic value per node.
+            coords (np.ndarray, optional): (n, 2) coordinates per node.
+            directed (bool, optional): If False every edge is stored in both directions (default: False).
+        """
+        sources = np.asarray(sources, dtype=np.int32)
+        targets = np.asarray(targets, dtype=np.int32)
+        weights = np.asarray(weights, dtype=np.float64)
+        if not directed:
+            loops = sources == targets  ##self loops are stored once
+            sources, targets = (np.concatenate([sources, targets[~loops]]),
+                                np.concatenate([targets, sources[~loops]]))
+            weights = np.concatenate([weights, weights[~loops]])
+        order = np.argsort(sources, kind="stable")
+        counts = np.bincount(sources, minlength=len(names))
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(names, offsets, targets[order], weights[order], heuristics, coords, directed)
+
+    @classmethod
+    def from_edges(cls, nodes, edges, directed=False):
+        """
+        Builds a CSRGraph from the `nodes`/`edges` literals used by the search classes.
+
+        Args:
+            nodes (dict or list): Node names, optionally mapped to their heuristic.
+            edges (iterable): (node1, node2, stepcost) tuples.
+            directed (bool, optional): Store edges in one direction only (default: False).
+        """
+        names = list(nodes)
+        index = {name: i for i, name in enumerate(names)}
+        sources, targets, weights = [], [], []
+        for node1, node2, stepcost in edges:
+            for node in (node1, node2):
+                if node not in index:
+                    index[node] = len(names)
+                    names.append(node)
+            sources.append(index[node1])
+            targets.append(index[node2])
+            weights.append(stepcost)
+        heuristics = None
+        if isinstance(nodes, dict):
+            heuristics = np.array([nodes.get(name, 0) for name in names], dtype=np.float64)
+        graph = cls.from_arrays(names, sources, targets, weights, heuristics, directed=directed)
+        graph._index = index
+        return graph
+
+    def number_of_nodes(self):
+        return len(self.offsets) - 1
+
+    def number_of_edges(self):
+        """Number of stored (directed) adjacency entries."""
+        return len(self.targets)
+
+    def index(self, name):
+        """Returns the node number of a node name."""
+        if self._index is None:
+            position = getattr(self.names, "position", None)
+            if position is not None:  ##memory-mapped name tables look names up without a dictionary
+                return position(name)
+            self._index = {name: i for i, name in enumerate(self.names)}
+        return self._index[name]
+
+    def edge_position(self, source, target):
+        """Returns the position of the edge source -> target (node numbers) in targets/weights."""
+        start = self.offsets[source]
+        positions = np.flatnonzero(self.targets[start:self.offsets[source + 1]] == target)
+        if not len(positions):
+            raise KeyError((self.names[source], self.names[target]))
+        return int(start + positions[0])
+
+    def set_stepcost(self, node1, node2, stepcost):
+        """
+        Changes the step cost of an edge (both directions of an undirected edge) in place.
+        Graphs opened with `open_graph` are read-only.
+
+        Args:
+            node1 (str): Name of the start node.
+            node2 (str): Name of the end node.
+            stepcost (float): The new step cost, inf blocks the edge.
+        """
+        source, target = self.index(node1), self.index(node2)
+        self.weights[self.edge_position(source, target)] = stepcost
+        if not self.directed:
+            self.weights[self.edge_position(target, source)] = stepcost
+        self.changed()
+
+    def changed(self):
+        """Marks the graph as changed, call it after modifying the arrays directly."""
+        self.version += 1
+
+    def components(self):
+        """
+        Connected components without the blocked (infinite cost) edges, for directed graphs
+        those of the undirected graph: nodes in different components cannot reach each other.
+        Computed once per graph version.
+
+        Returns:
+            tuple: (labels, sizes) arrays; labels[i] is the component of node i, sizes[c] the
+            number of nodes of component c.
+        """
+        if self._components is None or self._components[0] != self.version:
+            n = self.number_of_nodes()
+            open_edges = np.isfinite(self.weights)
+            sources = np.repeat(np.arange(n), np.diff(self.offsets))[open_edges]
+            targets = np.asarray(self.targets)[open_edges]
+            labels = np.arange(n)  ##root of every node, kept fully compressed
+            while True:
+                ## hook the root of every edge end to the lower root of the other end
+                roots1, roots2 = labels[sources], labels[targets]
+                apart = roots1 != roots2
+                if not apart.any():
+                    break
+                np.minimum.at(labels, np.maximum(roots1, roots2)[apart], np.minimum(roots1, roots2)[apart])
+                jumped = labels[labels]
+                while not np.array_equal(jumped, labels):  ##pointer jumping, the trees become stars again
+                    labels, jumped = jumped, jumped[jumped]
+            labels = np.unique(labels, return_inverse=True)[1]
+            self._components = (self.version, labels, np.bincount(labels))
+        return self._components[1:]
+
+    def reverse(self):
+        """Returns the graph with every edge reversed (the graph itself if it is undirected)."""
+        if not self.directed:
+            return self
+        sources = np.repeat(np.arange(self.number_of_nodes(), dtype=np.int32), np.diff(self.offsets))
+        graph = CSRGraph.from_arrays(self.names, self.targets, sources, self.weights,
+                                     self.heuristics, self.coords, directed=True)
+        graph._index = self._index
+        return graph
+
+    def successors(self, node):
+        """Returns (targets, weights) arrays of the successors of node number `node`."""
+        start, end = self.offsets[node], self.offsets[node + 1]
+        return self.targets[start:end], self.weights[start:end]
+
+    def node_dict(self):
+        """Returns {name: heuristic} as expected by the `nodes` argument of the search classes."""
+        heuristics = self.heuristics if self.heuristics is not None else np.zeros(self.number_of_nodes())
+        return dict(zip(self.names, heuristics.tolist()))
+
+    def edge_tuples(self):
+        """Yields (node1, node2, stepcost) as expected by the `edges` argument of the search classes."""
+        names = self.names
+        sources = np.repeat(np.arange(self.number_of_nodes()), np.diff(self.offsets))
+        for source, target, weight in zip(sources.tolist(), self.targets.tolist(), self.weights.tolist()):
+            if self.directed or source <= target:  ##undirected edges are stored twice, yield them once
+                yield names[source], names[target], weight
+
+    def to_networkx(self):
+        """Returns the graph as nx.Graph/nx.DiGraph with the attributes used by the search classes."""
+        graph = nx.DiGraph() if self.directed else nx.Graph()
+        graph.add_nodes_from((name, {"heuristic": h}) for name, h in self.node_dict().items())
+        graph.add_edges_from((node1, node2, {"stepcost": stepcost, "color": "gray"})
+                             for node1, node2, stepcost in self.edge_tuples())
+        return graph
+
+    def __repr__(self):
+        return (f"CSRGraph(nodes={self.number_of_nodes()}, edges={self.number_of_edges()}, "
+                f"directed={self.directed})")
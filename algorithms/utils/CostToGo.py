@@ -0,0 +1,89 @@
+"""
+Exact cost-to-go maps for fixed goals. A uniform cost search from the goal over the
+reversed edges yields, for every node, the cost of its cheapest path to the goal and
+the next node on that path. Any number of start nodes can then be routed to the goal
+without a search of their own.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from algorithms.utils.ShortestPaths import shortest_path_tree
+
+
+class CostToGo:
+    """
+    Cache of cost-to-go maps of a CSRGraph, one per goal. A map is computed by the
+    first query for its goal and reused until the graph version changes.
+
+    Attributes:
+        graph (CSRGraph): The graph the maps are computed on.
+        max_goals (int or None): Number of maps kept, the least recently used one is dropped first;
+            0 computes the map of every query without keeping it.
+        _maps (OrderedDict): Goal name -> (graph version, cost array, next node array).
+    """
+
+    def __init__(self, graph, max_goals=None):
+        """
+        Args:
+            graph (CSRGraph): The graph, step costs must not be negative.
+            max_goals (int, optional): Maximum number of cached goals, 0 for none (default: no limit).
+        """
+        if max_goals is not None and max_goals < 0:
+            raise ValueError(f"max_goals must be 0 or more, got {max_goals}")
+        self.graph = graph
+        self.max_goals = max_goals
+        self._maps = OrderedDict()
+        self._reverse = None  ##(graph version, reversed graph) of directed graphs
+
+    def _reversed_graph(self):
+        if self._reverse is None or self._reverse[0] != self.graph.version:
+            self._reverse = (self.graph.version, self.graph.reverse())
+        return self._reverse[1]
+
+    def _map(self, goal):
+        cached = self._maps.get(goal)
+        if cached is None or cached[0] != self.graph.version:
+            ## predecessors of the search from the goal are the next hops towards it
+            cost, next_node = shortest_path_tree(self._reversed_graph(), goal)
+            cached = (self.graph.version, cost, next_node)
+            if self.max_goals == 0:
+                return cached
+            self._maps[goal] = cached
+            if self.max_goals is not None and len(self._maps) > self.max_goals:
+                self._maps.popitem(last=False)
+        self._maps.move_to_end(goal)
+        return cached
+
+    def costs(self, goal):
+        """Returns the array node number -> cost of the cheapest path to `goal` (inf if unreachable)."""
+        return self._map(goal)[1]
+
+    def cost(self, start, goal):
+        """Returns the cost of the cheapest path from `start` to `goal` (inf if unreachable)."""
+        return float(self._map(goal)[1][self.graph.index(start)])
+
+    def path(self, start, goal):
+        """
+        Returns the cheapest path from `start` to `goal` by following the next hops of the
+        goal's map, in O(path length).
+
+        Returns:
+            list: Node names from `start` to `goal`, empty if the goal is unreachable.
+        """
+        _, cost, next_node = self._map(goal)
+        node = self.graph.index(start)
+        if np.isinf(cost[node]):
+            return []
+        path = [node]
+        while next_node[node] >= 0:
+            node = int(next_node[node])
+            path.append(node)
+        return [self.graph.names[node] for node in path]
+
+    def invalidate(self, goal=None):
+        """Drops the map of one goal, or of all goals."""
+        if goal is None:
+            self._maps.clear()
+        else:
+            self._maps.pop(goal, None)
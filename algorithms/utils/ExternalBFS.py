@@ -0,0 +1,226 @@
+"""
+External-memory breadth first search (Munagala and Ranade). Every BFS layer is a file
+of sorted, unique uint64 state keys. The next layer is generated chunk by chunk into
+sorted runs, the runs are merged and the keys of the current and the previous layer are
+subtracted by streaming over the memory-mapped layer files. Every read of a run or
+layer file holds at most a chunk of keys and at most `fan_in` runs are merged at once
+(more runs are merged in several passes), so RAM use is bounded by the chunk size,
+not by the number of reached states.
+"""
+import os
+import shutil
+import tempfile
+from time import monotonic
+
+import numpy as np
+
+KEY = np.uint64
+FAN_IN = 64  ##run files merged at once
+
+
+def csr_expander(graph):
+    """
+    Returns a vectorised expand function for a CSRGraph: node numbers -> successor
+    node numbers. Edges with an infinite step cost are blocked.
+    """
+    finite = np.isfinite(graph.weights).all()
+
+    def expand(keys):
+        nodes = keys.astype(np.int64)
+        starts, ends = graph.offsets[nodes], graph.offsets[nodes + 1]
+        counts = ends - starts
+        positions = np.arange(counts.sum()) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        if not finite:
+            positions = positions[np.isfinite(graph.weights[positions])]
+        return graph.targets[positions].astype(KEY)
+    return expand
+
+
+def problem_expander(problem):
+    """
+    Returns an expand function for a Problem whose `key` maps states to integers
+    below 2**64 and whose `from_key` maps them back.
+    """
+    def expand(keys):
+        key, from_key, successors = problem.key, problem.from_key, problem.successors
+        return np.array([key(child) for state_key in keys.tolist()
+                         for child, _ in successors(from_key(state_key))], dtype=KEY)
+    return expand
+
+
+class _SortedFile:
+    """Memory-mapped layer or run file read front to back."""
+
+    def __init__(self, path):
+        size = os.path.getsize(path) // KEY().itemsize
+        self.keys = np.memmap(path, dtype=KEY, mode="r", shape=(size,)) if size else np.empty(0, dtype=KEY)
+        self.position = 0
+
+    def __len__(self):
+        return len(self.keys) - self.position
+
+    def peek(self, count):
+        """Returns the last key of the next `count` keys."""
+        return self.keys[min(self.position + count, len(self.keys)) - 1]
+
+    def take_upto(self, key, limit=None):
+        """Returns and consumes the keys <= `key`, at most `limit` of them."""
+        end = self.position + int(np.searchsorted(self.keys[self.position:], key, side="right"))
+        if limit is not None:
+            end = min(end, self.position + limit)
+        keys = np.asarray(self.keys[self.position:end])
+        self.position = end
+        return keys
+
+
+def _merge(paths, chunk_size):
+    """Yields sorted unique chunks of at most `chunk_size` keys of the union of sorted files."""
+    files = [_SortedFile(path) for path in paths]
+    piece = max(chunk_size // max(len(files), 1), 1)  ##keys read per file, together at most chunk_size
+    while True:
+        files = [file for file in files if len(file)]
+        if not files:
+            return
+        ## the bound lies within the next piece of every file, so no file contributes more
+        bound = min(file.peek(piece) for file in files)
+        yield np.unique(np.concatenate([file.take_upto(bound) for file in files]))
+
+
+class ExternalBFS:
+    """
+    Breadth first search over layer files in a work directory.
+
+    Attributes:
+        directory (str): Directory of the layer files.
+        sizes (list): Number of states per layer, sizes[d] states at depth d.
+        goal_depth (int or None): Depth of the goal, if a goal was given and found.
+        stopped (str or None): Why the budget ended the last run; the layers written until then stay valid.
+    """
+
+    def __init__(self, expand, directory=None, chunk_size=1 << 20, directed=False, fan_in=FAN_IN):
+        """
+        Args:
+            expand (callable): Function uint64 key array -> uint64 successor key array,
+                see `csr_expander` and `problem_expander`.
+            directory (str, optional): Work directory (default: a new temporary directory).
+            chunk_size (int, optional): Keys expanded and merged at once, bounds the RAM use (default: 2**20).
+            directed (bool, optional): Successors may lie in any earlier layer, not only the
+                two previous ones, so all layers are subtracted (default: False).
+            fan_in (int, optional): Run files merged at once, more are merged in several passes (default: 64).
+        """
+        if fan_in < 2:
+            raise ValueError(f"fan_in must be at least 2, got {fan_in}")
+        self._expand = expand
+        self.directory = directory or tempfile.mkdtemp(prefix="external_bfs-")
+        os.makedirs(self.directory, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.directed = directed
+        self.fan_in = fan_in
+        self.sizes = []
+        self.goal_depth = None
+        self.stopped = None
+
+    def layer_path(self, depth):
+        return os.path.join(self.directory, f"layer-{depth:06d}.u64")
+
+    def layer(self, depth):
+        """Returns the sorted keys of a layer as read-only memory map."""
+        return _SortedFile(self.layer_path(depth)).keys
+
+    def depth(self, key):
+        """Returns the BFS depth of a state key, None if it was not reached."""
+        for depth in range(len(self.sizes)):
+            keys = self.layer(depth)
+            position = int(np.searchsorted(keys, key))
+            if position < len(keys) and keys[position] == key:
+                return depth
+        return None
+
+    def run(self, start, goal=None, max_depth=None, budget=None):
+        """
+        Generates the layers from a start key until no new states are found, the goal
+        key is reached or `max_depth` layers were generated after the start.
+
+        Args:
+            budget (Budget, optional): Run limits, checked per expanded chunk; the expansions
+                are the expanded keys, the nodes the keys in the layer files (default: no limits).
+
+        Returns:
+            list: The layer sizes.
+        """
+        np.array([start], dtype=KEY).tofile(self.layer_path(0))
+        self.sizes = [1]
+        self.goal_depth = 0 if goal == start else None
+        self.stopped = None
+        started = monotonic()
+        while self.sizes[-1] and self.goal_depth is None and (max_depth is None or len(self.sizes) <= max_depth):
+            depth = len(self.sizes)
+            runs = self._write_runs(depth - 1, budget, started)
+            if self.stopped is not None:
+                for run in runs:
+                    os.remove(run)  ##the layer is incomplete, the earlier ones are the result
+                break
+            runs = self._merge_passes(depth, runs)
+            known = range(depth) if self.directed else range(max(depth - 2, 0), depth)
+            self.sizes.append(self._write_layer(depth, runs, [self.layer_path(d) for d in known], goal))
+            for run in runs:
+                os.remove(run)
+        return self.sizes
+
+    def _write_runs(self, depth, budget=None, started=None):
+        ## expand the layer chunk by chunk, every chunk becomes one sorted run file
+        runs = []
+        keys = self.layer(depth)
+        expanded = sum(self.sizes[:depth])
+        for begin in range(0, len(keys), self.chunk_size):
+            if budget is not None:
+                self.stopped = budget.exceeded(started, expanded + begin, sum(self.sizes))
+                if self.stopped is not None:
+                    return runs
+            children = np.unique(self._expand(np.asarray(keys[begin:begin + self.chunk_size])))
+            path = os.path.join(self.directory, f"run-{depth:06d}-{len(runs):06d}.u64")
+            children.tofile(path)
+            runs.append(path)
+        return runs
+
+    def _merge_passes(self, depth, runs):
+        ## merge groups of runs into longer runs until the last merge reads at most fan_in files
+        passes = 0
+        while len(runs) > self.fan_in:
+            merged = []
+            for begin in range(0, len(runs), self.fan_in):
+                group = runs[begin:begin + self.fan_in]
+                path = os.path.join(self.directory, f"run-{depth:06d}-p{passes}-{len(merged):06d}.u64")
+                with open(path, "wb") as handle:
+                    for chunk in _merge(group, self.chunk_size):
+                        handle.write(chunk.tobytes())
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+            passes += 1
+        return runs
+
+    def _write_layer(self, depth, runs, known_paths, goal):
+        known = [_SortedFile(path) for path in known_paths]
+        size = 0
+        tmp = self.layer_path(depth) + ".tmp"
+        with open(tmp, "wb") as handle:
+            for chunk in _merge(runs, self.chunk_size):
+                bound = chunk[-1]
+                for file in known:
+                    ## the known keys up to the bound, read in pieces of at most a chunk
+                    keys = file.take_upto(bound, self.chunk_size)
+                    while len(keys):
+                        chunk = chunk[~np.isin(chunk, keys, assume_unique=True)]
+                        keys = file.take_upto(bound, self.chunk_size)
+                if goal is not None and self.goal_depth is None and np.isin(KEY(goal), chunk):
+                    self.goal_depth = depth
+                handle.write(chunk.tobytes())
+                size += len(chunk)
+        os.replace(tmp, self.layer_path(depth))
+        return size
+
+    def remove(self):
+        """Deletes the work directory with all layer files."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,97 @@
+"""
+Frontier policies of the search engine. Every frontier stores search nodes and offers
+push, pop, len and iteration (in storage order, for the frontier captions).
+"""
+import heapq
+from collections import deque
+
+
+class FIFOFrontier:
+    """First in, first out: breadth first order."""
+
+    def __init__(self):
+        self._nodes = deque()
+
+    def push(self, node):
+        self._nodes.append(node)
+
+    def pop(self):
+        return self._nodes.popleft()
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+
+class LIFOFrontier(FIFOFrontier):
+    """Last in, first out: depth first order."""
+
+    def pop(self):
+        return self._nodes.pop()
+
+
+class PriorityFrontier:
+    """
+    Binary heap ordered by a priority function. Nodes with equal priority leave the
+    frontier in the order they were pushed.
+
+    Attributes:
+        _key (callable): Function search node -> priority, lower is expanded first.
+        _counter (int): Push counter, breaks ties between equal priorities.
+    """
+
+    def __init__(self, key):
+        self._key = key
+        self._heap = []
+        self._counter = 0
+
+    def push(self, node):
+        heapq.heappush(self._heap, (self._key(node), self._counter, node))
+        self._counter += 1
+
+    def pop(self):
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        return (node for _, _, node in self._heap)
+
+
+def _h(node):
+    return node.heuristic  ##greedy best first
+
+
+def _g(node):
+    return node.sum_path_cost  ##uniform cost
+
+
+def _g_h(node):
+    return node.sum_path_cost + node.heuristic  ##A*
+
+
+def _sum_h(node):
+    return node.sum_heuristic  ##summed heuristic along the path, as ranked by AStar/AStarTree
+
+
+## module level functions instead of lambdas, searches are pickled for the parallel export
+PRIORITIES = {"h": _h, "g": _g, "g+h": _g_h, "sum_h": _sum_h}
+
+
+def make_frontier(policy):
+    """
+    Creates an empty frontier.
+
+    Args:
+        policy (str): "fifo", "lifo" or one of the priorities "h", "g", "g+h", "sum_h".
+    """
+    if policy == "fifo":
+        return FIFOFrontier()
+    if policy == "lifo":
+        return LIFOFrontier()
+    if policy in PRIORITIES:
+        return PriorityFrontier(PRIORITIES[policy])
+    raise ValueError(f"unknown frontier policy {policy!r}")
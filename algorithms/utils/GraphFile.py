@@ -0,0 +1,187 @@
+"""
+Binary on-disk format for CSRGraph that is opened with a memory map instead of being parsed.
+
+Layout (little endian, every section starts at a multiple of 8 bytes):
+    header        64 bytes: magic, version, flags, node count, edge count, name bytes
+    name_offsets  int64[n + 1]    byte offsets of each name in the name blob
+    name_blob     utf-8 bytes     all node names back to back
+    name_order    int32[n]        node numbers sorted by name, for binary search lookups
+    offsets       int64[n + 1]    CSR row offsets
+    targets       int32[m]        CSR successor node numbers
+    weights       float64[m]      CSR step costs
+    heuristics    float64[n]      only if flag HAS_HEURISTICS
+    coords        float64[n, 2]   only if flag HAS_COORDS
+
+Opening a file only maps it and creates array views, nothing is read until it is used.
+Processes that open the same file share its pages through the OS page cache.
+"""
+import os
+import struct
+
+import numpy as np
+
+from algorithms.utils.CSRGraph import CSRGraph
+
+MAGIC = b"AIMLCSR\0"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQQ")  ##magic, version, flags, nodes, edges, name bytes
+HEADER_SIZE = 64
+DIRECTED, HAS_HEURISTICS, HAS_COORDS = 1, 2, 4
+
+
+def _padded(size):
+    return -(-size // 8) * 8
+
+
+def _sections(flags, nodes, edges, name_bytes):
+    """Returns {section: (offset, dtype, shape)} for a file with the given header values."""
+    layout = [("name_offsets", np.int64, (nodes + 1,)),
+              ("name_blob", np.uint8, (name_bytes,)),
+              ("name_order", np.int32, (nodes,)),
+              ("offsets", np.int64, (nodes + 1,)),
+              ("targets", np.int32, (edges,)),
+              ("weights", np.float64, (edges,))]
+    if flags & HAS_HEURISTICS:
+        layout.append(("heuristics", np.float64, (nodes,)))
+    if flags & HAS_COORDS:
+        layout.append(("coords", np.float64, (nodes, 2)))
+    sections = {}
+    position = HEADER_SIZE
+    for name, dtype, shape in layout:
+        sections[name] = (position, dtype, shape)
+        position += _padded(int(np.prod(shape)) * np.dtype(dtype).itemsize)
+    return sections
+
+
+class MappedNames:
+    """
+    Read-only sequence of node names decoded on access from a memory-mapped name table.
+    Lookups by name binary search the sorted name order, so no dictionary has to be built.
+    """
+
+    def __init__(self, offsets, blob, order):
+        self._offsets = offsets
+        self._blob = blob
+        self._order = order
+
+    def _bytes(self, node):
+        return self._blob[self._offsets[node]:self._offsets[node + 1]].tobytes()
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, node):
+        if isinstance(node, slice):
+            return [self[i] for i in range(*node.indices(len(self)))]
+        if node < 0:
+            node += len(self)
+        return self._bytes(node).decode("utf-8")
+
+    def __iter__(self):
+        return (self[node] for node in range(len(self)))
+
+    def position(self, name):
+        """Returns the node number of a name, raises KeyError if it does not exist."""
+        key = name.encode("utf-8")
+        low, high = 0, len(self._order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._bytes(self._order[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._order) and self._bytes(self._order[low]) == key:
+            return int(self._order[low])
+        raise KeyError(name)
+
+
+def _encode(graph):
+    """Returns (header bytes, sections, arrays, total size) of a CSRGraph in the file layout."""
+    encoded = [str(name).encode("utf-8") for name in graph.names]
+    name_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(name) for name in encoded], out=name_offsets[1:])
+    name_order = np.array(sorted(range(len(encoded)), key=encoded.__getitem__), dtype=np.int32)
+    flags = (DIRECTED if graph.directed else 0) \
+        | (HAS_HEURISTICS if graph.heuristics is not None else 0) \
+        | (HAS_COORDS if graph.coords is not None else 0)
+    nodes, edges = graph.number_of_nodes(), graph.number_of_edges()
+    sections = _sections(flags, nodes, edges, int(name_offsets[-1]))
+    data = {"name_offsets": name_offsets,
+            "name_blob": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            "name_order": name_order,
+            "offsets": graph.offsets, "targets": graph.targets, "weights": graph.weights,
+            "heuristics": graph.heuristics, "coords": graph.coords}
+    header = HEADER.pack(MAGIC, VERSION, flags, nodes, edges, int(name_offsets[-1])).ljust(HEADER_SIZE, b"\0")
+    offset, dtype, shape = list(sections.values())[-1]
+    size = _padded(offset + int(np.prod(shape)) * np.dtype(dtype).itemsize)
+    return header, sections, data, size
+
+
+def graph_size(graph):
+    """Number of bytes of a CSRGraph in the binary format."""
+    return _encode(graph)[3]
+
+
+def write_graph(graph, path):
+    """
+    Writes a CSRGraph to the binary format. The file is replaced atomically.
+
+    Args:
+        graph (CSRGraph): The graph to store.
+        path (str): Output file.
+    """
+    header, sections, data, size = _encode(graph)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as handle:
+        handle.write(header)
+        for name, (offset, dtype, shape) in sections.items():
+            handle.seek(offset)
+            handle.write(np.ascontiguousarray(data[name], dtype=dtype).tobytes())
+        handle.truncate(size)
+    os.replace(tmp, path)
+
+
+def write_graph_buffer(graph, buffer):
+    """
+    Writes a CSRGraph in the binary format into a writable buffer of at least
+    `graph_size(graph)` bytes, e.g. a shared memory block.
+    """
+    header, sections, data, size = _encode(graph)
+    target = np.ndarray((size,), dtype=np.uint8, buffer=buffer)
+    target[:HEADER_SIZE] = np.frombuffer(header, dtype=np.uint8)
+    for name, (offset, dtype, shape) in sections.items():
+        np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)[...] = data[name]
+
+
+def graph_from_buffer(buffer, source="buffer"):
+    """
+    Creates a CSRGraph whose arrays are views into a buffer holding the binary format.
+
+    Args:
+        buffer: Object supporting the buffer protocol (memory map, shared memory block).
+        source (str, optional): Name used in error messages.
+
+    Returns:
+        CSRGraph: Graph sharing the memory of the buffer, nothing is copied.
+    """
+    magic, version, flags, nodes, edges, name_bytes = HEADER.unpack(bytes(memoryview(buffer)[:HEADER.size]))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{source} is not a version {VERSION} graph file")
+    arrays = {name: np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+              for name, (offset, dtype, shape) in _sections(flags, nodes, edges, name_bytes).items()}
+    names = MappedNames(arrays["name_offsets"], arrays["name_blob"], arrays["name_order"])
+    return CSRGraph(names, arrays["offsets"], arrays["targets"], arrays["weights"],
+                    arrays.get("heuristics"), arrays.get("coords"), bool(flags & DIRECTED))
+
+
+def open_graph(path):
+    """
+    Opens a graph file written by `write_graph` without reading or parsing it.
+
+    Args:
+        path (str): The graph file.
+
+    Returns:
+        CSRGraph: Graph whose arrays are read-only views into the memory map.
+    """
+    return graph_from_buffer(np.memmap(path, dtype=np.uint8, mode="r"), path)
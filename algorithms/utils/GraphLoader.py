@@ -0,0 +1,254 @@
+"""
+Streaming loaders for edge-list, CSV and TSV graph files.
+
+Files are read in chunks of lines and parsed column-wise: with pandas installed by
+its C parser, otherwise by one vectorised split per chunk. Node names are interned
+per chunk by factorising the name columns, so only names not seen before touch
+Python code, and step costs are parsed straight into numpy arrays.
+Only the compact edge arrays are kept, so peak memory stays bounded by the size of
+the result plus one chunk.
+"""
+import os
+import sys
+from itertools import islice
+
+import numpy as np
+
+from algorithms.utils.CSRGraph import CSRGraph
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None  ##the numpy parser below is used instead
+
+CHUNK_LINES = 1_000_000
+## header names of the edge file columns, lower case
+EDGE_COLUMNS = {"source": "source", "from": "source", "node1": "source", "u": "source",
+                "target": "target", "to": "target", "node2": "target", "v": "target",
+                "stepcost": "stepcost", "cost": "stepcost", "weight": "stepcost"}
+
+
+def _delimiter_for(path, delimiter):
+    if delimiter is not None:
+        return delimiter
+    extension = os.path.splitext(path)[1].lower()
+    return {".csv": ",", ".tsv": "\t"}.get(extension)  ##None splits on any whitespace
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _sniff(path, delimiter, header):
+    """
+    Returns (column names or None, number of columns, number of the line holding them)
+    from the first line of a file that is neither blank nor a comment.
+    """
+    with open(path, encoding="utf-8") as handle:
+        for number, line in enumerate(handle):
+            if line.strip() and not line.startswith("#"):
+                fields = [field.strip() for field in line.split(delimiter)]
+                if header is True or (header == "auto" and not _is_number(fields[-1])):
+                    return [field.lower() for field in fields], len(fields), number
+                return None, len(fields), number
+    return None, 0, 0
+
+
+def _edge_columns(path, names, width):
+    """
+    Returns the column numbers of (source, target, stepcost or None) of an edge file:
+    by name if it has a header, otherwise the first three columns.
+
+    Raises:
+        ValueError: The header has an unknown or repeated column, or no source or target column.
+    """
+    if names is None:
+        return 0, 1, 2 if width > 2 else None
+    roles = {}
+    for number, name in enumerate(names):
+        role = EDGE_COLUMNS.get(name)
+        if role is None:
+            raise ValueError(f"{path}: unknown column {name!r}, expected one of {sorted(EDGE_COLUMNS)}")
+        if role in roles:
+            raise ValueError(f"{path}: more than one {role} column")
+        roles[role] = number
+    for role in ("source", "target"):
+        if role not in roles:
+            raise ValueError(f"{path}: no {role} column in the header")
+    return roles["source"], roles["target"], roles.get("stepcost")
+
+
+def _read_chunks(path, delimiter, header, chunk_lines, text_columns):
+    """
+    Yields (column names, columns) for every chunk of a file. columns is a list of 1D
+    arrays; the ones numbered in `text_columns` hold strings, the others floats.
+    """
+    names, width, first = _sniff(path, delimiter, header)
+    if not width:
+        return
+    if pd is not None:
+        ## skiprows counts raw lines: the comment and blank lines before the header and the header itself
+        reader = pd.read_csv(path, sep=delimiter or r"\s+", header=None, skiprows=first + 1 if names else 0,
+                             comment="#", skip_blank_lines=True, chunksize=chunk_lines,
+                             dtype={column: str for column in text_columns})
+        for frame in reader:
+            yield names, [frame[column].to_numpy(dtype=object if column in text_columns else np.float64)
+                          for column in range(width)]
+        return
+    with open(path, encoding="utf-8") as handle:
+        skip_header = names is not None
+        while True:
+            raw = list(islice(handle, chunk_lines))
+            if not raw:
+                break
+            block = "".join(raw)
+            if "#" in block or "\n\n" in block or block.startswith("\n"):
+                block = "".join(line for line in raw if line.strip() and not line.startswith("#"))
+            if skip_header:
+                block = block[block.index("\n") + 1:] if "\n" in block else ""
+                skip_header = False
+            if delimiter is None:
+                values = block.split()
+            else:
+                if block and not block.endswith("\n"):
+                    block += "\n"
+                values = block.replace("\r", "").replace("\n", delimiter).split(delimiter)[:-1]
+            if len(values) % width:
+                raise ValueError(f"{path}: every line needs {width} columns")
+            table = np.array(values).reshape(-1, width)
+            if delimiter is not None:
+                table = np.char.strip(table)
+            yield names, [table[:, column] if column in text_columns else table[:, column].astype(np.float64)
+                          for column in range(width)]
+
+
+class NameTable:
+    """
+    Interns node names and numbers them in order of first appearance.
+
+    Attributes:
+        names (list): Interned node names, names[i] is the name of node i.
+    """
+
+    def __init__(self):
+        self.names = []
+        self._index = {}  ##name -> number, used without pandas
+        self._known = pd.Index([], dtype=object) if pd is not None else None
+
+    def intern(self, column):
+        """Maps a column of node names to node numbers, adding unknown names to the table."""
+        if pd is None:
+            unique, inverse = np.unique(column, return_inverse=True)
+            ids = np.empty(len(unique), dtype=np.int32)
+            for i, name in enumerate(unique.tolist()):
+                number = self._index.get(name)
+                if number is None:
+                    number = self._index[name] = len(self.names)
+                    self.names.append(sys.intern(name))
+                ids[i] = number
+            return ids[inverse]
+        inverse, unique = pd.factorize(column)  ##hash based, no sorting of strings
+        ids = self._known.get_indexer(unique)  ##lookup of known names without a Python loop
+        new = ids < 0
+        if new.any():
+            fresh = unique[new]
+            ids[new] = np.arange(len(self.names), len(self.names) + len(fresh))
+            self.names.extend(sys.intern(name) for name in fresh.tolist())
+            self._known = self._known.append(pd.Index(fresh, dtype=object))
+        return ids.astype(np.int32)[inverse]
+
+
+def load_nodes(path, delimiter=None, header="auto", chunk_lines=CHUNK_LINES, table=None):
+    """
+    Loads a node file with one node per line: name and heuristic and/or x, y coordinates.
+    Without a header 2 columns are read as (name, heuristic), 3 as (name, x, y) and
+    4 as (name, heuristic, x, y); with a header the columns "heuristic"/"h", "x" and "y" are used.
+
+    Args:
+        path (str): The node file.
+        delimiter (str, optional): Column separator (default: by extension, whitespace for unknown ones).
+        header (bool or "auto", optional): Whether the first line holds column names (default: "auto").
+        chunk_lines (int, optional): Lines parsed per chunk.
+        table (NameTable, optional): Existing name table to extend, e.g. the one of an edge file.
+
+    Returns:
+        tuple: (names, heuristics, coords); heuristics/coords are dicts node number -> value.
+    """
+    delimiter = _delimiter_for(path, delimiter)
+    table = NameTable() if table is None else table
+    heuristics, coords = {}, {}
+    for columns, chunk in _read_chunks(path, delimiter, header, chunk_lines, text_columns=(0,)):
+        width = len(chunk)
+        if columns:
+            h_col = next((columns.index(c) for c in ("heuristic", "h") if c in columns), None)
+            x_col = columns.index("x") if "x" in columns else None
+            y_col = columns.index("y") if "y" in columns else None
+        else:
+            h_col = 1 if width in (2, 4) else None
+            x_col, y_col = {3: (1, 2), 4: (2, 3)}.get(width, (None, None))
+        ids = table.intern(chunk[0])
+        if h_col is not None:
+            heuristics.update(zip(ids.tolist(), chunk[h_col].tolist()))
+        if x_col is not None and y_col is not None:
+            coords.update(zip(ids.tolist(), zip(chunk[x_col].tolist(), chunk[y_col].tolist())))
+    return table.names, heuristics, coords
+
+
+def load_graph(path, nodes_path=None, delimiter=None, header="auto", directed=False,
+               chunk_lines=CHUNK_LINES, default_cost=1.0):
+    """
+    Streams an edge file (source, target[, stepcost]) into a CSRGraph. With a header the
+    columns are taken by name, in any order: "source"/"from"/"node1"/"u", "target"/"to"/"node2"/"v"
+    and optionally "stepcost"/"cost"/"weight".
+
+    Args:
+        path (str): Edge-list, .csv or .tsv file.
+        nodes_path (str, optional): Node file with heuristic and/or coordinate columns, see `load_nodes`.
+        delimiter (str, optional): Column separator of both files (default: by the extension of each file,
+            whitespace for unknown ones).
+        header (bool or "auto", optional): Whether the first line holds column names (default: "auto").
+        directed (bool, optional): Treat edges as one-directional (default: False).
+        chunk_lines (int, optional): Lines parsed per chunk (default: 1,000,000).
+        default_cost (float, optional): Step cost for files with only two columns (default: 1.0).
+
+    Returns:
+        CSRGraph: The loaded graph.
+
+    Raises:
+        ValueError: The header names an unknown column or lacks the source or target column.
+    """
+    table = NameTable()
+    sources, targets, weights = [], [], []
+    edge_delimiter = _delimiter_for(path, delimiter)
+    names, width, _ = _sniff(path, edge_delimiter, header)
+    source, target, cost = _edge_columns(path, names, width)
+    for _, chunk in _read_chunks(path, edge_delimiter, header, chunk_lines, text_columns=(source, target)):
+        count = len(chunk[source])
+        ids = table.intern(np.concatenate([chunk[source], chunk[target]]))
+        sources.append(ids[:count])
+        targets.append(ids[count:])
+        if cost is not None:
+            weights.append(chunk[cost])
+        else:
+            weights.append(np.full(count, default_cost))
+    heuristics = coords = None
+    if nodes_path:
+        ## a delimiter given by the caller applies to both files, otherwise each goes by its extension
+        _, h_values, xy_values = load_nodes(nodes_path, delimiter, header, chunk_lines, table)
+        if h_values:
+            heuristics = np.zeros(len(table.names))
+            heuristics[list(h_values)] = list(h_values.values())
+        if xy_values:
+            coords = np.zeros((len(table.names), 2))
+            coords[list(xy_values)] = list(xy_values.values())
+    empty = np.empty(0, dtype=np.int32)
+    return CSRGraph.from_arrays(
+        table.names,
+        np.concatenate(sources) if sources else empty,
+        np.concatenate(targets) if targets else empty,
+        np.concatenate(weights) if weights else np.empty(0),
+        heuristics, coords, directed)
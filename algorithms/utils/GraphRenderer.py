@@ -0,0 +1,99 @@
+"""
+Incremental renderer for the graph search animations.
+"""
+import networkx as nx
+
+
+def node_color(data):
+    """Maps the search attributes of a node to its fill colour."""
+    if data.get("start", False):
+        return "yellow"
+    if data.get("occupied", False):
+        return "green"
+    if data.get("explored", False):
+        return "lightgreen"
+    if data.get("frontier", False):
+        return "pink"
+    return "lightblue"
+
+
+class GraphRenderer:
+    """
+    Draws a search graph once and afterwards only updates what changes between frames:
+    node face colours, edge colours, node label texts and captions. The dynamic artists
+    are returned by `update`, so the animation can blit them instead of redrawing the axes.
+
+    Attributes:
+        _nodes (list): Node order of the node collection.
+        _edges (list): Edge order of the edge collection.
+        _node_label (callable): Returns the label text for (node, data).
+        _labels (dict): Node -> current label text, to skip unchanged labels.
+    """
+
+    def __init__(self, ax, graph, pos, node_label, captions=(), node_size=2000):
+        """
+        Creates all artists for the first state of the graph.
+
+        Args:
+            ax (matplotlib.axes.Axes): The axes to draw on.
+            graph (nx.Graph): Graph with the nodes and edges of every frame.
+            pos (dict): Node positions.
+            node_label (callable): Function (node, data) -> label text.
+            captions (iterable, optional): (x, y) positions of text boxes updated per frame.
+            node_size (int, optional): Size of the drawn nodes (default: 2000).
+        """
+        self._nodes = list(graph.nodes())
+        self._edges = list(graph.edges())
+        self._node_label = node_label
+        self._node_artist = nx.draw_networkx_nodes(
+            graph, pos, nodelist=self._nodes,
+            node_color=[node_color(graph.nodes[node]) for node in self._nodes],
+            node_size=node_size, edgecolors="black", ax=ax)
+        self._edge_artist = nx.draw_networkx_edges(
+            graph, pos, edgelist=self._edges, width=1.5,
+            edge_color=[graph.edges[edge]["color"] for edge in self._edges], ax=ax)
+        ## edge labels (step costs) never change, they are drawn once and left alone
+        nx.draw_networkx_edge_labels(
+            graph, pos, edge_labels={edge: f"{graph.edges[edge]['stepcost']}" for edge in self._edges},
+            font_size=10, font_color="black", ax=ax)
+        self._labels = {node: node_label(node, graph.nodes[node]) for node in self._nodes}
+        self._label_artists = nx.draw_networkx_labels(
+            graph, pos, labels=self._labels, font_size=12, font_color="black", ax=ax)
+        self._caption_artists = [
+            ax.text(x, y, "", horizontalalignment="center", fontsize=10,
+                    bbox=dict(facecolor="white", alpha=0.5))
+            for x, y in captions
+        ]
+        ax.set_axis_off()
+
+    def artists(self):
+        """Returns every artist that can change between frames."""
+        return [self._node_artist, self._edge_artist,
+                *self._label_artists.values(), *self._caption_artists]
+
+    def seek(self, index):
+        """Frames are drawn independently of their position, nothing to do."""
+
+    def update(self, frame, captions=()):
+        """
+        Updates the artists to show a frame.
+
+        Args:
+            frame (nx.Graph): Snapshot of the search graph.
+            captions (iterable, optional): Texts for the caption boxes, in order.
+
+        Returns:
+            list: The dynamic artists, to be redrawn by the animation.
+        """
+        nodes = frame.nodes
+        self._node_artist.set_facecolor([node_color(nodes[node]) for node in self._nodes])
+        adj = frame.adj
+        self._edge_artist.set_color([adj[u][v]["color"] for u, v in self._edges])
+        for node in self._nodes:
+            label = self._node_label(node, nodes[node])
+            if label != self._labels[node]:  ##only touch labels whose text changed
+                self._labels[node] = label
+                self._label_artists[node].set_text(label)
+        for artist, caption in zip(self._caption_artists, captions):
+            artist.set_text(caption)
+        return self.artists()  ##blitting redraws exactly the returned artists, so return all of them
@@ -0,0 +1,280 @@
+"""
+Base class of the graph search classes: runs the SearchEngine in graph mode on a
+networkx graph and records the animation frames.
+"""
+from functools import partial
+import networkx as nx
+from algorithms.utils.SearchEngine import SearchEngine, SearchObserver
+from algorithms.utils.SearchStats import make_stats
+from algorithms.utils.Problem import Solution
+from algorithms.utils.UnionFind import UnionFind
+from algorithms.utils.GraphRenderer import GraphRenderer
+from algorithms.utils.LayoutCache import graph_layout
+from algorithms.utils.Animation import FramePipe, show_animation, show_live, export_animation
+from algorithms.utils.Trace import TraceWriter, TraceReader, save_search
+
+
+class GraphSearch(SearchObserver):
+    """
+    A graph search configured by class attributes. Subclasses set the frontier policy
+    and override the drawing hooks (`_node_label`, `_draw_frame`) where they differ.
+
+    Class Attributes:
+        algorithm (str): Name used for the SearchStats.
+        policy (str): Frontier policy, see `make_frontier`.
+        problem_policy (str or None): Frontier policy of `solve`, None for `policy`.
+        reopen (bool): Generate a node again when a cheaper path to it is found (cost ordered policies).
+        iterative (bool): Iterative deepening, the limit starts at 0 and grows by one per iteration.
+        frame_on_select (bool): Record a frame when a node is selected instead of after its expansion.
+        interval (int): Delay between animation frames in ms.
+        captions (tuple): Positions of the caption boxes drawn by `_draw_frame`.
+
+    Attributes:
+        _graph (nx.Graph): The searched graph, its node attributes hold the search state.
+        _components (UnionFind): Connected components of the graph, updated per added edge.
+        _successors_of (dict): State -> tuple of (child state, step cost), built once from the graph;
+            the restarts of iterative deepening rebuild the graph with the same edges.
+        _frames (list or TraceReader): (graph copy, frontier states, limit) per recorded step.
+        _path (list): The solution path, from the goal back to the start.
+    """
+    algorithm = "GraphSearch"
+    policy = "fifo"
+    problem_policy = None
+    reopen = False
+    iterative = False
+    frame_on_select = False
+    interval = 800
+    captions = ()
+
+    def __init__(self, nodes, edges: tuple,
+                 start_node: str = "a",
+                 end_node: str = "h",
+                 limit=None,
+                 stats: bool = False,
+                 show: bool = True,
+                 budget=None,
+                 trace: str = None,
+                 live: bool = False):
+        """
+        Args:
+            nodes (list or dict): Node names, for informed searches mapped to their heuristic.
+            edges (tuple): Edges (node1, node2, stepcost).
+            start_node (str, optional): The starting node (default: "a").
+            end_node (str, optional): The goal node (default: "h").
+            limit (int, optional): Maximum number of nodes on a path (default: no limit).
+            stats (bool, optional): Collect SearchStats for the search (default: False).
+            show (bool, optional): Open the animation after the search (default: True).
+            budget (Budget, optional): Deadline, expansion and node limits and cancellation token;
+                a search stopped by it keeps the frames recorded so far (default: no limits).
+            trace (str, optional): Write the frames to this trace file while searching instead of
+                keeping them in memory; `open_trace` replays it later (default: None).
+            live (bool, optional): Run the search in a background thread and show the frames while
+                they are recorded, instead of after the search; `show` is ignored. Drawn frames are
+                not kept unless `trace` is given (default: False).
+        """
+        self._nodes = nodes
+        self._edges = edges
+        self._end_node = end_node
+        self._stats = make_stats(stats, self.algorithm) ##counters and timers, no-op unless enabled
+        self._step = 0
+        self._graph = nx.Graph()
+        self._components = UnionFind()
+        self._fill_graph(edges, nodes)
+        self._successors_of = self._successor_table()
+        self._engine = SearchEngine(self._successors, self._is_goal, policy=self.policy,
+                                    reopen=self.reopen, limit=limit, iterative=self.iterative,
+                                    heuristic=self._heuristic, observer=self, stats=self._stats, budget=budget)
+        self._limit = self._engine.limit
+        writer = TraceWriter(trace) if trace else None
+        if live:
+            self._frames = FramePipe(sink=writer) ##frames go to the window (and the trace) while searching
+        elif writer is not None:
+            self._frames = writer
+        else:
+            self._frames = []
+        if self.frame_on_select:
+            self._frames.append(self._snapshot())
+        self._path = [] ##safe solution
+        if live:
+            show_live(self, partial(self._search, start_node, end_node), interval=self.interval)
+        else:
+            self._search(start_node, end_node)
+        if writer is not None:
+            writer.close(save_search(self))
+            self._frames = TraceReader(trace) ##replayed from the file, frames are loaded on access
+        elif live:
+            self._frames = [] ##the drawn frames are gone
+        self._get_path_cost()
+        if show and not live: ##open the animation window, use export() instead on headless machines
+            self.visualise()
+
+    def _search(self, start_node, goal):
+        if goal is not None and not self._reachable(start_node, goal):
+            ## different components, answer without searching
+            self._graph.nodes[start_node]["start"] = True
+            self._frames.append(self._snapshot())
+            self._solution = Solution(None, self._stats)
+            return
+        ## a path cannot hold more nodes than the component of the start node
+        self._engine.max_limit = self._components.size(start_node)
+        self._solution = Solution.of(self._engine, self._engine.run(start_node), self._stats)
+        if self._engine.stopped is not None:
+            print("The search was stopped early: ", self._engine.stopped)
+
+    def _reachable(self, start_node, goal):
+        return start_node == goal or self._components.connected(start_node, goal)
+
+    def _add_edge(self, node1, node2, **attributes):
+        self._graph.add_edge(node1, node2, **attributes)
+        self._components.union(node1, node2)
+
+    def _is_goal(self, node):
+        return node == self._end_node
+
+    def _successor_table(self):
+        ## one immutable (child, step cost) row per state, shared by every expansion of the state
+        return {node: tuple((child, data["stepcost"]) for child, data in self._graph.adj[node].items())
+                for node in self._graph}
+
+    def _successors(self, node):
+        return self._successors_of[node]
+
+    def _heuristic(self, node):
+        return self._graph.nodes[node].get("heuristic", 0)
+
+    def _snapshot(self):
+        frontier = [] if self._engine.frontier is None else [node.name for node in self._engine.frontier]
+        ## a trace pickles the frame right away, a list or the live window needs a copy
+        graph = self._graph if isinstance(self._frames, TraceWriter) else self._graph.copy()
+        return graph, frontier, self._limit
+
+    def on_start(self, root):
+        self._graph.nodes[root.name]["start"] = True
+
+    def on_select(self, node):
+        data = self._graph.nodes[node.name]
+        data["occupied"] = True
+        data["frontier"] = False
+        data["step"] = self._step
+        if self.frame_on_select:
+            self._frames.append(self._snapshot())
+
+    def on_generate(self, node):
+        self._graph.nodes[node.name]["frontier"] = True
+
+    def on_expand(self, node):
+        data = self._graph.nodes[node.name]
+        data["occupied"] = False
+        data["explored"] = True
+        self._step += 1
+        if not self.frame_on_select:
+            self._frames.append(self._snapshot())
+
+    def on_goal(self, node):
+        self._path = [path_node.name for path_node in reversed(self._engine.path(node))]
+        for node1, node2 in zip(self._path[:-1], self._path[1:]):
+            self._graph[node1][node2]["color"] = "red"
+        self._frames.append(self._snapshot())
+
+    def on_restart(self, limit):
+        ## every iteration starts on an unmarked graph
+        self._limit = limit
+        self._graph = nx.Graph()
+        self._fill_graph(self._edges, self._nodes)
+
+    @classmethod
+    def solve(cls, problem, limit=None, stats=False, budget=None):
+        """
+        Runs the search on an implicit state space. States are generated lazily by
+        `problem.successors` and deduplicated by `problem.key`; no graph is built and
+        no frames are recorded.
+
+        Args:
+            problem (Problem): Start state, successors, goal test and heuristic.
+            limit (int, optional): Maximum number of nodes on a path (default: no limit).
+            stats (bool, optional): Collect SearchStats for the search (default: False).
+            budget (Budget, optional): Run limits, see `SearchEngine` (default: no limits).
+
+        Returns:
+            Solution: The goal node (None if not found) and the stats; the reason and the
+            best node so far if the budget stopped the search. An unsolvable problem (see
+            `Problem.solvable`) is answered without searching.
+        """
+        search_stats = make_stats(stats, cls.algorithm)
+        if problem.solvable() is False:
+            return Solution(None, search_stats, expanded=0, generated=0)
+        policy = cls.problem_policy or cls.policy
+        ## cost ordered frontiers keep the cheapest node per state, otherwise the first path found stays
+        engine = SearchEngine(problem.successors, problem.is_goal, policy=policy,
+                              reopen=cls.reopen or policy in ("g", "g+h"), limit=limit, iterative=cls.iterative,
+                              max_limit=problem.state_count(), heuristic=problem.h, key=problem.key, stats=search_stats, budget=budget)
+        return Solution.of(engine, engine.run(problem.initial), search_stats)
+
+    def get_solution(self):
+        """
+        Returns the Solution of the search: the goal node and the stats, and if the budget
+        stopped the search the reason and the best node found so far.
+        """
+        return self._solution
+
+    def get_stats(self):
+        """Returns the SearchStats of the last search (a NullStats if stats were disabled)."""
+        return self._stats
+
+    def _get_path_cost(self):
+        self._path_cost = {
+            "stepcost": sum(
+                self._graph.get_edge_data(node1, node2)["stepcost"]
+                for node1, node2 in zip(
+                    self._path[:-1], self._path[1:]
+                )
+            )
+        }
+        print("The stepcost for the path is: ",
+              self._path_cost["stepcost"])
+
+    def _fill_graph(self, edges, nodes):
+        for node in nodes:
+            ## add each node with the search attributes
+            self._graph.add_node(node,
+                                 explored=False, occupied=False,
+                                 frontier=False,
+                                 step=""
+                                 )
+        for node1, node2, stepcost in edges:
+            ## add each edges with its stepcost
+            self._add_edge(node1, node2, stepcost=stepcost, color="gray")
+
+    def visualise(self):
+        """Animates the recorded search frames, drawing the graph once and updating it per frame."""
+        show_animation(self, interval=self.interval)
+
+    def export(self, path, fps=2, workers=None, dpi=100):
+        """
+        Renders the animation without a display, in parallel processes.
+
+        Args:
+            path (str): A .gif or .mp4 file, or a directory for a PNG sequence.
+            fps (float, optional): Frames per second (default: 2).
+            workers (int, optional): Number of rendering processes (default: number of CPUs).
+            dpi (int, optional): Resolution of the frames (default: 100).
+        """
+        return export_animation(self, path, fps=fps, workers=workers, dpi=dpi)
+
+    def _make_renderer(self, ax):
+        pos = graph_layout(self._graph)  # Layout for positioning, cached on disk per graph
+        return GraphRenderer(ax, self._graph, pos, self._node_label, captions=self.captions)
+
+    def _renderer_factories(self, blocks):
+        ## every block draws the same graph, laid out once here
+        factory = partial(GraphRenderer, graph=self._graph, pos=graph_layout(self._graph),
+                          node_label=self._node_label, captions=self.captions)
+        return [factory] * len(blocks)
+
+    def _draw_frame(self, renderer, frame):
+        return renderer.update(frame[0])
+
+    @staticmethod
+    def _node_label(node, data):
+        # Node labels (name + search step)
+        return f"{node}\nstep: {data['step']}"
@@ -0,0 +1,271 @@
+"""
+Hash distributed A* (HDA*): the states are partitioned by a hash of their key over
+worker processes. Every worker owns the open and closed list of its states, expands
+them and sends the generated nodes in batches to the owners of the children. A goal
+ends the search only once every worker is idle, no batch is in transit and no open
+node has a lower f than the best goal, so the path is optimal for admissible heuristics.
+A Budget stops the workers early: the coordinator checks the deadline and the cancel
+token, every worker checks its share of the expansion and node limits. The shares are
+not pooled: the first worker to use up its share stops the whole search, so a stopped
+run may have expanded fewer nodes in total than the limit when the load was uneven.
+"""
+import heapq
+import math
+import multiprocessing as mp
+import queue
+import zlib
+from time import monotonic
+
+from algorithms.utils.SearchEngine import SearchNode
+from algorithms.utils.SearchStats import make_stats
+from algorithms.utils.Problem import Solution
+from algorithms.utils.Budget import Budget, EXPANSIONS, NODES
+
+POLL = 0.05  ##seconds an idle worker or the coordinator waits for a message
+
+
+def owner(key, workers):
+    """Worker number of a state key, the same in every process (no randomised str hashing)."""
+    if isinstance(key, int):
+        return ((key * 0x9E3779B97F4A7C15) >> 17) % workers  ##multiplicative hashing spreads packed states
+    return zlib.crc32(repr(key).encode()) % workers
+
+
+def _worker(number, problem, inboxes, results, batch_size, max_expansions=None, max_nodes=None):
+    inbox, workers = inboxes[number], len(inboxes)
+    key, successors, is_goal, h = problem.key, problem.successors, problem.is_goal, problem.h
+    best = {}  ##state key -> (g, state, parent key, step cost), the closed list
+    heap, counter = [], 0
+    outgoing = [[] for _ in range(workers)]
+    sent = received = expanded = generated = 0
+    incumbent = math.inf
+    idle_reported = False
+    halted = False  ##the worker used up its share of the budget
+
+    def add(state, g, parent, step_cost):
+        nonlocal counter
+        state_key = key(state)
+        known = best.get(state_key)
+        if known is not None and known[0] <= g:
+            return
+        best[state_key] = (g, state, parent, step_cost)
+        counter += 1
+        heapq.heappush(heap, (g + h(state), -g, counter, g, state, state_key))  ##deeper first on ties
+
+    def flush():
+        nonlocal sent
+        for target, batch in enumerate(outgoing):
+            if batch:
+                inboxes[target].put(("nodes", batch))
+                outgoing[target] = []
+                sent += 1
+
+    def handle(message):
+        nonlocal received, incumbent
+        kind = message[0]
+        if kind == "nodes":
+            received += 1
+            for node in message[1]:
+                add(*node)
+        elif kind == "incumbent":
+            incumbent = min(incumbent, message[1])
+        elif kind == "probe":
+            flush()  ##buffered nodes must be counted as sent before the worker claims to be idle
+            results.put(("probe", number, message[1], not heap or heap[0][0] >= incumbent, sent, received))
+        elif kind == "parent":
+            _, state, parent, step_cost = best[message[1]]
+            results.put(("parent", state, step_cost, parent))
+        elif kind == "stop":
+            results.put(("counts", number, expanded, generated))
+            return False
+        return True
+
+    while True:
+        busy = not halted and bool(heap) and heap[0][0] < incumbent
+        try:
+            message = inbox.get_nowait() if busy else inbox.get(timeout=POLL)
+        except queue.Empty:
+            message = None
+        if message is not None:
+            if not handle(message):
+                return
+            idle_reported = False
+            continue
+        if not busy:
+            flush()
+            if not idle_reported:
+                results.put(("idle", number))
+                idle_reported = True
+            continue
+        if max_expansions is not None and expanded >= max_expansions:
+            halted = True
+            results.put(("stopped", EXPANSIONS))
+            continue
+        if max_nodes is not None and len(best) >= max_nodes:
+            halted = True
+            results.put(("stopped", NODES))
+            continue
+        _, _, _, g, state, state_key = heapq.heappop(heap)
+        if best[state_key][0] < g:
+            continue  ##outdated entry, reached cheaper later
+        if is_goal(state):
+            incumbent = g
+            flush()
+            results.put(("goal", g, state_key))
+            idle_reported = False
+            continue
+        expanded += 1
+        for child, step_cost in successors(state):
+            generated += 1
+            target = owner(key(child), workers)
+            if target == number:
+                add(child, g + step_cost, state_key, step_cost)
+            else:
+                outgoing[target].append((child, g + step_cost, state_key, step_cost))
+                if len(outgoing[target]) >= batch_size:
+                    inboxes[target].put(("nodes", outgoing[target]))
+                    outgoing[target] = []
+                    sent += 1
+        if expanded % batch_size == 0:
+            flush()  ##keep other workers supplied when the batches fill slowly
+
+
+def hda_star(problem, workers=None, batch_size=64, stats=False, context=None, budget=None):
+    """
+    Runs A* on `workers` processes.
+
+    Args:
+        problem (Problem): Start state, successors, goal test, admissible heuristic and a key;
+            it is sent to the workers, so it must be picklable when processes are spawned.
+        workers (int, optional): Number of worker processes (default: number of CPUs).
+        batch_size (int, optional): Nodes per message between two workers (default: 64).
+        stats (bool, optional): Collect the expanded and generated counts (default: False).
+        context (str, optional): multiprocessing start method (default: the platform default).
+        budget (Budget, optional): Run limits; the expansion and node limits are split evenly
+            over the workers, the nodes of a worker are the states in its closed list. The search
+            stops as soon as one worker reaches its share (default: no limits).
+
+    Returns:
+        Solution: The optimal goal node (None if no goal is reachable) and the stats. A search
+        stopped by the budget has no node, its best node is the best goal found so far, if any.
+
+    Raises:
+        RuntimeError: A worker process died.
+    """
+    workers = workers or mp.cpu_count()
+    budget = budget or Budget()
+    shares = [None if limit is None else -(-limit // workers) for limit in (budget.max_expansions, budget.max_nodes)]
+    ctx = mp.get_context(context)
+    inboxes = [ctx.Queue() for _ in range(workers)]
+    results = ctx.Queue()
+    processes = [ctx.Process(target=_worker, args=(number, problem, inboxes, results, batch_size, *shares),
+                             daemon=True)
+                 for number in range(workers)]
+    for process in processes:
+        process.start()
+    search_stats = make_stats(stats, "HDA*")
+    expanded = generated = 0
+    try:
+        start_key = problem.key(problem.initial)
+        inboxes[owner(start_key, workers)].put(("nodes", [(problem.initial, 0, None, 0)]))
+        goal, stopped = _coordinate(inboxes, results, processes, budget, monotonic())
+        path = _path(goal, inboxes, results, processes, problem) if goal is not None else []
+        for inbox in inboxes:
+            inbox.put(("stop",))
+        reported = set()  ##workers that sent their counts may exit
+        for _ in range(workers):
+            _, number, worker_expanded, worker_generated = _receive(results, processes, "counts", reported)
+            reported.add(number)
+            expanded += worker_expanded
+            generated += worker_generated
+        search_stats.expanded, search_stats.generated = expanded, generated
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+    node = None
+    for state, step_cost in path:
+        node = SearchNode(state, problem.h(state), node, step_cost)
+    counts = expanded, generated
+    if stopped is not None:
+        return Solution(None, search_stats, stopped, node, *counts)
+    return Solution(node, search_stats, None, None, *counts)
+
+
+def _coordinate(inboxes, results, processes, budget, started):
+    ## termination: a probe wave finds every worker idle, all sent batches received
+    ## and the same counts as the wave before, so nothing was in transit in between
+    ## returns the best goal key and the reason if the budget ended the search
+    workers = len(inboxes)
+    incumbent, goal = math.inf, None
+    idle = set()
+    wave, replies, previous = 0, {}, None
+    sent_total = 1  ##the start node batch
+    while True:
+        stopped = budget.exceeded(started, 0, 0)  ##the workers check their expansions and nodes
+        if stopped is not None:
+            return goal, stopped
+        try:
+            message = results.get(timeout=POLL)
+        except queue.Empty:
+            message = None
+        if message is None:
+            if not all(process.is_alive() for process in processes):
+                raise RuntimeError("an HDA* worker process died")
+        elif message[0] == "goal":
+            if message[1] < incumbent:
+                incumbent, goal = message[1], message[2]
+                for inbox in inboxes:
+                    inbox.put(("incumbent", incumbent))
+        elif message[0] == "stopped":
+            return goal, message[1]
+        elif message[0] == "idle":
+            idle.add(message[1])
+        elif message[0] == "probe" and message[2] == wave:
+            replies[message[1]] = message[3:]
+        if wave and len(replies) == workers:
+            counts = (all(reply[0] for reply in replies.values()),
+                      sum(reply[1] for reply in replies.values()) + sent_total,
+                      sum(reply[2] for reply in replies.values()))
+            if counts[0] and counts[1] == counts[2]:
+                if counts == previous:
+                    return goal, None
+                previous, replies = counts, {}
+                wave += 1  ##confirm with a second wave
+                for inbox in inboxes:
+                    inbox.put(("probe", wave))
+            else:
+                previous, replies = None, {}
+                wave = 0  ##wait until every worker reports idle again
+                idle.clear()
+        elif not wave and len(idle) == workers:
+            wave = 1
+            for inbox in inboxes:
+                inbox.put(("probe", wave))
+
+
+def _receive(results, processes, kind, done=()):
+    ## waits for the next message of a kind and drops late idle and probe messages;
+    ## raises if a worker not in `done` died. Liveness is checked before waiting: a worker
+    ## that exits has written its messages, so they arrive within the wait
+    while True:
+        alive = all(process.is_alive() for number, process in enumerate(processes) if number not in done)
+        try:
+            message = results.get(timeout=POLL)
+        except queue.Empty:
+            if not alive:
+                raise RuntimeError("an HDA* worker process died")
+            continue
+        if message[0] == kind:
+            return message
+
+
+def _path(goal, inboxes, results, processes, problem):
+    ## follow the parent keys back to the start, each asked from the owner of the state
+    path, state_key = [], goal
+    while state_key is not None:
+        inboxes[owner(state_key, len(inboxes))].put(("parent", state_key))
+        _, state, step_cost, state_key = _receive(results, processes, "parent")
+        path.append((state, step_cost))
+    return path[::-1]
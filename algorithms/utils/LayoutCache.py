@@ -0,0 +1,74 @@
+"""
+Disk cache for the node positions of the graph visualisations.
+
+Layouts are keyed by a fingerprint of the nodes and edges only, so every algorithm
+run on the same graph reuses the same layout, across processes and runs.
+"""
+import hashlib
+import json
+import os
+
+import networkx as nx
+
+CACHE_DIR = os.environ.get("AIML_LAYOUT_CACHE",
+                           os.path.join(os.path.expanduser("~"), ".cache", "aiml_pub", "layouts"))
+SCALABLE_THRESHOLD = 500  ##above this many nodes kamada kawai gets too slow
+_memory = {}  ##layouts already loaded in this process
+
+
+def graph_fingerprint(graph):
+    """
+    Returns a hex digest identifying the nodes and edges of a graph.
+    Attributes such as step costs or search flags are ignored, they do not affect the layout.
+    """
+    digest = hashlib.sha1(b"directed" if graph.is_directed() else b"undirected")
+    for node in sorted(map(repr, graph.nodes())):
+        digest.update(node.encode() + b"\0")
+    if graph.is_directed():
+        edges = sorted(f"{u!r}\0{v!r}" for u, v in graph.edges())
+    else:
+        edges = sorted("\0".join(sorted((repr(u), repr(v)))) for u, v in graph.edges())
+    for edge in edges:
+        digest.update(b"\1" + edge.encode())
+    return digest.hexdigest()
+
+
+def compute_layout(graph, threshold=SCALABLE_THRESHOLD):
+    """Kamada kawai for small graphs, the (sparse, for large graphs) spring layout above the threshold."""
+    if graph.number_of_nodes() <= threshold:
+        return nx.kamada_kawai_layout(graph)
+    return nx.spring_layout(graph, seed=0)
+
+
+def graph_layout(graph, cache_dir=None, threshold=SCALABLE_THRESHOLD):
+    """
+    Returns node positions for a graph, from the cache if the same graph was laid out before.
+
+    Args:
+        graph (nx.Graph): The graph to lay out.
+        cache_dir (str, optional): Cache directory (default: $AIML_LAYOUT_CACHE or ~/.cache/aiml_pub/layouts).
+        threshold (int, optional): Node count above which the faster spring layout is used (default: 500).
+
+    Returns:
+        dict: Node -> (x, y) position.
+    """
+    method = "kamada_kawai" if graph.number_of_nodes() <= threshold else "spring"
+    key = f"{graph_fingerprint(graph)}-{method}"
+    nodes = sorted(graph.nodes(), key=repr)
+    if key not in _memory:
+        file = os.path.join(cache_dir or CACHE_DIR, key + ".json")
+        try:
+            with open(file, encoding="utf-8") as handle:
+                _memory[key] = [tuple(xy) for xy in json.load(handle)["pos"]]
+        except (OSError, ValueError, KeyError):
+            pos = compute_layout(graph, threshold)
+            _memory[key] = [tuple(float(c) for c in pos[node]) for node in nodes]
+            try:
+                os.makedirs(os.path.dirname(file), exist_ok=True)
+                tmp = f"{file}.{os.getpid()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as handle:
+                    json.dump({"method": method, "pos": _memory[key]}, handle)
+                os.replace(tmp, file)  ##atomic, concurrent runs never see half written files
+            except OSError:
+                pass  ##read-only location, the layout is still kept in memory
+    return dict(zip(nodes, _memory[key]))
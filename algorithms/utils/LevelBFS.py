@@ -0,0 +1,146 @@
+"""
+Level-synchronous breadth first search on a CSRGraph. The frontier is a whole BFS
+level and every level is expanded by array operations instead of one Python loop
+iteration per node:
+
+- top-down: the adjacency rows of the frontier nodes are gathered (a sparse
+  matrix times sparse vector product), unvisited targets are masked and the first
+  frontier node seen per target becomes its parent;
+- bottom-up, for frontiers with many edges: one boolean sparse matrix-vector product
+  of the transposed adjacency with the frontier bitmap marks every node with a
+  frontier predecessor, the parents of the new nodes are picked from their in-rows.
+
+The bottom-up step needs SciPy; without it every level is expanded top-down.
+Step costs are ignored (hop distances), edges with an infinite step cost are blocked.
+"""
+from time import monotonic
+
+import numpy as np
+
+from algorithms.utils.ShortestPaths import tree_path
+
+try:
+    import scipy.sparse as sparse
+except ImportError:
+    sparse = None  ##top-down expansion only
+
+BOTTOM_UP = 8  ##a level goes bottom-up once its frontier holds more than 1/BOTTOM_UP of the edges
+
+
+class LevelBFS:
+    """
+    Hop distance and shortest path queries on a CSRGraph. The adjacency matrices are
+    built by the first query and reused until the graph version changes.
+
+    Attributes:
+        graph (CSRGraph): The searched graph.
+        expanded (int): Nodes expanded by the last run.
+        stopped (str or None): Why the budget ended the last run, None if it ran to the end.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.expanded = 0
+        self.stopped = None
+        self._adjacency = None  ##(graph version, offsets, targets, transposed matrix or None)
+
+    def _arrays(self):
+        graph = self.graph
+        if self._adjacency is None or self._adjacency[0] != graph.version:
+            n = graph.number_of_nodes()
+            offsets, targets = np.asarray(graph.offsets, dtype=np.int64), np.asarray(graph.targets)
+            open_edges = np.isfinite(graph.weights)
+            if not open_edges.all():
+                sources = np.repeat(np.arange(n), np.diff(offsets))[open_edges]
+                offsets = np.concatenate([[0], np.cumsum(np.bincount(sources, minlength=n))])
+                targets = targets[open_edges]
+            transposed = None
+            if sparse is not None:
+                matrix = sparse.csr_matrix((np.ones(len(targets), dtype=bool), targets, offsets), shape=(n, n))
+                transposed = matrix if not graph.directed else matrix.T.tocsr()
+            self._adjacency = (graph.version, offsets, targets, transposed)
+        return self._adjacency[1:]
+
+    def run(self, source, goal=None, max_depth=None, budget=None):
+        """
+        Runs the BFS from `source` level by level.
+
+        Args:
+            source (str): Name of the start node.
+            goal (str, optional): Stop after the level that reaches this node (default: all reachable nodes).
+            max_depth (int, optional): Number of levels after the source (default: no limit).
+            budget (Budget, optional): Run limits, checked per level; the nodes are the reached
+                nodes (default: no limits).
+
+        Returns:
+            tuple: (hops, pred) arrays indexed by node number, in the form of `shortest_path_tree`:
+            hops holds the number of edges on a shortest path (inf if not reached), pred the
+            previous node on it (-1 for the source and unreached nodes).
+        """
+        offsets, targets, transposed = self._arrays()
+        n = self.graph.number_of_nodes()
+        edges = max(len(targets), 1)
+        start = self.graph.index(source)
+        target = self.graph.index(goal) if goal is not None else -1
+        hops = np.full(n, np.inf)
+        pred = np.full(n, -1, dtype=np.int32)
+        visited = np.zeros(n, dtype=bool)
+        visited[start] = True
+        hops[start] = 0
+        frontier = np.array([start], dtype=np.int64)
+        depth = reached = 1
+        self.expanded = 0
+        self.stopped = None
+        started = monotonic()
+        while len(frontier) and not (target >= 0 and visited[target]):
+            if max_depth is not None and depth > max_depth:
+                break
+            if budget is not None:
+                self.stopped = budget.exceeded(started, self.expanded, reached)
+                if self.stopped is not None:
+                    break
+            degrees = offsets[frontier + 1] - offsets[frontier]
+            if transposed is not None and degrees.sum() * BOTTOM_UP > edges:
+                new, parents = self._bottom_up(transposed, frontier, visited)
+            else:
+                new, parents = self._top_down(offsets, targets, frontier, degrees, visited)
+            visited[new] = True
+            hops[new] = depth
+            pred[new] = parents
+            self.expanded += len(frontier)
+            reached += len(new)
+            frontier = new
+            depth += 1
+        return hops, pred
+
+    @staticmethod
+    def _top_down(offsets, targets, frontier, degrees, visited):
+        ## gather the adjacency rows of the frontier, keep the first edge into every unvisited node
+        positions = np.arange(degrees.sum()) + np.repeat(offsets[frontier] - (np.cumsum(degrees) - degrees), degrees)
+        children = targets[positions]
+        fresh = ~visited[children]
+        new, first = np.unique(children[fresh], return_index=True)
+        return new.astype(np.int64), np.repeat(frontier, degrees)[fresh][first]
+
+    @staticmethod
+    def _bottom_up(transposed, frontier, visited):
+        ## one boolean SpMV marks the nodes with a predecessor in the frontier
+        bitmap = np.zeros(transposed.shape[0], dtype=bool)
+        bitmap[frontier] = True
+        new = np.flatnonzero((transposed @ bitmap) & ~visited)
+        rows = transposed[new]  ##in-neighbours of the new nodes
+        in_frontier = np.flatnonzero(bitmap[rows.indices])
+        row_of = np.repeat(np.arange(len(new)), np.diff(rows.indptr))[in_frontier]
+        _, first = np.unique(row_of, return_index=True)
+        return new, rows.indices[in_frontier[first]]
+
+    def hops(self, source, goal):
+        """Returns the number of edges on a shortest path, None if `goal` is not reachable."""
+        hops, _ = self.run(source, goal)
+        value = hops[self.graph.index(goal)]
+        return None if np.isinf(value) else int(value)
+
+    def path(self, source, goal):
+        """Returns the node names of a shortest (fewest edges) path, empty if `goal` is not reachable."""
+        hops, pred = self.run(source, goal)
+        return tree_path(self.graph, hops, pred, goal)
@@ -0,0 +1,163 @@
+"""
+Implicit state spaces: a Problem describes the states by a start state, a successor
+function and a goal test instead of `nodes`/`edges`, so the search classes can generate
+states lazily with their `solve` class method.
+
+`GraphProblem` wraps a CSRGraph, so loaded graphs are searched without building
+a networkx graph.
+"""
+import math
+
+from algorithms.utils.SearchEngine import SearchEngine
+
+
+class Problem:
+    """
+    Search problem over an implicit state space. Subclasses implement `successors` and
+    override `is_goal`, `h` and `key` where needed.
+
+    Attributes:
+        initial: The start state.
+        goal: The goal state compared by the default `is_goal` (may be None if `is_goal` is overridden).
+    """
+
+    def __init__(self, initial, goal=None):
+        self.initial = initial
+        self.goal = goal
+
+    def successors(self, state):
+        """Returns an iterable of (child state, step cost) pairs."""
+        raise NotImplementedError
+
+    def is_goal(self, state):
+        return state == self.goal
+
+    def h(self, state):
+        """Heuristic estimate of the cost from `state` to a goal (default: 0)."""
+        return 0
+
+    def key(self, state):
+        """
+        Hashable and compact key used for duplicate detection, e.g. a packed integer
+        or a tuple instead of a list (default: the state itself).
+        """
+        return state
+
+    def from_key(self, key):
+        """Inverse of `key`, needed by searches that store only keys, e.g. ExternalBFS (default: the key itself)."""
+        return key
+
+    def solvable(self):
+        """
+        Whether a goal can be reached from the initial state, None if unknown (default).
+        `solve` answers False without searching.
+        """
+        return None
+
+    def state_count(self):
+        """
+        Upper bound on the number of states reachable from the initial state, None if
+        unknown (default). No path without repeated states holds more nodes, so `solve`
+        ends iterative deepening there and limits the depth of tree searches to it.
+        """
+        return None
+
+
+class GraphProblem(Problem):
+    """
+    Route from a start to a goal node of a CSRGraph. The states are node numbers, edges
+    with an infinite step cost are blocked and `h` is the heuristic column of the graph
+    (0 without one).
+
+    Attributes:
+        graph (CSRGraph): The searched graph.
+    """
+
+    def __init__(self, graph, start, goal=None):
+        """
+        Args:
+            graph (CSRGraph): The graph.
+            start (str): Name of the start node.
+            goal (str, optional): Name of the goal node (default: None, no goal).
+        """
+        super().__init__(graph.index(start), graph.index(goal) if goal is not None else None)
+        self.graph = graph
+
+    def successors(self, state):
+        graph = self.graph
+        start, end = graph.offsets[state], graph.offsets[state + 1]
+        return [(target, weight) for target, weight in zip(graph.targets[start:end].tolist(),
+                                                           graph.weights[start:end].tolist())
+                if weight != math.inf]
+
+    def h(self, state):
+        heuristics = self.graph.heuristics
+        return 0 if heuristics is None else float(heuristics[state])
+
+    def solvable(self):
+        if self.goal is None:
+            return None
+        labels, _ = self.graph.components()
+        if labels[self.initial] != labels[self.goal]:
+            return False
+        return None if self.graph.directed else True  ##a directed edge may still point the wrong way
+
+    def state_count(self):
+        labels, sizes = self.graph.components()
+        return int(sizes[labels[self.initial]])
+
+    def names(self, states):
+        """Returns the node names of a list of states, e.g. of `Solution.path`."""
+        return [self.graph.names[state] for state in states]
+
+
+class Solution:
+    """
+    Result of `solve`.
+
+    Attributes:
+        node (SearchNode or None): The goal search node, None if no goal was found.
+        stats (SearchStats): Counters and timers of the search (a NullStats if disabled).
+        stopped (str or None): Why the budget ended the search early, None if it ran to the end.
+        best (SearchNode or None): The goal, or the most promising node of a stopped search
+            (see `SearchEngine.best`), the partial result.
+        expanded (int or None): Nodes expanded by the search, counted even if stats are disabled.
+        generated (int or None): Nodes generated by the search.
+    """
+
+    def __init__(self, node, stats, stopped=None, best=None, expanded=None, generated=None):
+        self.node = node
+        self.stats = stats
+        self.stopped = stopped
+        self.best = node if best is None else best
+        self.expanded = expanded
+        self.generated = generated
+
+    @classmethod
+    def of(cls, engine, node, stats):
+        """Solution of a finished SearchEngine run."""
+        return cls(node, stats, engine.stopped, engine.best, engine.expanded, engine.generated)
+
+    @property
+    def found(self):
+        return self.node is not None
+
+    @property
+    def path(self):
+        """States from the start state to the goal, empty if no goal was found."""
+        return [node.name for node in SearchEngine.path(self.node)] if self.node is not None else []
+
+    @property
+    def cost(self):
+        """Path cost of the solution (None if no goal was found)."""
+        return self.node.sum_path_cost if self.node is not None else None
+
+    @property
+    def best_path(self):
+        """States from the start state to `best`, the partial path of a stopped search."""
+        return [node.name for node in SearchEngine.path(self.best)] if self.best is not None else []
+
+    def __repr__(self):
+        if self.stopped is not None:
+            return f"Solution(found={self.found}, stopped={self.stopped!r}, best_length={len(self.best_path)})"
+        return f"Solution(found={self.found}, cost={self.cost}, length={len(self.path)})"
@@ -0,0 +1,268 @@
+"""
+Command-line query runner: loads a graph once and answers route queries streamed as
+JSON lines, one result line per query written as soon as it is answered.
+
+    python -m algorithms.utils.QueryRunner roads.csv --nodes roads_nodes.csv < queries.jsonl
+
+A query line holds the algorithm, the start and the goal node and optional solve
+options and limits, e.g.
+
+    {"id": 7, "algorithm": "astar", "start": "a", "goal": "h", "deadline": 0.05}
+
+and is answered by
+
+    {"id": 7, "algorithm": "astar", "start": "a", "goal": "h", "found": true, "path": [...],
+     "cost": 11.0, "expanded": 5, "generated": 9, "latency_ms": 0.31}
+
+A search stopped by its limits adds "stopped" and the partial "best_path", a query
+that cannot be answered gets an "error" instead; a failing query never ends the run. "bfs_levels" answers fewest-edge
+queries with the vectorised `LevelBFS`, its cost is the number of edges. With --workers the queries are
+answered by a process pool in batches; the workers attach to the graph in shared
+memory, so it is loaded and stored once. Results then come in completion order,
+the "id" field matches them to their queries.
+"""
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from time import perf_counter
+
+import numpy as np
+
+from algorithms.informed.astar_graph import AStar
+from algorithms.informed.Astar_tree import AStarTree
+from algorithms.informed.GBFS import GBFS
+from algorithms.uninformed.BFS_graph import BFS
+from algorithms.uninformed.BFS_tree import BFS as BFS_tree
+from algorithms.uninformed.DFS import DFS
+from algorithms.uninformed.DFS_tree import BFS as DFS_tree
+from algorithms.uninformed.IDS import IDS
+from algorithms.uninformed.IDS_tree import IDS_tree
+from algorithms.uninformed.LDFS import DFS as LDFS
+from algorithms.uninformed.LDFS_tree import LDFS_tree
+from algorithms.uninformed.UCS import UCS
+from algorithms.utils.Budget import Budget
+from algorithms.utils.GraphFile import MAGIC, open_graph
+from algorithms.utils.GraphLoader import load_graph
+from algorithms.utils.LevelBFS import LevelBFS
+from algorithms.utils.Problem import GraphProblem
+from algorithms.utils.SharedGraph import SharedGraphStore, attach_graph
+from algorithms.utils.ShortestPaths import tree_path
+
+ALGORITHMS = {
+    "bfs": BFS, "dfs": DFS, "ldfs": LDFS, "ids": IDS, "ucs": UCS, "gbfs": GBFS, "astar": AStar,
+    "bfs_tree": BFS_tree, "dfs_tree": DFS_tree, "ldfs_tree": LDFS_tree, "ids_tree": IDS_tree,
+    "astar_tree": AStarTree, "bfs_levels": LevelBFS,
+}
+OPTIONS = ("limit", "prune", "table_size", "memory")  ##passed to `solve` if given
+LIMITS = ("deadline", "max_expansions", "max_nodes")  ##Budget fields, per query or as defaults
+
+_graph = _levels = None  ##graph and LevelBFS of a worker process, set once by `_attach`
+
+
+def read_graph(path, nodes_path=None, directed=False):
+    """Opens a binary graph file (see GraphFile) or streams an edge-list, CSV or TSV file."""
+    with open(path, "rb") as handle:
+        if handle.read(len(MAGIC)) == MAGIC:
+            return open_graph(path)
+    return load_graph(path, nodes_path, directed=directed)
+
+
+def answer(graph, query, defaults=None, levels=None):
+    """
+    Runs one query on a graph.
+
+    Args:
+        graph (CSRGraph): The graph.
+        query (dict): "algorithm", "start", "goal", optional `OPTIONS` and `LIMITS`; other
+            fields like "id" are copied to the result.
+        defaults (dict, optional): `LIMITS` used when the query does not set them.
+        levels (LevelBFS, optional): LevelBFS of the graph reused by "bfs_levels" queries.
+
+    Returns:
+        dict: The result line, with an "error" if the query cannot be answered.
+    """
+    result = {key: value for key, value in query.items() if key not in OPTIONS and key not in LIMITS}
+    try:
+        return _answer(graph, query, defaults, levels, dict(result))
+    except Exception as error:  ##one bad query must not end the run
+        result["error"] = f"{type(error).__name__}: {error}"
+        return result
+
+
+def _answer(graph, query, defaults, levels, result):
+    missing = [field for field in ("algorithm", "start", "goal") if field not in query]
+    if missing:
+        result["error"] = f"missing field(s) {', '.join(missing)}"
+        return result
+    search = ALGORITHMS.get(query["algorithm"])
+    if search is None:
+        result["error"] = f"unknown algorithm {query['algorithm']!r}, use one of {', '.join(ALGORITHMS)}"
+        return result
+    try:
+        problem = GraphProblem(graph, query["start"], query["goal"])
+    except KeyError as error:
+        result["error"] = f"unknown node {error}"
+        return result
+    except TypeError:  ##unhashable start or goal, e.g. a list
+        result["error"] = f"invalid node in start {query['start']!r} or goal {query['goal']!r}"
+        return result
+    limits = {**(defaults or {}), **{key: query[key] for key in LIMITS if key in query}}
+    invalid = [key for key, value in limits.items()
+               if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)))]
+    if invalid:
+        result["error"] = f"{', '.join(invalid)} must be a number"
+        return result
+    options = {key: query[key] for key in OPTIONS if key in query}
+    if limits:
+        options["budget"] = Budget(**limits)
+    if search is LevelBFS:
+        return _answer_levels(levels or LevelBFS(graph), query, options.get("budget"), result)
+    try:
+        started = perf_counter()
+        solution = search.solve(problem, **options)
+        latency = perf_counter() - started
+    except (TypeError, ValueError) as error:  ##options the algorithm does not take or accept
+        result["error"] = str(error)
+        return result
+    result["found"] = solution.found
+    result["path"] = problem.names(solution.path)
+    result["cost"] = solution.cost
+    result["expanded"] = solution.expanded
+    result["generated"] = solution.generated
+    result["latency_ms"] = round(latency * 1000, 3)
+    if solution.stopped is not None:
+        result["stopped"] = solution.stopped
+        result["best_path"] = problem.names(solution.best_path)
+    return result
+
+
+def _answer_levels(levels, query, budget, result):
+    started = perf_counter()
+    hops, pred = levels.run(query["start"], query["goal"], budget=budget)
+    latency = perf_counter() - started
+    path = tree_path(levels.graph, hops, pred, query["goal"])
+    result["found"] = bool(path)
+    result["path"] = path
+    result["cost"] = len(path) - 1 if path else None
+    result["expanded"] = levels.expanded
+    result["generated"] = int(np.isfinite(hops).sum())
+    result["latency_ms"] = round(latency * 1000, 3)
+    if levels.stopped is not None:
+        result["stopped"] = levels.stopped  ##no heuristic, so no best node to report
+    return result
+
+
+def _parse(number, line, graph, defaults, levels=None):
+    try:
+        query = json.loads(line)
+    except ValueError as error:
+        return {"line": number, "error": f"invalid JSON: {error}"}
+    if not isinstance(query, dict):
+        return {"line": number, "error": "a query must be a JSON object"}
+    return answer(graph, query, defaults, levels)
+
+
+def _queries(lines):
+    ## numbered non-empty lines, the numbers identify broken lines in the results
+    return ((number, line) for number, line in enumerate(lines, 1) if line.strip())
+
+
+def _attach(name):
+    global _graph, _levels
+    _graph = attach_graph(name)
+    _levels = LevelBFS(_graph)
+
+
+def _answer_batch(batch, defaults):
+    return [json.dumps(_parse(number, line, _graph, defaults, _levels)) for number, line in batch]
+
+
+def _failed(batch, error):
+    return [json.dumps({"line": number, "error": f"worker failed: {type(error).__name__}: {error}"}) + "\n"
+            for number, _ in batch]
+
+
+def run(graph, lines, output, workers=1, batch_size=256, defaults=None):
+    """
+    Answers the query lines and writes one result line per query.
+
+    Args:
+        graph (CSRGraph): The graph.
+        lines (iterable): JSON query lines, read lazily.
+        output (file): Text stream for the result lines, flushed after each line or batch.
+        workers (int, optional): Number of worker processes, 1 answers in this process (default: 1).
+        batch_size (int, optional): Queries per task sent to a worker (default: 256).
+        defaults (dict, optional): Default `LIMITS` of every query.
+
+    Returns:
+        int: Number of answered queries.
+    """
+    queries = _queries(lines)
+    count = 0
+    if workers <= 1:
+        levels = LevelBFS(graph)
+        for number, line in queries:
+            output.write(json.dumps(_parse(number, line, graph, defaults, levels)) + "\n")
+            output.flush()
+            count += 1
+        return count
+    with SharedGraphStore() as store, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                initargs=(store.publish(graph),)) as pool:
+        pending = {}  ##future -> its batch, failed batches get an error line per query
+        while True:
+            batch = list(islice(queries, batch_size))
+            if batch:
+                try:
+                    pending[pool.submit(_answer_batch, batch, defaults)] = batch
+                except BrokenProcessPool as error:
+                    output.write("".join(_failed(batch, error)))
+                    output.flush()
+                    count += len(batch)
+            ## at most two batches per worker in flight, the input is read as the results are written
+            if pending and (not batch or len(pending) >= 2 * workers):
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch_done = pending.pop(future)
+                    try:
+                        results = [result + "\n" for result in future.result()]
+                    except Exception as error:  ##e.g. a worker that died, the other batches go on
+                        results = _failed(batch_done, error)
+                    output.write("".join(results))
+                    output.flush()
+                    count += len(results)
+            if not batch and not pending:
+                return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Answer JSON line route queries on a graph.")
+    parser.add_argument("graph", help="binary graph file, edge-list, .csv or .tsv file")
+    parser.add_argument("--nodes", help="node file with heuristic and/or coordinate columns")
+    parser.add_argument("--directed", action="store_true", help="edges of a text file are one-directional")
+    parser.add_argument("--queries", help="query file (default: stdin)")
+    parser.add_argument("--output", help="result file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--batch-size", type=int, default=256, help="queries per worker task (default: 256)")
+    parser.add_argument("--deadline", type=float, help="default seconds per query")
+    parser.add_argument("--max-expansions", type=int, help="default expansion limit per query")
+    parser.add_argument("--max-nodes", type=int, help="default node limit per query")
+    args = parser.parse_args(argv)
+    defaults = {key: getattr(args, key) for key in LIMITS if getattr(args, key) is not None}
+    graph = read_graph(args.graph, args.nodes, args.directed)
+    queries = open(args.queries, encoding="utf-8") if args.queries else sys.stdin
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        run(graph, queries, output, args.workers, args.batch_size, defaults)
+    finally:
+        if args.queries:
+            queries.close()
+        if args.output:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Simplified memory-bounded A* (SMA*) for the tree searches. The search tree never holds
+more than `memory` nodes: when it is full the worst leaf is dropped, its f-value is
+kept by the parent, and the leaf is generated again once it is the best choice.
+"""
+import heapq
+import math
+
+from algorithms.utils.SearchEngine import SearchEngine
+
+
+class SMAStarEngine(SearchEngine):
+    """
+    SMA* with the interface of the tree mode SearchEngine. Nodes are ranked by
+    f(x) = g(x) + h(x), never lower than the f of their parent (pathmax), and a
+    parent's f is backed up to the lowest f among its successors, in memory or not.
+    Successors are generated one at a time, lowest f first. The solution is optimal
+    if the heuristic is admissible and the cheapest solution path fits into memory.
+
+    Attributes:
+        memory (int): Maximum number of search nodes kept at once.
+        dropped (int): Leaves dropped to free memory during the last run.
+        frontier (dict): Open nodes -> their priority, the nodes with successors left to generate.
+    """
+
+    def __init__(self, successors, is_goal, memory, make_node=None, heuristic=None, key=None, observer=None,
+                 stats=None, budget=None):
+        """
+        Args:
+            successors (callable): Function state -> iterable of (child state, step cost).
+            is_goal (callable): Function state -> bool.
+            memory (int): Maximum number of search nodes kept at once, at least 2.
+            make_node (callable, optional): Function (state, parent, step cost) -> search node (default: SearchNode).
+            heuristic (callable, optional): Function state -> heuristic value (default: 0).
+            key (callable, optional): Function state -> hashable key, used by the stats (default: the state itself).
+            observer (SearchObserver, optional): Receives the search events, `on_drop` for dropped leaves.
+            stats (SearchStats, optional): Counters and timers (default: disabled).
+            budget (Budget, optional): Run limits, `max_nodes` counts the nodes in memory (default: no limits).
+        """
+        if memory < 2:
+            raise ValueError("SMA* needs memory for at least 2 nodes")
+        super().__init__(successors, is_goal, policy="g+h", tree=True, make_node=make_node,
+                         heuristic=heuristic, key=key, observer=observer, stats=stats, budget=budget)
+        self.memory = memory
+        self.dropped = 0
+
+    def run(self, start):
+        """
+        Searches from a start state.
+
+        Returns:
+            The goal search node, or None if no solution fits into memory or the budget stopped the run.
+        """
+        self._begin()
+        self.dropped = 0
+        return self._run(start)
+
+    def _h(self, state):
+        return self._heuristic(state) if self._heuristic else 0
+
+    def _estimate(self, node, state, step_cost):
+        """f of a successor before it is generated."""
+        if node.depth + 2 >= self.memory and not self._is_goal(state):
+            return math.inf  ##no room left for the path below it
+        return max(self._f[node], node.sum_path_cost + step_cost + self._h(state))
+
+    def _push(self, node, priority):
+        self.frontier[node] = priority
+        self._counter += 1
+        heapq.heappush(self._heap, (priority, -node.depth, self._counter, node))  ##deepest first on ties
+
+    def _add_leaf(self, node):
+        ## the worst-leaf heap is keyed by (-f, depth): highest f, the shallowest of those;
+        ## entries of nodes that are no longer leaves or changed their f are skipped when popped
+        self._leaves.add(node)
+        self._counter += 1
+        heapq.heappush(self._worst, (-self._f[node], node.depth, self._counter, node))
+
+    def _open(self, node):
+        ## an expanded node stays open while successors are left, ranked by the best of them
+        pending = self._pending[node]
+        if pending:
+            self._push(node, min(f for _, _, f in pending.values()))
+        else:
+            self.frontier.pop(node, None)
+
+    def _backup(self, node):
+        while node is not None:
+            values = [self._f[child] for child in self._children[node]]
+            values += [f for _, _, f in self._pending[node].values()]
+            f = min(values) if values else math.inf
+            if f == self._f[node]:
+                return
+            self._f[node] = f
+            if node in self._leaves:
+                self._add_leaf(node)  ##a dead end, ranked by its new f
+            node = node.parent
+
+    def _drop_worst_leaf(self, keep):
+        kept = []
+        while True:
+            entry = heapq.heappop(self._worst)
+            leaf = entry[-1]
+            if leaf not in self._leaves or self._f[leaf] != -entry[0]:
+                continue  ##outdated entry
+            if leaf is keep or leaf.parent is None:
+                kept.append(entry)  ##still a leaf, but must stay in memory
+                continue
+            break
+        for entry in kept:
+            heapq.heappush(self._worst, entry)
+        parent = leaf.parent
+        self._children[parent].remove(leaf)
+        if not self._children[parent]:
+            self._add_leaf(parent)
+        self._pending[parent][self._index.pop(leaf)] = (leaf.name, leaf.path_cost, self._f.pop(leaf))
+        self._leaves.discard(leaf)
+        self.frontier.pop(leaf, None)
+        self._pending.pop(leaf, None)
+        self._children.pop(leaf)
+        self._open(parent)
+        self._used -= 1
+        self.dropped += 1
+        self._observer.on_drop(leaf)
+
+    def _run(self, start):
+        stats, observer = self._stats, self._observer
+        successors, is_goal, make_node = self._successors, self._is_goal, self._make_node
+        self.frontier, self._heap, self._counter = {}, [], 0
+        self._f, self._pending, self._children, self._index = {}, {}, {}, {}
+        root = make_node(start, None, 0)
+        self._f[root] = self._h(start)
+        self._children[root] = []
+        self._leaves, self._worst = set(), []
+        self._add_leaf(root)
+        self._used = 1
+        self._push(root, self._f[root])
+        stats.generate()
+        self.generated += 1
+        observer.on_start(root)
+        expanded = set()
+        while self._heap:
+            if self.budget is not None and self._exhausted(self._used):
+                return None
+            t = stats.clock()
+            priority, _, _, node = heapq.heappop(self._heap)
+            t = stats.lap("frontier", t)
+            if self.frontier.get(node) != priority:
+                continue  ##outdated heap entry
+            if priority == math.inf:
+                return None  ##every open path needs more memory than available
+            if node not in self._pending:  ##first selection of a generated node
+                observer.on_select(node)
+                reached_goal = is_goal(node.name)
+                t = stats.lap("goal_check", t)
+                if reached_goal:
+                    self.best = node
+                    observer.on_goal(node)
+                    return node
+                self._track_best(node)
+                stats.expand(self._key(node.name) if self._key else node.name)
+                self.expanded += 1
+                self._pending[node] = {i: (state, step_cost, self._estimate(node, state, step_cost))
+                                       for i, (state, step_cost) in enumerate(successors(node.name))}
+                if not self._pending[node]:
+                    self._backup(node)  ##dead end, f becomes inf
+                    self.frontier.pop(node)
+                    continue
+            ## generate the best successor that is not in memory
+            pending = self._pending[node]
+            i = min(pending, key=lambda i: (pending[i][2], i))
+            if self._used >= self.memory:
+                self._drop_worst_leaf(keep=node)
+            state, step_cost, f = pending.pop(i)
+            child = make_node(state, node, step_cost)
+            self._f[child], self._index[child], self._children[child] = f, i, []
+            self._children[node].append(child)
+            self._leaves.discard(node)
+            self._add_leaf(child)
+            self._used += 1
+            self._push(child, f)
+            stats.generate()
+            self.generated += 1
+            observer.on_generate(child)
+            self._open(node)
+            self._backup(node)
+            stats.lap("expansion", t)
+            stats.sample_frontier(len(self.frontier))
+            if not pending and node not in expanded:
+                expanded.add(node)
+                observer.on_expand(node)
+        return None
@@ -0,0 +1,292 @@
+"""
+Search kernel shared by all search classes. The classes only configure it: frontier
+policy, graph or tree mode, depth limit and iterative deepening, and observe it to
+record their animation frames.
+"""
+from collections import OrderedDict
+from time import monotonic
+
+from algorithms.utils.Frontier import make_frontier
+from algorithms.utils.SearchStats import make_stats
+
+
+class SearchNode:
+    """
+    Search node of graph mode. Same attribute names as TreeNode, so the frontier
+    policies and the engine work on both.
+    """
+    __slots__ = ("name", "parent", "depth", "heuristic", "sum_heuristic", "path_cost", "sum_path_cost")
+
+    def __init__(self, name, heuristic=0, parent=None, path_cost=0):
+        self.name = name
+        self.parent = parent
+        self.heuristic = heuristic
+        self.path_cost = path_cost
+        if parent is None:
+            self.depth = 0
+            self.sum_heuristic = heuristic
+            self.sum_path_cost = path_cost
+        else:
+            self.depth = parent.depth + 1
+            self.sum_heuristic = parent.sum_heuristic + heuristic
+            self.sum_path_cost = parent.sum_path_cost + path_cost
+
+    def __reduce__(self):
+        ## the path from the root as flat list, long paths pickle without deep recursion
+        path = []
+        node = self
+        while node is not None:
+            path.append((node.name, node.heuristic, node.path_cost))
+            node = node.parent
+        return _rebuild_path, (path[::-1],)
+
+
+def _rebuild_path(path):
+    """Restores a node pickled by `SearchNode.__reduce__` with its parents."""
+    node = None
+    for name, heuristic, path_cost in path:
+        node = SearchNode(name, heuristic, node, path_cost)
+    return node
+
+
+class SearchObserver:
+    """Receives the events of a search. The hooks do nothing, subclasses override the ones they need."""
+
+    def on_start(self, root):
+        """The root node was created and pushed."""
+
+    def on_select(self, node):
+        """A node was taken from the frontier, before its goal check."""
+
+    def on_generate(self, node):
+        """A child node was pushed to the frontier."""
+
+    def on_expand(self, node):
+        """All children of a node were generated."""
+
+    def on_goal(self, node):
+        """A goal node was selected, the search ends."""
+
+    def on_restart(self, limit):
+        """Iterative deepening starts a new iteration with a higher limit."""
+
+    def on_drop(self, node):
+        """A memory-bounded search removed a leaf to free memory."""
+
+
+class SearchEngine:
+    """
+    Best first search loop parameterised by the frontier policy and by graph or tree mode.
+
+    Graph mode keeps a reached set, so every state is generated once. With `reopen`
+    it keeps the cheapest node per state instead and generates a state again when a
+    cheaper path to it is found; the outdated frontier entry is skipped when popped.
+    Tree mode generates every successor again, like the textbook tree search. Two
+    opt-in pruning modes keep its semantics while cutting redundant subtrees: "path"
+    drops successors already on the path to their parent (cycles), "table" drops a
+    successor whose state was already generated at equal or lower depth and cost,
+    remembered in a transposition table of at most `table_size` states.
+
+    A `budget` is checked before every expansion. When one of its limits is hit the
+    run ends without a goal, `stopped` holds the reason and `best` the best node so far.
+
+    Attributes:
+        frontier: The frontier of the running (or last) search.
+        reached (set or dict or None): Reached state keys of graph mode, with `reopen` key -> cheapest node.
+        limit (int or None): Current limit on the number of nodes on a path.
+        pruned (int): Successors dropped by the tree mode pruning during the last run.
+        expanded (int): Nodes expanded during the last run, all iterations.
+        generated (int): Nodes generated during the last run, all iterations.
+        stopped (str or None): Why the budget ended the last run, None if it ran to the end.
+        best (node or None): The goal, else the selected node with the lowest heuristic
+            (the cheapest of those; the start node only until another one is selected).
+    """
+
+    def __init__(self, successors, is_goal, policy="fifo", tree=False, reopen=False, limit=None,
+                 iterative=False, max_limit=None, prune=None, table_size=None, make_node=None,
+                 heuristic=None, key=None, observer=None, stats=None, budget=None):
+        """
+        Args:
+            successors (callable): Function state -> iterable of (child state, step cost).
+            is_goal (callable): Function state -> bool.
+            policy (str, optional): Frontier policy, see `make_frontier` (default: "fifo").
+            tree (bool, optional): Tree search instead of graph search (default: False).
+            reopen (bool, optional): Graph mode: generate states again on cheaper paths (default: False).
+            limit (int, optional): Maximum number of nodes on a path, the start node included (default: None).
+            iterative (bool, optional): Repeat the search with limit, limit+1, ... until a goal is found (default: False).
+            max_limit (int, optional): Last limit tried by iterative deepening (default: no bound).
+            prune (str, optional): Tree mode pruning, "path" or "table" (default: None, no pruning).
+            table_size (int, optional): Maximum number of states in the transposition table,
+                the least recently generated one is dropped first (default: no limit).
+            make_node (callable, optional): Function (state, parent, step cost) -> search node (default: SearchNode).
+            heuristic (callable, optional): Function state -> heuristic value for the default nodes (default: 0).
+            key (callable, optional): Function state -> hashable key used for duplicate detection
+                (default: the state itself).
+            observer (SearchObserver, optional): Receives the search events.
+            stats (SearchStats, optional): Counters and timers (default: disabled).
+            budget (Budget, optional): Deadline, expansion and node limits and cancellation (default: no limits).
+        """
+        self._successors = successors
+        self._is_goal = is_goal
+        self.policy = policy
+        self.tree = tree
+        self.reopen = reopen
+        self.limit = 0 if iterative and limit is None else limit
+        self.iterative = iterative
+        self.max_limit = max_limit
+        if prune not in (None, "path", "table"):
+            raise ValueError(f"Unknown pruning mode {prune!r}, use 'path' or 'table'")
+        self.prune = prune
+        self.table_size = table_size
+        self.pruned = 0
+        self.budget = budget
+        self.expanded = self.generated = 0
+        self.stopped = None
+        self.best = None
+        self._started = None
+        self._heuristic = heuristic
+        self._key = key
+        self._make_node = make_node or self._search_node
+        self._observer = observer or SearchObserver()
+        self._stats = stats or make_stats(False)
+        self.frontier = None
+        self.reached = None
+
+    def run(self, start):
+        """
+        Searches from a start state.
+
+        Returns:
+            The goal search node, or None if the frontier ran empty or the budget stopped the run.
+        """
+        self._begin()
+        while True:
+            node = self._run(start)
+            if node is not None or not self.iterative or self.stopped is not None:
+                return node
+            if self.max_limit is not None and self.limit >= self.max_limit:
+                return None  ##a longer path cannot exist, the goal is unreachable
+            self.limit += 1
+            self._observer.on_restart(self.limit)
+
+    def _begin(self):
+        self.pruned = 0
+        self.expanded = self.generated = 0
+        self.stopped = None
+        self.best = None
+        self._started = monotonic()
+
+    def _exhausted(self, nodes):
+        """Whether the budget ends the run, sets `stopped` to the reason."""
+        if self.budget is not None:
+            self.stopped = self.budget.exceeded(self._started, self.expanded, nodes)
+        return self.stopped is not None
+
+    def _track_best(self, node):
+        ## remember the most promising node for a partial result
+        best = self.best
+        if (best is None or best.parent is None
+                or (node.heuristic, node.sum_path_cost) < (best.heuristic, best.sum_path_cost)):
+            self.best = node
+
+    def _search_node(self, state, parent, path_cost):
+        return SearchNode(state, self._heuristic(state) if self._heuristic else 0, parent, path_cost)
+
+    @staticmethod
+    def path(node):
+        """Returns the search nodes from the root to `node`."""
+        path = []
+        while node is not None:
+            path.append(node)
+            node = node.parent
+        return path[::-1]
+
+    def _run(self, start):
+        stats, observer = self._stats, self._observer
+        successors, is_goal, make_node = self._successors, self._is_goal, self._make_node
+        max_depth = None if self.limit is None else self.limit - 1  ##the limit counts nodes, depth counts edges
+        frontier = self.frontier = make_frontier(self.policy)
+        root = make_node(start, None, 0)
+        reopen = self.reopen and not self.tree
+        key = self._key
+        start_key = key(start) if key else start
+        reached = None if self.tree else {start_key: root} if reopen else {start_key}  ##graph mode only
+        self.reached = reached
+        prune = self.prune if self.tree else None
+        if prune == "table":
+            table = OrderedDict({start_key: (0, 0)})  ##state key -> (depth, path cost) it was generated at
+        frontier.push(root)
+        stats.generate()
+        self.generated += 1
+        first = self.generated - 1  ##nodes of earlier iterations are not held any more
+        observer.on_start(root)
+        while frontier:
+            if self.budget is not None and self._exhausted(self.generated - first):
+                return None
+            t = stats.clock()
+            node = frontier.pop()
+            t = stats.lap("frontier", t)
+            node_key = key(node.name) if key else node.name
+            if reopen and reached[node_key] is not node:
+                stats.prune()  ##outdated entry, the state was reached cheaper after it was pushed
+                continue
+            observer.on_select(node)
+            reached_goal = is_goal(node.name)
+            t = stats.lap("goal_check", t)
+            if reached_goal:
+                self.best = node
+                observer.on_goal(node)
+                return node
+            self._track_best(node)
+            stats.expand(node_key)
+            self.expanded += 1
+            depth = node.depth + 1
+            if prune == "path":
+                ## the states on the path, collected along the parent pointers: O(depth) per
+                ## expansion and nothing stored per frontier node
+                on_path = set()
+                ancestor = node
+                while ancestor is not None:
+                    on_path.add(key(ancestor.name) if key else ancestor.name)
+                    ancestor = ancestor.parent
+            for state, step_cost in successors(node.name):
+                state_key = key(state) if key else state
+                if reopen:
+                    known = reached.get(state_key)
+                    if known is not None and known.sum_path_cost <= node.sum_path_cost + step_cost:
+                        stats.prune()
+                        continue
+                elif reached is not None and state_key in reached:
+                    stats.prune()
+                    continue
+                if max_depth is not None and depth > max_depth:
+                    continue
+                if prune == "path":
+                    if state_key in on_path:
+                        self.pruned += 1
+                        stats.prune()
+                        continue
+                elif prune == "table":
+                    cost = node.sum_path_cost + step_cost
+                    known = table.get(state_key)
+                    if known is not None and known[0] <= depth and known[1] <= cost:
+                        self.pruned += 1
+                        stats.prune()
+                        continue
+                    table[state_key] = (depth, cost)
+                    table.move_to_end(state_key)
+                    if self.table_size is not None and len(table) > self.table_size:
+                        table.popitem(last=False)
+                child = make_node(state, node, step_cost)
+                if reopen:
+                    reached[state_key] = child
+                elif reached is not None:
+                    reached.add(state_key)
+                frontier.push(child)
+                stats.generate()
+                self.generated += 1
+                observer.on_generate(child)
+            stats.lap("expansion", t)
+            stats.sample_frontier(len(frontier))
+            observer.on_expand(node)
+        return None
@@ -0,0 +1,137 @@
+"""
+Instrumentation for the search classes: counters, timers and frontier statistics.
+"""
+import json
+from time import perf_counter
+
+
+class SearchStats:
+    """
+    Collects per-search counters and timings.
+
+    Attributes:
+        algorithm (str): Name of the search that produced the stats.
+        generated (int): Nodes put into the frontier (including the start node).
+        expanded (int): Nodes taken from the frontier and expanded.
+        reopened (int): Expansions of a state that had already been expanded before.
+        duplicates_pruned (int): Successors dropped because they were already reached.
+        frontier_peak (int): Largest frontier size seen.
+        timings (dict): Seconds spent in "expansion", "frontier" and "goal_check".
+    """
+    enabled = True
+
+    def __init__(self, algorithm=""):
+        self.algorithm = algorithm
+        self.generated = 0
+        self.expanded = 0
+        self.reopened = 0
+        self.duplicates_pruned = 0
+        self.frontier_peak = 0
+        self._frontier_total = 0
+        self._frontier_samples = 0
+        self._seen = set()  ##states expanded so far, used to detect re-openings
+        self.timings = {"expansion": 0.0, "frontier": 0.0, "goal_check": 0.0}
+
+    @property
+    def frontier_mean(self):
+        """Mean frontier size over all samples."""
+        if not self._frontier_samples:
+            return 0.0
+        return self._frontier_total / self._frontier_samples
+
+    def clock(self):
+        """Returns a timestamp to be passed to `lap`."""
+        return perf_counter()
+
+    def lap(self, phase, since):
+        """
+        Adds the time passed since `since` to a phase and returns a new timestamp.
+
+        Args:
+            phase (str): One of "expansion", "frontier" or "goal_check".
+            since (float): Timestamp returned by `clock` or a previous `lap`.
+        """
+        now = perf_counter()
+        self.timings[phase] += now - since
+        return now
+
+    def generate(self, count=1):
+        """Counts nodes added to the frontier."""
+        self.generated += count
+
+    def expand(self, state):
+        """Counts an expansion and whether the state was expanded before."""
+        self.expanded += 1
+        if state in self._seen:
+            self.reopened += 1
+        else:
+            self._seen.add(state)
+
+    def prune(self, count=1):
+        """Counts successors dropped as duplicates."""
+        self.duplicates_pruned += count
+
+    def sample_frontier(self, size):
+        """Records the current frontier size."""
+        if size > self.frontier_peak:
+            self.frontier_peak = size
+        self._frontier_total += size
+        self._frontier_samples += 1
+
+    def as_dict(self):
+        """Returns the stats as a flat, JSON serialisable dictionary."""
+        return {
+            "algorithm": self.algorithm,
+            "generated": self.generated,
+            "expanded": self.expanded,
+            "reopened": self.reopened,
+            "duplicates_pruned": self.duplicates_pruned,
+            "frontier_peak": self.frontier_peak,
+            "frontier_mean": self.frontier_mean,
+            **{f"time_{phase}": seconds for phase, seconds in self.timings.items()},
+        }
+
+    def export(self, path):
+        """
+        Appends the stats as one JSON line to a file, so repeated runs build up a history.
+
+        Args:
+            path (str): File to append to.
+        """
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(self.as_dict()) + "\n")
+
+    def __repr__(self):
+        return (f"SearchStats({self.algorithm}, generated={self.generated}, "
+                f"expanded={self.expanded}, frontier_peak={self.frontier_peak})")
+
+
+class NullStats(SearchStats):
+    """
+    Stand-in used when instrumentation is disabled. Every hook is a no-op,
+    so the search loops can call them unconditionally.
+    """
+    enabled = False
+
+    def clock(self):
+        return 0.0
+
+    def lap(self, phase, since):
+        return 0.0
+
+    def generate(self, count=1):
+        pass
+
+    def expand(self, state):
+        pass
+
+    def prune(self, count=1):
+        pass
+
+    def sample_frontier(self, size):
+        pass
+
+
+def make_stats(enabled, algorithm=""):
+    """Returns a collecting `SearchStats` if enabled, otherwise a `NullStats`."""
+    return SearchStats(algorithm) if enabled else NullStats(algorithm)
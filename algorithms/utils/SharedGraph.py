@@ -0,0 +1,107 @@
+"""
+Shared memory store for CSRGraphs. The owner publishes a graph once into a
+`multiprocessing.shared_memory` block (in the binary format of GraphFile), worker
+processes attach to the block by name and get a CSRGraph whose arrays are views into
+it: the graph is neither pickled nor copied, memory per worker does not grow with it.
+An attached graph pickles to its block name only, so it can be passed to process pools.
+"""
+import os
+import sys
+from itertools import count
+from multiprocessing import shared_memory
+
+from algorithms.utils.GraphFile import graph_size, write_graph_buffer, graph_from_buffer
+
+_stores = count()  ##store number within the process, part of the block names
+
+
+def _read_only(graph):
+    for array in (graph.offsets, graph.targets, graph.weights, graph.heuristics, graph.coords):
+        if array is not None:
+            array.flags.writeable = False  ##every process sees the block, changes need a new version
+
+
+def attach_graph(name):
+    """
+    Attaches to a published graph.
+
+    On Python < 3.13 the attaching process registers the block with its resource tracker;
+    for processes started by multiprocessing this is the owner's tracker, unrelated
+    processes must not exit before the owner releases the version.
+
+    Args:
+        name (str): Block name returned by `SharedGraphStore.publish`.
+
+    Returns:
+        CSRGraph: Read-only graph backed by the shared block.
+    """
+    if sys.version_info >= (3, 13):
+        block = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        block = shared_memory.SharedMemory(name=name)
+    graph = graph_from_buffer(block.buf, name)
+    _read_only(graph)
+    graph.shared_name = name
+    graph._block = block  ##keeps the mapping alive as long as the graph
+    return graph
+
+
+def detach_graph(graph):
+    """Unmaps the block of an attached graph, the graph must not be used afterwards."""
+    block = graph._block
+    graph.names = graph.offsets = graph.targets = graph.weights = graph.heuristics = graph.coords = None
+    graph._block = None
+    block.close()
+
+
+class SharedGraphStore:
+    """
+    Owner side of the shared graphs: creates one block per published version and
+    removes it on release. Use it as context manager to release all versions on exit.
+
+    Attributes:
+        prefix (str): Prefix of the block names.
+        versions (dict): Block name -> SharedMemory of the published versions.
+        current (str or None): Name of the latest published version.
+    """
+
+    def __init__(self, prefix=None):
+        self.prefix = prefix or f"aiml-{os.getpid()}-{next(_stores)}"
+        self.versions = {}
+        self.current = None
+        self._version = 0
+
+    def publish(self, graph):
+        """
+        Copies a CSRGraph into a new shared block. Earlier versions stay attached and
+        valid until they are released, so workers can finish on the version they started with.
+
+        Returns:
+            str: The block name workers pass to `attach_graph`.
+        """
+        self._version += 1
+        name = f"{self.prefix}-v{self._version}"
+        block = shared_memory.SharedMemory(name=name, create=True, size=max(graph_size(graph), 1))
+        write_graph_buffer(graph, block.buf)
+        self.versions[name] = block
+        self.current = name
+        return name
+
+    def release(self, name):
+        """Removes a version. Processes still attached keep their mapping until they detach."""
+        block = self.versions.pop(name)
+        block.close()
+        block.unlink()
+        if name == self.current:
+            self.current = None
+
+    def close(self):
+        """Releases every version."""
+        for name in list(self.versions):
+            self.release(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
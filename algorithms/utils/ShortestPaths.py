@@ -0,0 +1,83 @@
+"""
+Uniform cost search (Dijkstra) on a CSRGraph. One run from a source yields the whole
+shortest path tree as distance and predecessor arrays, so distance queries to any
+number of targets are answered by array lookups instead of one search per target.
+"""
+import heapq
+import math
+
+import numpy as np
+
+
+def shortest_path_tree(graph, source, goal=None):
+    """
+    Runs a heap based uniform cost search from `source`.
+
+    Args:
+        graph (CSRGraph): The graph, step costs must not be negative.
+        source (str): Name of the start node.
+        goal (str, optional): Stop as soon as this node is settled (default: run until every reachable node is settled).
+
+    Returns:
+        tuple: (dist, pred) arrays indexed by node number. dist holds the cost of the cheapest path
+        from the source (inf if not settled), pred the previous node on that path (-1 for the
+        source and for nodes that were not settled).
+    """
+    n = graph.number_of_nodes()
+    start = graph.index(source)
+    target = graph.index(goal) if goal is not None else -1
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    if goal is None:
+        ## every reachable edge is visited, plain lists are indexed faster than numpy arrays
+        offsets, targets, weights = offsets.tolist(), targets.tolist(), weights.tolist()
+    dist = [math.inf] * n
+    pred = [-1] * n
+    settled = bytearray(n)
+    dist[start] = 0.0
+    heap = [(0.0, start)]
+    while heap:
+        cost, node = heapq.heappop(heap)
+        if settled[node]:
+            continue  ##outdated heap entry, the node was reached cheaper
+        settled[node] = 1
+        if node == target:
+            break
+        start_edge, end_edge = offsets[node], offsets[node + 1]
+        children, step_costs = targets[start_edge:end_edge], weights[start_edge:end_edge]
+        if goal is not None:
+            children, step_costs = children.tolist(), step_costs.tolist()
+        for child, step_cost in zip(children, step_costs):
+            new_cost = cost + step_cost
+            if new_cost < dist[child]:
+                dist[child] = new_cost
+                pred[child] = node
+                heapq.heappush(heap, (new_cost, child))
+    dist = np.array(dist)
+    pred = np.array(pred, dtype=np.int32)
+    unsettled = ~np.frombuffer(bytes(settled), dtype=bool)
+    dist[unsettled] = math.inf  ##tentative costs of an early stop are not final
+    pred[unsettled] = -1
+    return dist, pred
+
+
+def tree_path(graph, dist, pred, target):
+    """
+    Follows the predecessor array of `shortest_path_tree` back from a node.
+
+    Args:
+        graph (CSRGraph): The graph the tree was computed on.
+        dist (np.ndarray): Distance array.
+        pred (np.ndarray): Predecessor array.
+        target (str): Name of the node to reach.
+
+    Returns:
+        list: Node names from the source to `target`, empty if the target was not reached.
+    """
+    node = graph.index(target)
+    if math.isinf(dist[node]):
+        return []
+    path = [node]
+    while pred[node] >= 0:
+        node = int(pred[node])
+        path.append(node)
+    return [graph.names[node] for node in reversed(path)]
@@ -0,0 +1,241 @@
+"""
+Trace files: the animation frames of a search written to disk while it runs, so a
+search can be replayed after the process that ran it is gone.
+
+Layout (little endian):
+    header    16 bytes: magic, version, keyframe interval
+    records   per frame: uint32 length, uint8 kind, data: a keyframe is the zlib data
+              of the pickled frame, a delta frame is a sequence of pieces (uint32 length, zlib data)
+    context   pickled (search class, search state without frames), zlib compressed
+    index     uint64[frames] record offsets
+    trailer   24 bytes: context offset, frame count, end magic
+
+Every `keyframe` frames one is compressed on its own, the frames in between are
+compressed with the keyframe as preset dictionary: consecutive frames differ in a few
+node attributes, so they shrink to little more than their differences, and frame N
+is read back with at most two decompressions. zlib only looks 32 KB back, so large
+frames are compressed in pieces of PIECE bytes, each with the part of the keyframe
+around the same offset as dictionary; differences in length up to SLACK bytes
+between the frame and its keyframe still find their match. The file is only appended to; a trace
+without trailer (the search was killed) is indexed by scanning its records.
+"""
+import os
+import pickle
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC = b"AIMLTRC\0"
+END_MAGIC = b"AIMLEND\0"
+VERSION = 2
+HEADER = struct.Struct("<8sII")  ##magic, version, keyframe interval
+RECORD = struct.Struct("<IB")  ##compressed length, kind
+TRAILER = struct.Struct("<QQ8s")  ##context offset, frame count, end magic
+PIECE_LENGTH = struct.Struct("<I")
+KEYFRAME, DELTA = 0, 1
+WINDOW = 32768  ##zlib looks back at most this far into the preset dictionary
+PIECE = WINDOW // 2  ##bytes of a delta frame compressed with one dictionary
+SLACK = WINDOW // 4  ##the dictionary of a piece starts this far before its offset
+
+
+def _dictionary(key, start):
+    """The part of the keyframe data used as preset dictionary of the piece at `start`."""
+    begin = max(start - SLACK, 0)
+    return key[begin:begin + WINDOW]
+
+
+class TraceWriter:
+    """
+    Appends frames to a trace file. The search classes use it in place of their frame
+    list when they are given a `trace` path.
+
+    Attributes:
+        path (str): The trace file.
+        keyframe (int): Frames per keyframe.
+    """
+
+    def __init__(self, path, keyframe=16, level=6):
+        """
+        Args:
+            path (str): The trace file, overwritten if it exists.
+            keyframe (int, optional): Frames per keyframe, higher is smaller and slower to seek (default: 16).
+            level (int, optional): zlib compression level (default: 6).
+        """
+        self.path = path
+        self.keyframe = keyframe
+        self.level = level
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, keyframe))
+        self._offsets = []
+        self._key = b""
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def append(self, frame):
+        """Pickles, compresses and writes a frame."""
+        data = pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(self._offsets) % self.keyframe == 0:
+            kind, packed = KEYFRAME, zlib.compress(data, self.level)
+            self._key = data
+        else:
+            pieces = []
+            for start in range(0, len(data), PIECE):
+                compressor = zlib.compressobj(self.level, zdict=_dictionary(self._key, start))
+                piece = compressor.compress(data[start:start + PIECE]) + compressor.flush()
+                pieces += [PIECE_LENGTH.pack(len(piece)), piece]
+            kind, packed = DELTA, b"".join(pieces)
+        self._offsets.append(self._file.tell())
+        self._file.write(RECORD.pack(len(packed), kind))
+        self._file.write(packed)
+
+    def close(self, context=None):
+        """
+        Writes the context record, the index and the trailer and closes the file.
+
+        Args:
+            context (optional): Picklable object needed to replay the frames, e.g. see `save_search`.
+        """
+        if self._file is None:
+            return
+        context_offset = self._file.tell()
+        packed = zlib.compress(pickle.dumps(context, protocol=pickle.HIGHEST_PROTOCOL), self.level)
+        self._file.write(RECORD.pack(len(packed), KEYFRAME))
+        self._file.write(packed)
+        self._file.write(np.asarray(self._offsets, dtype="<u8").tobytes())
+        self._file.write(TRAILER.pack(context_offset, len(self._offsets), END_MAGIC))
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TraceReader:
+    """
+    Read-only sequence of the frames of a trace file. Frames are decompressed on access,
+    only the index and the last keyframe are kept in memory.
+
+    Attributes:
+        path (str): The trace file.
+        keyframe (int): Frames per keyframe.
+        complete (bool): Whether the trace was closed; False for traces of killed searches.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        magic, version, self.keyframe = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a trace file")
+        if version != VERSION:
+            raise ValueError(f"{path} has trace format version {version}, expected {VERSION}")
+        size = os.fstat(self._file.fileno()).st_size
+        self._context_offset = None
+        self.complete = False
+        if size >= HEADER.size + TRAILER.size:
+            self._file.seek(size - TRAILER.size)
+            context_offset, count, end = TRAILER.unpack(self._file.read(TRAILER.size))
+            if end == END_MAGIC:
+                self._file.seek(size - TRAILER.size - 8 * count)
+                self._offsets = np.frombuffer(self._file.read(8 * count), dtype="<u8")
+                self._context_offset = context_offset
+                self.complete = True
+        if not self.complete:
+            self._offsets = self._scan(size)
+        self._key = (None, None)  ##(keyframe number, raw keyframe data)
+
+    def _scan(self, size):
+        ## index the complete records of a trace that was not closed
+        offsets, offset = [], HEADER.size
+        while offset + RECORD.size <= size:
+            self._file.seek(offset)
+            length, _ = RECORD.unpack(self._file.read(RECORD.size))
+            if offset + RECORD.size + length > size:
+                break  ##the last record was cut off
+            offsets.append(offset)
+            offset += RECORD.size + length
+        return np.asarray(offsets, dtype="<u8")
+
+    def _record(self, offset):
+        self._file.seek(int(offset))
+        length, kind = RECORD.unpack(self._file.read(RECORD.size))
+        return kind, self._file.read(length)
+
+    def _raw(self, index):
+        kind, packed = self._record(self._offsets[index])
+        if kind == KEYFRAME:
+            data = zlib.decompress(packed)
+            self._key = (index, data)
+            return data
+        key = index - index % self.keyframe
+        if self._key[0] != key:
+            self._raw(key)
+        pieces, position = [], 0
+        while position < len(packed):
+            (length,), position = PIECE_LENGTH.unpack_from(packed, position), position + PIECE_LENGTH.size
+            decompressor = zlib.decompressobj(zdict=_dictionary(self._key[1], PIECE * len(pieces)))
+            pieces.append(decompressor.decompress(packed[position:position + length]) + decompressor.flush())
+            position += length
+        return b"".join(pieces)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("trace frame index out of range")
+        return pickle.loads(self._raw(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def context(self):
+        """Returns the context object written by `TraceWriter.close`, None for incomplete traces."""
+        if self._context_offset is None:
+            return None
+        return pickle.loads(zlib.decompress(self._record(self._context_offset)[1]))
+
+    def close(self):
+        self._file.close()
+
+    def __reduce__(self):
+        ## worker processes open the file themselves
+        return TraceReader, (self.path,)
+
+
+def save_search(search):
+    """
+    Returns the replay context of a search class: its class and its state without the
+    frames and the search engine, which refers back to the search as its observer.
+    """
+    return type(search), {name: value for name, value in vars(search).items() if name not in ("_frames", "_engine")}
+
+
+def open_trace(path):
+    """
+    Opens the trace of a search class for replay: returns the search object with its
+    frames read lazily from the file, so `visualise` and `export` work as after the search.
+
+    Args:
+        path (str): Trace file written by a search class with `trace=path`.
+
+    Returns:
+        The search class instance.
+    """
+    frames = TraceReader(path)
+    context = frames.context()
+    if context is None:
+        raise ValueError(f"{path} was not closed, its frames can be read with TraceReader")
+    cls, state = context
+    search = cls.__new__(cls)
+    search.__dict__.update(state)
+    search._frames = frames
+    return search
@@ -1,4 +1,7 @@
 ## Author: Mrchlnglo
+import warnings
+
+
 class TreeNode:
     """
     A class representing a node in a tree structure, with support for parent-child relationships,
@@ -6,11 +9,11 @@ class TreeNode:
 
     Attributes:
         name (str): The name of the node.
-        _id (int): A unique identifier for the node.
+        _id (int): Identifier of the node, unique within its search.
         _occupied (bool): Indicates whether the node is occupied.
         _explored (bool): Indicates whether the node has been explored.
         step (int): indicates when the node was explored
-        _neighbors (list): A list of neighboring nodes.
+        depth (int): Number of edges from the root to this node.
         heuristic (float): The heuristic value of the node.
         sum_heuristic (float): The cumulative heuristic value from root to this node.
         children (list): A list of child nodes.
@@ -18,40 +21,41 @@ class TreeNode:
         edge_color (str): The color of the edge connecting to the parent.
         path_cost (float): The cost associated with the edge to the parent.
         sum_path_cost (float): The cumulative path cost from root to this node.
-
-    Class Attributes:
-        node_counter (int): A counter to assign unique IDs to each node.
     """
-    node_counter = 0  # Class-level counter for unique node IDs
 
-    def __init__(self, name, heuristic=0, neighbors=None, parent=None, edge_color="black", path_cost=0, frontier=False):
+    def __init__(self, name, heuristic=0, neighbors=None, parent=None, edge_color="black", path_cost=0, frontier=False,
+                 node_id=0):
         """
         Initializes a TreeNode with given attributes.
 
         Args:
             name (str): The name of the node.
             heuristic (float): The heuristic value of the node.
-            neighbors (list, optional): A list of neighboring nodes (default: None).
+            neighbors (list, optional): Deprecated and ignored, the searches take the successors
+                from their successor tables. Kept so positional arguments after it still match.
             parent (TreeNode, optional): The parent node (default: None).
             edge_color (str, optional): The color of the edge connecting to the parent (default: "black").
             path_cost (float, optional): The cost associated with the edge to the parent (default: 0).
+            node_id (int, optional): Identifier assigned by the search that creates the node (default: 0).
         """
+        if neighbors is not None:
+            warnings.warn("TreeNode ignores `neighbors`, the argument will be removed", DeprecationWarning,
+                          stacklevel=2)
         self.name = name
-        self._id = TreeNode.node_counter  # Assign a unique ID
-        TreeNode.node_counter += 1  # Increment ID counter
+        self._id = node_id  # Unique within the search, no shared counter between searches
 
         self._occupied = False  # Track if the node is occupied
         self._explored = False  # Track if the node is explored
         self._frontier = frontier #Treck if in frontier
         self.step = ""  # Step description
         self.start = False
-        self._neighbors = neighbors if neighbors is not None else []  # Store neighbors
 
         self.heuristic = heuristic
         self.sum_heuristic = heuristic  # Will be updated if a parent exists
 
         self.children = []  # List of child nodes
         self.parent = parent  # Reference to parent node
+        self.depth = 0  # Will be updated if a parent exists
 
         self.edge_color = edge_color  # Edge color
         self.path_cost = path_cost  # Path cost
@@ -74,6 +78,7 @@ class TreeNode:
         child.path_cost = path_cost
         child.sum_heuristic = self.sum_heuristic + child.heuristic
         child.sum_path_cost = self.sum_path_cost + path_cost
+        child.depth = self.depth + 1
         self.children.append(child)
 
     def toggle_occupied(self):
@@ -101,9 +106,39 @@ class TreeNode:
         """
         self.step = step
 
-    def reset_id(self):
-        TreeNode.node_counter = 0
+    def __reduce__(self):
+        """
+        Pickles (and deep-copies) the whole tree of the node as flat records, parents first,
+        so trees of any depth are copied without one level of recursion per node.
+        """
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        nodes, stack = [], [root]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(reversed(node.children))
+        position = {id(node): i for i, node in enumerate(nodes)}
+        records = [(type(node), -1 if node.parent is None else position[id(node.parent)],
+                    {key: value for key, value in vars(node).items() if key not in ("parent", "children")})
+                   for node in nodes]
+        return _rebuild_tree, (records, position[id(self)])
 
     def __repr__(self):
         """Returns a string representation of the node."""
         return f"TreeNode({self.name}, h={self.heuristic}, sum_h={self.sum_heuristic})"
+
+
+def _rebuild_tree(records, index):
+    """Restores a tree pickled by `TreeNode.__reduce__` and returns its node number `index`."""
+    nodes = []
+    for cls, parent, state in records:
+        node = cls.__new__(cls)
+        node.__dict__.update(state)
+        node.children = []
+        node.parent = nodes[parent] if parent >= 0 else None
+        if node.parent is not None:
+            node.parent.children.append(node)
+        nodes.append(node)
+    return nodes[index]
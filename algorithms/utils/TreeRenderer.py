@@ -0,0 +1,316 @@
+"""
+Incremental renderer for the search tree animations.
+"""
+import networkx as nx
+from matplotlib.collections import LineCollection
+
+
+def tree_node_color(node):
+    """Maps the search flags of a TreeNode to its fill colour."""
+    if node.start:
+        return "yellow"
+    if node._occupied:
+        return "green"
+    if node._explored:
+        return "lightgreen"
+    if getattr(node, "_frontier", False):
+        return "pink"
+    return "lightblue"
+
+
+def collect_tree(root):
+    """Returns a dictionary id -> TreeNode of all nodes below (and including) root."""
+    nodes = {}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        nodes[node._id] = node
+        stack.extend(node.children)
+    return nodes
+
+
+def tidy_layout(root):
+    """
+    Hierarchical layout without graphviz: leaves are placed left to right in
+    depth first order, parents are centred above their children.
+
+    Returns:
+        dict: TreeNode id -> (x, y) position.
+    """
+    pos = {}
+    next_leaf = 0
+    stack = [(root, 0, False)]
+    while stack:
+        node, depth, children_done = stack.pop()
+        if not node.children:
+            pos[node._id] = (float(next_leaf), -float(depth))
+            next_leaf += 1
+        elif children_done:
+            xs = [pos[child._id][0] for child in node.children]
+            pos[node._id] = ((min(xs) + max(xs)) / 2, -float(depth))
+        else:
+            stack.append((node, depth, True))
+            for child in reversed(node.children):
+                stack.append((child, depth + 1, False))
+    return pos
+
+
+def tree_layout(root):
+    """Lays out a search tree with graphviz dot if available, otherwise with `tidy_layout`."""
+    try:
+        G = nx.DiGraph()
+        G.add_node(root._id)
+        for node in collect_tree(root).values():
+            for child in node.children:
+                G.add_edge(node._id, child._id)
+        return nx.nx_agraph.graphviz_layout(G, prog="dot")  # Needs pygraphviz
+    except ImportError:
+        return tidy_layout(root)
+
+
+def place_new_nodes(pos, nodes):
+    """
+    Gives the nodes without position one below their parent, right of the rightmost
+    node of their level, so a grown tree is drawn without laying it out again.
+
+    Args:
+        pos (dict): TreeNode id -> (x, y), extended in place.
+        nodes (dict): TreeNode id -> TreeNode, parents before children.
+    """
+    new = [node for node_id, node in nodes.items() if node_id not in pos]
+    if not new:
+        return
+    ## level distance of the layout, used as horizontal spacing too
+    step = next((pos[node._id][1] - pos[child._id][1] for node in nodes.values() if node._id in pos
+                 for child in node.children if child._id in pos), 1.0) or 1.0
+    rightmost = {}
+    for x, y in pos.values():
+        rightmost[y] = max(x, rightmost.get(y, x))
+    for node in new:
+        parent_x, parent_y = pos[node.parent._id]
+        y = parent_y - step
+        x = max(parent_x, rightmost[y] + step) if y in rightmost else parent_x
+        pos[node._id] = (x, y)
+        rightmost[y] = x
+
+
+class TreeSegments:
+    """
+    Splits the frames of a tree search into segments in which every tree extends the
+    previous one; a tree that does not (IDS restarts its tree) starts a new segment.
+
+    Attributes:
+        segment_of (list): Index of the segment of every frame.
+        roots (list): The last root of every segment, None for segments left out by `part`.
+    """
+
+    def __init__(self, roots=()):
+        self.segment_of = []
+        self.roots = []
+        self._shape = None
+        for root in roots:
+            self.add(root)
+
+    def add(self, root):
+        """Appends a frame to the segments."""
+        shape = {node_id: (node.name, node.parent._id if node.parent else None)
+                 for node_id, node in collect_tree(root).items()}
+        previous = self._shape
+        if previous is None or any(shape.get(node_id) != value for node_id, value in previous.items()):
+            self.roots.append(root)  ##tree does not extend the previous one, start a new segment
+        elif len(shape) > len(previous):
+            self.roots[-1] = root  ##the segment grew, `TreeRenderer.update` places the new nodes
+        self.segment_of.append(len(self.roots) - 1)
+        self._shape = shape
+
+    def part(self, start, stop):
+        """
+        Returns the segments of the frames start to stop, numbered from 0, with only the
+        roots of their own segments: all a renderer of just these frames needs.
+        """
+        part = TreeSegments()
+        part.segment_of = self.segment_of[start:stop]
+        used = set(part.segment_of)
+        part.roots = [root if segment in used else None for segment, root in enumerate(self.roots)]
+        return part
+
+
+class TreeRenderer:
+    """
+    Draws the frames of a tree search at stable positions.
+
+    The frames are split into segments in which every tree extends the previous one
+    (IDS restarts its tree and starts a new segment). Each segment is laid out once,
+    from its last and therefore largest tree. The artists for that tree are created
+    once per segment; per frame only the nodes and edges that exist at that step are
+    shown, and colours and changed label texts are updated. Segments are looked up by
+    frame position, so frames loaded again from a trace file find theirs as well:
+    `update` draws the frame after the previous one unless `seek` sets the position.
+    A frame after the known ones (the live view) is added to the segments when it is
+    drawn. The new nodes of a growing segment are placed below their parents and get
+    their artists added; the segment is laid out and built again only when it has twice
+    the nodes of its last layout, so a live search is laid out O(log n) times.
+
+    Attributes:
+        _segments (TreeSegments): The segment of every frame and the last root of every segment.
+        _layouts (dict): Segment -> (positions, number of nodes of its last full layout).
+    """
+
+    def __init__(self, ax, roots, node_label, captions=(), node_size=2000, segments=None):
+        """
+        Splits the frames into segments and draws the first one.
+
+        Args:
+            ax (matplotlib.axes.Axes): The axes to draw on.
+            roots (iterable): The root TreeNode of every frame, in order, read once.
+            node_label (callable): Function TreeNode -> label text.
+            captions (iterable, optional): (x, y) positions in axes coordinates of text boxes updated per frame.
+            node_size (int, optional): Size of the drawn nodes (default: 2000).
+            segments (TreeSegments, optional): The segments of the frames, split beforehand; `roots` is not read then.
+        """
+        self._ax = ax
+        self._node_label = node_label
+        self._node_size = node_size
+        self._segments = TreeSegments(roots) if segments is None else segments
+        self._layouts = {}
+        self._position = 0
+        self._segment = None
+        self._built = None
+        self._tree_artists = []
+        self._caption_artists = [
+            ax.text(x, y, "", transform=ax.transAxes, horizontalalignment="center", fontsize=10,
+                    bbox=dict(facecolor="white", alpha=0.5))
+            for x, y in captions
+        ]
+        ax.set_axis_off()
+        if self._segments.segment_of:
+            self._build(self._segments.segment_of[0])
+
+    def _build(self, segment):
+        """Replaces the tree artists with the ones of another segment."""
+        for artist in self._tree_artists:
+            artist.remove()
+        root = self._segments.roots[segment]
+        nodes = collect_tree(root)
+        pos = self._layout(segment, root, nodes)
+        G = nx.DiGraph()
+        G.add_nodes_from(nodes)
+        self._edges = [(node._id, child._id) for node in nodes.values() for child in node.children]
+        G.add_edges_from(self._edges)
+        self._ids = list(nodes)
+        ax = self._ax
+        self._node_artist = nx.draw_networkx_nodes(G, pos, nodelist=self._ids, node_size=self._node_size,
+                                                   node_color="lightblue", ax=ax)
+        ## one collection for all edges, also when the tree has no edges yet
+        self._edge_artist = LineCollection([(pos[parent], pos[child]) for parent, child in self._edges],
+                                           colors="black", zorder=1)
+        ax.add_collection(self._edge_artist)
+        self._edge_label_artists = nx.draw_networkx_edge_labels(
+            G, pos, edge_labels={(parent, child): nodes[child].path_cost for parent, child in self._edges},
+            font_size=9, label_pos=0.5, ax=ax)
+        self._labels = {node_id: "" for node_id in self._ids}
+        self._label_artists = nx.draw_networkx_labels(G, pos, labels=self._labels,
+                                                      font_weight="bold", font_size=10, ax=ax)
+        self._fit(pos)
+        self._tree_artists = [self._node_artist, self._edge_artist,
+                              *self._edge_label_artists.values(), *self._label_artists.values()]
+        self._segment = segment
+        self._built = root
+
+    def _layout(self, segment, root, nodes):
+        """Returns the positions of a segment, laid out again once it doubled since its last layout."""
+        pos, laid_out = self._layouts.get(segment, (None, 0))
+        if pos is None or len(nodes) >= 2 * laid_out:
+            pos, laid_out = tree_layout(root), len(nodes)
+        else:
+            place_new_nodes(pos, nodes)
+        self._layouts[segment] = (pos, laid_out)
+        return pos
+
+    def _extend(self, segment):
+        """Adds the artists of the nodes a built segment gained, or builds it again after a new layout."""
+        root = self._segments.roots[segment]
+        nodes = collect_tree(root)
+        _, laid_out = self._layouts[segment]
+        if len(nodes) >= 2 * laid_out:
+            self._build(segment)
+            return
+        pos = self._layout(segment, root, nodes)
+        known = set(self._ids)
+        new = [node_id for node_id in nodes if node_id not in known]
+        edges = [(nodes[node_id].parent._id, node_id) for node_id in new]
+        self._ids.extend(new)
+        self._edges.extend(edges)
+        self._node_artist.set_offsets([pos[node_id] for node_id in self._ids])
+        self._edge_artist.set_segments([(pos[parent], pos[child]) for parent, child in self._edges])
+        G = nx.DiGraph()
+        G.add_nodes_from(new)
+        G.add_edges_from(edges)
+        edge_label_artists = nx.draw_networkx_edge_labels(
+            G, pos, edge_labels={(parent, child): nodes[child].path_cost for parent, child in edges},
+            font_size=9, label_pos=0.5, ax=self._ax)
+        self._labels.update((node_id, "") for node_id in new)
+        label_artists = nx.draw_networkx_labels(G, pos, labels={node_id: "" for node_id in new},
+                                                font_weight="bold", font_size=10, ax=self._ax)
+        self._edge_label_artists.update(edge_label_artists)
+        self._label_artists.update(label_artists)
+        self._tree_artists.extend([*edge_label_artists.values(), *label_artists.values()])
+        self._fit(pos)
+        self._built = root
+
+    def _fit(self, pos):
+        xs = [x for x, _ in pos.values()]
+        ys = [y for _, y in pos.values()]
+        margin_x = max((max(xs) - min(xs)) * 0.1, 1.0)
+        margin_y = max((max(ys) - min(ys)) * 0.15, 1.0)
+        self._ax.set_xlim(min(xs) - margin_x, max(xs) + margin_x)
+        self._ax.set_ylim(min(ys) - margin_y, max(ys) + margin_y)
+
+    def artists(self):
+        """Returns every artist that can change between frames."""
+        return [*self._tree_artists, *self._caption_artists]
+
+    def seek(self, index):
+        """Sets the position of the frame drawn by the next `update`."""
+        self._position = index
+
+    def update(self, root, captions=()):
+        """
+        Updates the artists to show a frame.
+
+        Args:
+            root (TreeNode): Root of the search tree snapshot.
+            captions (iterable, optional): Texts for the caption boxes, in order.
+
+        Returns:
+            list: The dynamic artists, to be redrawn by the animation.
+        """
+        if self._position == len(self._segments.segment_of):
+            self._segments.add(root)  ##a frame that was not known in advance
+        segment = self._segments.segment_of[self._position]
+        self._position += 1
+        if segment != self._segment:
+            self._build(segment)
+        elif self._segments.roots[segment] is not self._built:
+            self._extend(segment)
+        nodes = collect_tree(root)
+        self._node_artist.set_sizes([self._node_size if node_id in nodes else 0 for node_id in self._ids])
+        self._node_artist.set_facecolor([tree_node_color(nodes[node_id]) if node_id in nodes else "none"
+                                         for node_id in self._ids])
+        self._edge_artist.set_color([nodes[child].edge_color if child in nodes else "none"
+                                     for _, child in self._edges])
+        for edge, artist in self._edge_label_artists.items():
+            artist.set_visible(edge[1] in nodes)
+        for node_id in self._ids:
+            artist = self._label_artists[node_id]
+            if node_id not in nodes:
+                artist.set_visible(False)
+                continue
+            label = self._node_label(nodes[node_id])
+            if label != self._labels[node_id]:  ##only touch labels whose text changed
+                self._labels[node_id] = label
+                artist.set_text(label)
+            artist.set_visible(True)
+        for artist, caption in zip(self._caption_artists, captions):
+            artist.set_text(caption)
+        return self.artists()
@@ -0,0 +1,309 @@
+"""
+Base class of the tree search classes: runs the SearchEngine in tree mode, builds the
+search tree out of TreeNodes and records the animation frames.
+"""
+import copy
+from functools import partial
+import networkx as nx
+from algorithms.utils.TreeNode import TreeNode
+from algorithms.utils.SearchEngine import SearchEngine, SearchObserver
+from algorithms.utils.SearchStats import make_stats
+from algorithms.utils.Problem import Solution
+from algorithms.utils.UnionFind import UnionFind
+from algorithms.utils.TreeRenderer import TreeRenderer, TreeSegments
+from algorithms.utils.Animation import FramePipe, show_animation, show_live, export_animation
+from algorithms.utils.Trace import TraceWriter, TraceReader, save_search
+
+
+class TreeSearch(SearchObserver):
+    """
+    A tree search configured by class attributes. Subclasses set the frontier policy
+    and override the drawing hooks (`_node_label`, `_draw_frame`) where they differ.
+
+    Class Attributes:
+        algorithm (str): Name used for the SearchStats.
+        policy (str): Frontier policy, see `make_frontier`.
+        problem_policy (str or None): Frontier policy of `solve`, None for `policy`.
+        iterative (bool): Iterative deepening, the limit starts at 0 and grows by one per iteration.
+        directed (bool): Follow edges only from node1 to node2.
+        frame_on_select (bool): Record a frame when a node is selected instead of after its expansion.
+        interval (int): Delay between animation frames in ms.
+        captions (tuple): Positions of the caption boxes drawn by `_draw_frame`, in axes coordinates.
+
+    Attributes:
+        _graph (nx.Graph): The graph the search tree is generated from.
+        _components (UnionFind): Connected components of the graph, updated per added edge.
+        _successors_of (dict): State -> tuple of (child state, step cost), built once from the graph.
+        _root (TreeNode): Root of the search tree.
+        _frames (list or TraceReader): (search tree copy, frontier states, limit) per recorded step.
+        _path (list): Ids of the TreeNodes on the solution path, from the root to the goal.
+        _end_leaf (TreeNode or None): The goal node of the solution.
+    """
+    algorithm = "TreeSearch"
+    policy = "fifo"
+    problem_policy = None
+    iterative = False
+    directed = False
+    frame_on_select = False
+    interval = 1000
+    captions = ()
+
+    def __init__(self, nodes, edges: tuple,
+                 start_node: str = "a",
+                 end_node: str = "h",
+                 limit=None,
+                 stats: bool = False,
+                 show: bool = True,
+                 prune: str = None,
+                 table_size: int = None,
+                 budget=None,
+                 trace: str = None,
+                 live: bool = False):
+        """
+        Args:
+            nodes (list or dict): Node names, for informed searches mapped to their heuristic.
+            edges (tuple): Edges (node1, node2, stepcost).
+            start_node (str, optional): The starting node (default: "a").
+            end_node (str, optional): The goal node (default: "h").
+            limit (int, optional): Maximum number of nodes on a path (default: no limit).
+            stats (bool, optional): Collect SearchStats for the search (default: False).
+            show (bool, optional): Open the animation after the search (default: True).
+            prune (str, optional): "path" drops successors that close a cycle on their path, "table"
+                drops successors already generated at equal or lower depth and cost (default: None).
+            table_size (int, optional): Maximum number of states kept by the "table" pruning (default: no limit).
+            budget (Budget, optional): Deadline, expansion and node limits and cancellation token;
+                a search stopped by it keeps the frames recorded so far (default: no limits).
+            trace (str, optional): Write the frames to this trace file while searching instead of
+                keeping them in memory; `open_trace` replays it later (default: None).
+            live (bool, optional): Run the search in a background thread and show the frames while
+                they are recorded, instead of after the search; `show` is ignored. Drawn frames are
+                not kept unless `trace` is given (default: False).
+        """
+        self._end_node = end_node
+        self._stats = make_stats(stats, self.algorithm) ##counters and timers, no-op unless enabled
+        self._end_leaf = None
+        self._root = None
+        self._step = 0
+        self._next_id = 0 ##node ids are numbered per search, restarted with each deepening iteration
+        self._graph = nx.DiGraph() if self.directed else nx.Graph()
+        self._components = UnionFind()
+        self._fill_graph(edges, nodes)
+        self._successors_of = self._successor_table()
+        self._engine = self._make_engine(limit, prune, table_size, budget)
+        self._limit = self._engine.limit
+        writer = TraceWriter(trace) if trace else None
+        if live:
+            self._frames = FramePipe(sink=writer) ##frames go to the window (and the trace) while searching
+        elif writer is not None:
+            self._frames = writer
+        else:
+            self._frames = []
+        self._path = [] ##safe solution
+        if live:
+            show_live(self, partial(self._search, start_node, end_node), interval=self.interval)
+        else:
+            self._search(start_node, end_node)
+        if writer is not None:
+            writer.close(save_search(self))
+            self._frames = TraceReader(trace) ##replayed from the file, frames are loaded on access
+        elif live:
+            self._frames = [] ##the drawn frames are gone
+        self._get_path_cost()
+        if show and not live: ##open the animation window, use export() instead on headless machines
+            self.visualise()
+
+    def _search(self, start_node, goal):
+        if goal is not None and not self._reachable(start_node, goal):
+            ## different components, answer without searching
+            root = self._make_node(start_node, None, 0)
+            self.on_start(root)
+            self._frames.append(self._snapshot(root))
+            self._solution = Solution(None, self._stats)
+            return
+        ## a path cannot hold more nodes than the component of the start node
+        self._engine.max_limit = self._components.size(start_node)
+        self._solution = Solution.of(self._engine, self._engine.run(start_node), self._stats)
+        if self._engine.stopped is not None:
+            print("The search was stopped early: ", self._engine.stopped)
+
+    def _make_engine(self, limit, prune, table_size, budget):
+        return SearchEngine(self._successors, self._is_goal, policy=self.policy, tree=True,
+                            limit=limit, iterative=self.iterative, prune=prune, table_size=table_size,
+                            make_node=self._make_node, observer=self, stats=self._stats, budget=budget)
+
+    def _reachable(self, start_node, goal):
+        return start_node == goal or self._components.connected(start_node, goal)
+
+    def _add_edge(self, node1, node2, **attributes):
+        self._graph.add_edge(node1, node2, **attributes)
+        self._components.union(node1, node2)
+
+    def _is_goal(self, node):
+        return node == self._end_node
+
+    def _successor_table(self):
+        ## one immutable (child, step cost) row per state, shared by every expansion of the state
+        return {node: tuple((child, data["stepcost"]) for child, data in self._graph.adj[node].items())
+                for node in self._graph}
+
+    def _successors(self, node):
+        return self._successors_of[node]
+
+    def _make_node(self, name, parent, path_cost):
+        node_id, self._next_id = self._next_id, self._next_id + 1
+        return TreeNode(name,
+                        ## the root has no heuristic cost, its path has not started yet
+                        heuristic=self._graph.nodes[name].get("heuristic", 0) if parent is not None else 0,
+                        parent=parent, ##parent, for tree struktur and later path generation
+                        path_cost=path_cost, ##cost to get to the node from parent
+                        frontier=True,
+                        node_id=node_id)
+
+    def _tree_copy(self):
+        ## a trace pickles the frame right away, a list or the live window needs a copy of the tree
+        return self._root if isinstance(self._frames, TraceWriter) else copy.deepcopy(self._root)
+
+    def _snapshot(self, root):
+        frontier = [] if self._engine.frontier is None else [node.name for node in self._engine.frontier]
+        return root, frontier, self._limit
+
+    def on_start(self, root):
+        root.toggle_start()
+        root.set_step(self._step)
+        self._root = root ##set root for search tree
+
+    def on_select(self, node):
+        node.toggle_frontier()
+        node.toggle_occupied() ##toogle node to occupied
+        node.set_step(self._step) ##set search step (redundand for start node, but needed earlier)
+        if self.frame_on_select:
+            self._frames.append(self._snapshot(self._tree_copy()))
+
+    def on_expand(self, node):
+        node.toggle_occupied() ##to to unoccupied
+        node.toggle_explored() ##set as explored
+        self._step += 1
+        if not self.frame_on_select:
+            self._frames.append(self._snapshot(self._tree_copy()))  ##append snapshot of current search tree for animation
+
+    def on_goal(self, node):
+        self._end_leaf = node
+        for path_node in self._engine.path(node): ##generate solution
+            self._path.append(path_node._id) ##add node to path solution
+            path_node.edge_color = "red" ##set path color for later visualisation
+        self._frames.append(self._snapshot(self._root)) ##append a last snapshot of solved tree
+
+    def on_restart(self, limit):
+        self._limit = limit
+        self._next_id = 0
+
+    def on_drop(self, node):
+        node.parent.children.remove(node)  ##the leaf leaves the search tree, later frames do not show it
+
+    @classmethod
+    def solve(cls, problem, limit=None, stats=False, prune=None, table_size=None, budget=None):
+        """
+        Runs the tree search on an implicit state space. States are generated lazily by
+        `problem.successors`, the pruning modes compare `problem.key` of the states; no
+        graph or search tree drawing is built.
+
+        Args:
+            problem (Problem): Start state, successors, goal test and heuristic.
+            limit (int, optional): Maximum number of nodes on a path (default: no limit).
+            stats (bool, optional): Collect SearchStats for the search (default: False).
+            prune (str, optional): "path" or "table" pruning, see `SearchEngine` (default: None).
+            table_size (int, optional): Maximum number of states kept by the "table" pruning (default: no limit).
+            budget (Budget, optional): Run limits, see `SearchEngine` (default: no limits).
+
+        Returns:
+            Solution: The goal node (None if not found) and the stats; the reason and the
+            best node so far if the budget stopped the search. An unsolvable problem (see
+            `Problem.solvable`) is answered without searching; with `Problem.state_count` known,
+            paths hold at most that many nodes, so a tree search ends on cyclic state spaces.
+        """
+        search_stats = make_stats(stats, cls.algorithm)
+        if problem.solvable() is False:
+            return Solution(None, search_stats, expanded=0, generated=0)
+        count = problem.state_count()
+        if count is not None and not cls.iterative:
+            ## every path without repeated states fits, longer ones only run in cycles
+            limit = count if limit is None else min(limit, count)
+        engine = SearchEngine(problem.successors, problem.is_goal, policy=cls.problem_policy or cls.policy,
+                              tree=True, limit=limit, iterative=cls.iterative, max_limit=count, prune=prune,
+                              table_size=table_size, heuristic=problem.h, key=problem.key, stats=search_stats,
+                              budget=budget)
+        return Solution.of(engine, engine.run(problem.initial), search_stats)
+
+    def get_solution(self):
+        """
+        Returns the Solution of the search: the goal node and the stats, and if the budget
+        stopped the search the reason and the best node found so far.
+        """
+        return self._solution
+
+    def get_stats(self):
+        """Returns the SearchStats of the last search (a NullStats if stats were disabled)."""
+        return self._stats
+
+    def get_pruned(self):
+        """Returns the number of successors dropped by the `prune` mode."""
+        return self._engine.pruned
+
+    def _get_path_cost(self):
+        if self._end_leaf:
+            self._path_cost = {
+                "stepcost": self._end_leaf.sum_path_cost
+            }
+            print("The stepcost for the path is: ",
+                  self._path_cost["stepcost"])
+
+    def _fill_graph(self, edges, nodes):
+        for node in nodes:
+            ## add each node
+            self._graph.add_node(node)
+        for node1, node2, stepcost in edges:
+            ## add each edges with its stepcost
+            self._add_edge(node1, node2, stepcost=stepcost, color="gray")
+
+    def visualise(self):
+        """Vidualise the search process animates a growing search tree to
+        let user see how the algorithm traverses the tree in order to find a solution.
+        The finished tree shows explored nodes in light green, the goal node in green and
+        unexplored nodes in lightblue, the solving path is red. Each node displays
+        its cumulative heuristic cost, unique id and search step. Unexplored nodes have no search step.
+        Actual pathcosts are displayed at the respective edge."""
+        show_animation(self, interval=self.interval)
+
+    def export(self, path, fps=2, workers=None, dpi=100):
+        """
+        Renders the animation without a display, in parallel processes.
+
+        Args:
+            path (str): A .gif or .mp4 file, or a directory for a PNG sequence.
+            fps (float, optional): Frames per second (default: 2).
+            workers (int, optional): Number of rendering processes (default: number of CPUs).
+            dpi (int, optional): Resolution of the frames (default: 100).
+        """
+        return export_animation(self, path, fps=fps, workers=workers, dpi=dpi)
+
+    def _make_renderer(self, ax):
+        ## the layout of the tree is computed once and reused for every frame;
+        ## a live renderer learns the frames while they are drawn
+        roots = () if isinstance(self._frames, FramePipe) else (frame[0] for frame in self._frames)
+        return TreeRenderer(ax, roots, self._node_label, captions=self.captions)
+
+    def _renderer_factories(self, blocks):
+        ## the frames are split into segments once; a block gets the last roots of its own segments
+        segments = TreeSegments(frame[0] for frame in self._frames)
+        return [partial(TreeRenderer, roots=(), node_label=self._node_label, captions=self.captions,
+                        segments=segments.part(block.start, block.stop))
+                for block in blocks]
+
+    def _draw_frame(self, renderer, frame):
+        return renderer.update(frame[0])
+
+    @staticmethod
+    def _node_label(node):
+        return (f"{node.name}\n" +
+                f"id: {node._id}\n" +
+                f"step: {node.step}")
@@ -0,0 +1,58 @@
+"""
+Disjoint set forest for connected component queries on graphs that only grow.
+"""
+
+
+class UnionFind:
+    """
+    Connected components maintained edge by edge (union by size, path halving), so
+    a reachability check costs nearly O(1) instead of a search.
+    For directed graphs the components are those of the undirected graph: nodes in
+    different components can never reach each other.
+
+    Attributes:
+        _parent (dict): Node -> parent node, roots are their own parent.
+        _size (dict): Root -> number of nodes in its component.
+    """
+
+    def __init__(self):
+        self._parent = {}
+        self._size = {}
+
+    def add(self, node):
+        """Adds a node as its own component if it is not known yet."""
+        if node not in self._parent:
+            self._parent[node] = node
+            self._size[node] = 1
+
+    def find(self, node):
+        """Returns the representative of the component of `node`."""
+        parent = self._parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]  ##path halving
+            node = parent[node]
+        return node
+
+    def union(self, node1, node2):
+        """Merges the components of two nodes, e.g. after adding an edge between them."""
+        self.add(node1)
+        self.add(node2)
+        root1, root2 = self.find(node1), self.find(node2)
+        if root1 == root2:
+            return
+        if self._size[root1] < self._size[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._size[root1] += self._size.pop(root2)
+
+    def connected(self, node1, node2):
+        """Whether both nodes are known and in the same component."""
+        if node1 not in self._parent or node2 not in self._parent:
+            return False
+        return self.find(node1) == self.find(node2)
+
+    def size(self, node):
+        """Number of nodes in the component of `node` (0 for unknown nodes)."""
+        if node not in self._parent:
+            return 0
+        return self._size[self.find(node)]
@@ -0,0 +1,85 @@
+"""
+Shared fixtures of the test suite. The repository root is put on the import path, so
+the suite runs with `python -m pytest` from the root without installing anything.
+"""
+import os
+import sys
+
+import matplotlib
+import pytest
+
+matplotlib.use("Agg")  ##no display needed, `show=False` is passed anyway
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.utils.Problem import Problem  ##importable once the root is on the path
+
+## the example graph of the search class demos, heuristic per node
+NODES = {"a": 5, "b": 6, "c": 8, "d": 4, "e": 4, "f": 5, "g": 2, "h": 0}
+EDGES = (("a", "b", 3), ("a", "c", 3), ("b", "d", 2), ("d", "e", 4), ("c", "f", 3),
+         ("e", "f", 1), ("e", "g", 2), ("f", "g", 3), ("g", "h", 2))
+
+
+class NetworkProblem(Problem):
+    """Problem over a networkx graph with "stepcost" edges; the states are the node names."""
+
+    def __init__(self, graph, initial, goal, heuristic=None):
+        super().__init__(initial, goal)
+        self.graph = graph
+        self.heuristic = heuristic or {}
+
+    def successors(self, state):
+        return [(child, data["stepcost"]) for child, data in self.graph.adj[state].items()]
+
+    def h(self, state):
+        return self.heuristic.get(state, 0)
+
+
+@pytest.fixture
+def example():
+    """(nodes, edges) of the demo graph."""
+    return dict(NODES), EDGES
+
+
+@pytest.fixture
+def split_example():
+    """The demo graph plus a second component {x, y}, unreachable from "a"."""
+    return {**NODES, "x": 1, "y": 0}, EDGES + (("x", "y", 1),)
+
+
+@pytest.fixture
+def random_graph():
+    """Factory (n, m, seed, directed=False) -> (nodes, edges, networkx graph) with integer step costs."""
+    import random
+
+    import networkx as nx
+
+    def make(n, m, seed, directed=False):
+        rng = random.Random(seed)
+        nodes = [f"n{i}" for i in range(n)]
+        pairs = set()
+        while len(pairs) < m:
+            u, v = rng.sample(nodes, 2)
+            if directed or (v, u) not in pairs:
+                pairs.add((u, v))
+        edges = tuple((u, v, rng.randint(1, 9)) for u, v in sorted(pairs))
+        graph = nx.DiGraph() if directed else nx.Graph()
+        graph.add_nodes_from(nodes)
+        graph.add_weighted_edges_from(edges, weight="stepcost")
+        return nodes, edges, graph
+    return make
+
+
+@pytest.fixture
+def network_problem():
+    """Factory (networkx graph, start, goal, heuristic dict=None) -> NetworkProblem."""
+    return NetworkProblem
+
+
+@pytest.fixture
+def example_graph(example):
+    """The demo graph as networkx graph with "stepcost" edges."""
+    import networkx as nx
+
+    graph = nx.Graph()
+    graph.add_weighted_edges_from(example[1], weight="stepcost")
+    return graph
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+
+from algorithms.uninformed.BFS_graph import BFS
+from algorithms.uninformed.IDS_tree import IDS_tree
+from algorithms.utils.Animation import export_animation, render_frames
+
+
+def pixels(paths):
+    return [np.asarray(Image.open(path).convert("RGB")) for path in paths]
+
+
+@pytest.mark.parametrize("search", [BFS, IDS_tree])
+def test_png_sequence(tmp_path, example, search):
+    run = search(*example, show=False)
+    alone = render_frames(run, str(tmp_path / "one"), workers=1, dpi=40)
+    assert run.export(str(tmp_path / "two"), workers=2, dpi=40) == str(tmp_path / "two")
+    shared = sorted((tmp_path / "two").iterdir())
+    assert len(alone) == len(shared) == len(run._frames)
+    assert Image.open(shared[0]).size == (320, 240)  ##8 x 6 inches at 40 dpi
+    ## the workers draw their blocks exactly like a single process
+    assert all(np.array_equal(a, b) for a, b in zip(pixels(alone), pixels(shared)))
+
+
+@pytest.mark.parametrize("search", [BFS, IDS_tree])
+def test_gif(tmp_path, example, search):
+    path = str(tmp_path / "search.gif")
+    run = search(*example, show=False, trace=str(tmp_path / "search.trace"))
+    run.export(path, fps=4, workers=2, dpi=30)
+    with Image.open(path) as gif:
+        durations = [frame.info["duration"] for frame in ImageSequence.Iterator(gif)]
+        assert gif.size == (240, 180)
+    ## Pillow merges equal frames and adds up their durations
+    assert 1 < len(durations) <= len(run._frames) and sum(durations) == 250 * len(run._frames)
+
+
+def test_no_frames(tmp_path, example):
+    run = BFS(*example, show=False)
+    run._frames = []
+    assert render_frames(run, str(tmp_path / "frames")) == []
+    with pytest.raises(ValueError):
+        export_animation(run, str(tmp_path / "search.gif"))
@@ -0,0 +1,54 @@
+import pickle
+
+import pytest
+
+from algorithms.informed.astar_graph import AStar
+from algorithms.informed.Astar_tree import AStarTree
+from algorithms.uninformed.BFS_graph import BFS
+from algorithms.uninformed.IDS import IDS
+from algorithms.uninformed.UCS import UCS
+from algorithms.utils.Budget import Budget, CancelToken
+
+SEARCHES = [BFS, IDS, UCS, AStar, AStarTree]
+
+
+@pytest.fixture
+def problem(random_graph, network_problem):
+    _, _, graph = random_graph(300, 900, seed=61)
+    return network_problem(graph, "n0", "n299")
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+def test_expansion_budget(problem, search):
+    solution = search.solve(problem, budget=Budget(max_expansions=5), stats=True)
+    assert solution.stopped == "expansions" and not solution.found
+    assert solution.stats.expanded <= 5 and solution.best_path[0] == "n0"
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+def test_node_budget(problem, search):
+    solution = search.solve(problem, budget=Budget(max_nodes=20))
+    assert solution.stopped == "nodes" and not solution.found
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+def test_cancelled_and_expired_runs_stop_at_once(problem, search):
+    cancelled = search.solve(problem, budget=Budget(token=CancelToken(cancelled=True)), stats=True)
+    expired = search.solve(problem, budget=Budget(deadline=0), stats=True)
+    assert cancelled.stopped == "cancelled" and expired.stopped == "deadline"
+    assert cancelled.stats.expanded == expired.stats.expanded == 0
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+def test_generous_budget_changes_nothing(problem, search):
+    plain = search.solve(problem, stats=True)
+    limited = search.solve(problem, budget=Budget(deadline=60, max_expansions=10 ** 6, max_nodes=10 ** 6), stats=True)
+    assert limited.stopped is None and limited.cost == plain.cost
+    assert limited.stats.expanded == plain.stats.expanded
+
+
+def test_token_copies_keep_their_state():
+    token = CancelToken()
+    assert not pickle.loads(pickle.dumps(token)).cancelled
+    token.cancel()
+    assert token.cancelled and pickle.loads(pickle.dumps(token)).cancelled
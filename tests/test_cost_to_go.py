@@ -0,0 +1,54 @@
+import math
+
+import networkx as nx
+import pytest
+
+from algorithms.utils.CSRGraph import CSRGraph
+from algorithms.utils.CostToGo import CostToGo
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_costs_and_paths_match_dijkstra(random_graph, directed):
+    nodes, edges, reference = random_graph(60, 150, seed=3, directed=directed)
+    maps = CostToGo(CSRGraph.from_edges(nodes, edges, directed=directed))
+    for goal in nodes[:5]:
+        expected = nx.single_source_dijkstra_path_length(reference.reverse() if directed else reference,
+                                                         goal, weight="stepcost")
+        for start in nodes:
+            assert maps.cost(start, goal) == expected.get(start, math.inf)
+            path = maps.path(start, goal)
+            if start not in expected:
+                assert path == []
+                continue
+            assert path[0] == start and path[-1] == goal
+            assert nx.path_weight(reference, path, "stepcost") == expected[start]
+
+
+def test_least_recently_used_goal_is_dropped(example):
+    maps = CostToGo(CSRGraph.from_edges(*example), max_goals=2)
+    maps.cost("a", "h")
+    maps.cost("a", "g")
+    maps.cost("b", "h")  ##h is now the most recently used goal
+    maps.cost("a", "f")
+    assert list(maps._maps) == ["h", "f"]
+
+
+def test_max_goals_zero_keeps_no_maps(example):
+    maps = CostToGo(CSRGraph.from_edges(*example), max_goals=0)
+    assert maps.cost("a", "h") == 11
+    assert maps.path("a", "h")[-1] == "h"
+    assert not maps._maps
+
+
+def test_negative_max_goals_is_rejected(example):
+    with pytest.raises(ValueError):
+        CostToGo(CSRGraph.from_edges(*example), max_goals=-1)
+
+
+def test_changed_graph_recomputes_the_map(example):
+    graph = CSRGraph.from_edges(*example)
+    maps = CostToGo(graph)
+    assert maps.cost("a", "h") == 11
+    graph.set_stepcost("g", "h", math.inf)
+    graph.changed()
+    assert maps.cost("a", "h") == math.inf
@@ -0,0 +1,65 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+import algorithms.utils.ExternalBFS as external
+from algorithms.utils.CSRGraph import CSRGraph
+from algorithms.utils.ExternalBFS import ExternalBFS, csr_expander
+
+
+def reference_layers(graph, reference, start):
+    return [sorted(graph.index(name) for name in layer) for layer in nx.bfs_layers(reference, start)]
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("chunk_size,fan_in", [(1 << 20, 64), (3, 2), (1, 2)])
+def test_layers_match_networkx(tmp_path, random_graph, directed, chunk_size, fan_in):
+    nodes, edges, reference = random_graph(60, 120, seed=8, directed=directed)
+    graph = CSRGraph.from_edges(nodes, edges, directed=directed)
+    search = ExternalBFS(csr_expander(graph), str(tmp_path), chunk_size, directed=directed, fan_in=fan_in)
+    sizes = search.run(graph.index("n0"))
+    expected = reference_layers(graph, reference, "n0")
+    assert sizes[:-1] == [len(layer) for layer in expected] and sizes[-1] == 0
+    for depth, layer in enumerate(expected):
+        assert search.layer(depth).tolist() == layer
+    assert not [name for name in tmp_path.iterdir() if name.name.startswith("run-")]
+
+
+def test_reads_are_bounded_by_the_chunk_size(tmp_path, random_graph, monkeypatch):
+    nodes, edges, reference = random_graph(80, 300, seed=3)
+    graph = CSRGraph.from_edges(nodes, edges)
+    chunk_size, fan_in = 4, 3
+    reads, merged = [], []
+    take_upto, merge = external._SortedFile.take_upto, external._merge
+
+    def recorded_take_upto(self, key, limit=None):
+        keys = take_upto(self, key, limit)
+        reads.append(len(keys))
+        return keys
+
+    def recorded_merge(paths, size):
+        assert len(paths) <= fan_in
+        for chunk in merge(paths, size):
+            merged.append(len(chunk))
+            yield chunk
+
+    monkeypatch.setattr(external._SortedFile, "take_upto", recorded_take_upto)
+    monkeypatch.setattr(external, "_merge", recorded_merge)
+    search = ExternalBFS(csr_expander(graph), str(tmp_path), chunk_size, fan_in=fan_in)
+    search.run(graph.index("n0"))
+    assert max(reads) <= chunk_size and max(merged) <= chunk_size
+    assert [len(layer) for layer in nx.bfs_layers(reference, "n0")] == search.sizes[:-1]
+
+
+def test_goal_depth(tmp_path, example):
+    graph = CSRGraph.from_edges(*example)
+    start, goal = graph.index("a"), graph.index("h")
+    search = ExternalBFS(csr_expander(graph), str(tmp_path), 2, fan_in=2)
+    search.run(start, goal)
+    assert search.goal_depth == nx.shortest_path_length(graph.to_networkx(), "a", "h")
+    assert search.depth(np.uint64(goal)) == search.goal_depth
+
+
+def test_fan_in_must_merge_two_runs():
+    with pytest.raises(ValueError):
+        ExternalBFS(lambda keys: keys, fan_in=1)
@@ -0,0 +1,54 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from algorithms.uninformed.UCS import UCS
+from algorithms.utils.CSRGraph import CSRGraph
+from algorithms.utils.GraphFile import graph_size, open_graph, write_graph
+from algorithms.utils.Problem import GraphProblem
+
+
+def assert_same_graph(stored, graph):
+    assert list(stored.names) == list(graph.names) and stored.directed == graph.directed
+    for name in ("offsets", "targets", "weights", "heuristics", "coords"):
+        original, copy = getattr(graph, name), getattr(stored, name)
+        assert (original is None) == (copy is None)
+        if original is not None:
+            assert np.array_equal(original, copy)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_round_trip(tmp_path, random_graph, directed):
+    nodes, edges, reference = random_graph(50, 120, seed=21, directed=directed)
+    graph = CSRGraph.from_edges({name: i % 7 for i, name in enumerate(nodes)}, edges, directed=directed)
+    graph.coords = np.arange(2.0 * len(nodes)).reshape(-1, 2)
+    path = str(tmp_path / "graph.csr")
+    write_graph(graph, path)
+    assert (tmp_path / "graph.csr").stat().st_size == graph_size(graph)
+    stored = open_graph(path)
+    assert_same_graph(stored, graph)
+    assert all(stored.index(name) == graph.index(name) for name in nodes)
+    with pytest.raises(KeyError):
+        stored.index("missing")
+    ## the mapped graph is searched like the one it was written from
+    solution = UCS.solve(GraphProblem(stored, "n0", "n9"))
+    if nx.has_path(reference, "n0", "n9"):
+        assert solution.cost == nx.shortest_path_length(reference, "n0", "n9", weight="stepcost")
+    else:
+        assert solution.node is None
+
+
+def test_unicode_names_and_no_heuristics(tmp_path):
+    graph = CSRGraph.from_edges(["zürich", "bern", "genève"], (("zürich", "bern", 2), ("bern", "genève", 3)))
+    path = str(tmp_path / "graph.csr")
+    write_graph(graph, path)
+    stored = open_graph(path)
+    assert_same_graph(stored, graph)
+    assert stored.index("genève") == 2 and stored.names[-1] == "genève" and stored.names[:2] == ["zürich", "bern"]
+
+
+def test_not_a_graph_file(tmp_path):
+    path = tmp_path / "graph.csr"
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        open_graph(str(path))
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from algorithms.utils import GraphLoader
+from algorithms.utils.GraphLoader import load_graph
+
+
+@pytest.fixture(params=["pandas", "numpy"])
+def parser(request, monkeypatch):
+    """Runs a test with the pandas parser and with the numpy fallback."""
+    if request.param == "numpy":
+        monkeypatch.setattr(GraphLoader, "pd", None)
+    elif GraphLoader.pd is None:
+        pytest.skip("pandas is not installed")
+    return request.param
+
+
+def edge_set(graph):
+    return {(u, v, w) for u, v, w in graph.edge_tuples()}
+
+
+def test_header_after_comment_lines(tmp_path, parser):
+    path = tmp_path / "edges.csv"
+    path.write_text("# exported roads\n\n# second comment\nsource,target,cost\na,b,1\nb,c,2.5\n")
+    graph = load_graph(str(path))
+    assert graph.number_of_nodes() == 3
+    assert edge_set(graph) == {("a", "b", 1.0), ("b", "c", 2.5)}
+
+
+def test_no_header(tmp_path, parser):
+    path = tmp_path / "edges.txt"
+    path.write_text("a b 1\nb c 2\n\nc a 3\n")
+    assert edge_set(load_graph(str(path))) == {("a", "b", 1.0), ("b", "c", 2.0), ("a", "c", 3.0)}
+
+
+def test_node_file_uses_the_given_delimiter(tmp_path, parser):
+    edges, nodes = tmp_path / "edges.txt", tmp_path / "nodes.txt"
+    edges.write_text("a;b;1\nb;c;2\n")
+    nodes.write_text("# heuristic per node\nname;h\na;2\nb;1\nc;0\n")
+    graph = load_graph(str(edges), str(nodes), delimiter=";")
+    assert np.allclose(graph.heuristics[[graph.index(name) for name in "abc"]], [2, 1, 0])
+
+
+def test_node_file_delimiter_by_extension(tmp_path, parser):
+    edges, nodes = tmp_path / "edges.csv", tmp_path / "nodes.tsv"
+    edges.write_text("a,b,1\nb,c,2\n")
+    nodes.write_text("a\t0\t0\nb\t1\t0\nc\t1\t1\n")
+    graph = load_graph(str(edges), str(nodes))
+    assert graph.coords[graph.index("c")].tolist() == [1.0, 1.0]
+
+
+def test_columns_by_header_name(tmp_path, parser):
+    path = tmp_path / "edges.csv"
+    path.write_text("target,source,stepcost\nb,a,1\nc,b,2.5\n")
+    graph = load_graph(str(path), directed=True)
+    assert edge_set(graph) == {("a", "b", 1.0), ("b", "c", 2.5)}
+    path.write_text("Weight,To,From\n4,b,a\n")
+    assert edge_set(load_graph(str(path), directed=True)) == {("a", "b", 4.0)}
+    path.write_text("to,from\nb,a\n")
+    assert edge_set(load_graph(str(path), directed=True, default_cost=3)) == {("a", "b", 3.0)}
+
+
+@pytest.mark.parametrize("header", ["source,target,length", "source,stepcost", "source,source,target"])
+def test_bad_header(tmp_path, parser, header):
+    path = tmp_path / "edges.csv"
+    path.write_text(f"{header}\na,b,1\n")
+    with pytest.raises(ValueError):
+        load_graph(str(path))
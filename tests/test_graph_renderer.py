@@ -0,0 +1,56 @@
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+from matplotlib.colors import to_rgba
+
+import algorithms.utils.GraphRenderer as renderer
+from algorithms.uninformed.BFS_graph import BFS
+from algorithms.utils.GraphRenderer import GraphRenderer, node_color
+
+
+def label(node, data):
+    return f"{node}\nstep: {data['step']}"
+
+
+def expected_colors(frame, nodes):
+    return np.array([to_rgba(node_color(frame.nodes[node])) for node in nodes])
+
+
+def test_update_recolours_and_relabels_without_drawing(example, monkeypatch):
+    search = BFS(*example, show=False)
+    first, second = search._frames[0][0], search._frames[-1][0]
+    fig, ax = plt.subplots()
+    view = GraphRenderer(ax, search._graph, nx.circular_layout(search._graph), label, captions=[(0.5, 0.9)])
+    children, artists = list(ax.get_children()), view.artists()
+
+    def no_drawing(*args, **kwargs):
+        raise AssertionError("update must not draw new artists")
+    for name in ("draw_networkx_nodes", "draw_networkx_edges", "draw_networkx_labels", "draw_networkx_edge_labels"):
+        monkeypatch.setattr(renderer.nx, name, no_drawing)
+
+    for frame, caption in ((first, "first"), (second, "last")):
+        returned = view.update(frame, [caption])
+        assert returned == artists and ax.get_children() == children  ##the same artists, changed in place
+        assert np.allclose(view._node_artist.get_facecolor(), expected_colors(frame, view._nodes))
+        assert np.allclose(view._edge_artist.get_color(),
+                           [to_rgba(frame.edges[edge]["color"]) for edge in view._edges])
+        for node in view._nodes:
+            assert view._label_artists[node].get_text() == label(node, frame.nodes[node])
+        assert view._caption_artists[0].get_text() == caption
+    ## the frames differ, so the second update really changed the colours
+    assert not np.allclose(expected_colors(first, view._nodes), expected_colors(second, view._nodes))
+    plt.close(fig)
+
+
+def test_unchanged_labels_are_not_touched(example):
+    search = BFS(*example, show=False)
+    frame = search._frames[-1][0]
+    fig, ax = plt.subplots()
+    view = GraphRenderer(ax, search._graph, nx.circular_layout(search._graph), label)
+    view.update(frame)
+    touched = []
+    for node, artist in view._label_artists.items():
+        artist.set_text = lambda text, node=node: touched.append(node)
+    view.update(frame)
+    assert touched == []
+    plt.close(fig)
@@ -0,0 +1,52 @@
+import multiprocessing as mp
+
+import networkx as nx
+import pytest
+
+from algorithms.informed.astar_graph import AStar
+from algorithms.utils.Budget import Budget
+from algorithms.utils.HDAStar import _receive, owner
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_costs_are_optimal(random_graph, network_problem, workers):
+    _, _, graph = random_graph(60, 150, seed=41)
+    lengths = nx.single_source_dijkstra_path_length(graph, "n0", weight="stepcost")
+    for goal in ("n5", "n17", "n42"):
+        problem = network_problem(graph, "n0", goal)
+        solution = AStar.solve_parallel(problem, workers=workers, batch_size=4, stats=True)
+        assert solution.cost == lengths[goal] == AStar.solve(problem).cost
+        assert solution.path[0] == "n0" and solution.path[-1] == goal
+        assert nx.path_weight(graph, solution.path, "stepcost") == lengths[goal]
+        assert solution.stats.expanded > 0 and solution.stats.generated >= solution.stats.expanded
+
+
+def test_unreachable_goal(split_example, network_problem):
+    graph = nx.Graph()
+    graph.add_weighted_edges_from(split_example[1], weight="stepcost")
+    solution = AStar.solve_parallel(network_problem(graph, "a", "x"), workers=2)
+    assert solution.node is None and solution.stopped is None
+
+
+def test_budget_stops_the_workers(random_graph, network_problem):
+    _, _, graph = random_graph(60, 150, seed=41)
+    solution = AStar.solve_parallel(network_problem(graph, "n0", "n42"), workers=2, budget=Budget(max_expansions=2))
+    assert solution.node is None and solution.stopped == "expansions"
+
+
+def test_owner_spreads_keys():
+    owners = [owner(key, 4) for key in range(1000)]
+    assert set(owners) == {0, 1, 2, 3} and min(owners.count(number) for number in range(4)) > 150
+
+
+def test_receive_notices_dead_workers():
+    process = mp.get_context().Process(target=int)
+    process.start()
+    process.join()
+    results = mp.get_context().Queue()
+    results.put(("idle", 0))
+    results.put(("counts", 0, 3, 7))
+    ## a worker that sent its counts may exit, late idle messages are dropped
+    assert _receive(results, [process], "counts", done={0}) == ("counts", 0, 3, 7)
+    with pytest.raises(RuntimeError):
+        _receive(results, [process], "parent")
@@ -0,0 +1,62 @@
+import os
+
+import networkx as nx
+import pytest
+
+import algorithms.utils.LayoutCache as cache
+from algorithms.utils.LayoutCache import graph_fingerprint, graph_layout
+
+
+@pytest.fixture
+def computed(monkeypatch):
+    """Empty in-memory cache; returns the list of graphs laid out since."""
+    graphs = []
+    compute = cache.compute_layout
+
+    def counting(graph, threshold):
+        graphs.append(graph)
+        return compute(graph, threshold)
+    monkeypatch.setattr(cache, "_memory", {})
+    monkeypatch.setattr(cache, "compute_layout", counting)
+    return graphs
+
+
+def graph(edges, **attributes):
+    G = nx.Graph()
+    for u, v in edges:
+        G.add_edge(u, v, **attributes)
+    return G
+
+
+EDGES = [("a", "b"), ("b", "c"), ("c", "d"), ("d", "a"), ("a", "c")]
+
+
+def test_equal_graph_hits_the_cache(tmp_path, computed):
+    first = graph_layout(graph(EDGES, stepcost=1), cache_dir=str(tmp_path))
+    ## same nodes and edges, other order and attributes
+    equal = graph(reversed([(v, u) for u, v in EDGES]), stepcost=5, color="red")
+    assert graph_layout(equal, cache_dir=str(tmp_path)) == first and len(computed) == 1
+    assert len(os.listdir(tmp_path)) == 1
+    cache._memory.clear()  ##a new process finds the layout on disk
+    assert graph_layout(equal, cache_dir=str(tmp_path)) == first and len(computed) == 1
+
+
+def test_changed_graph_misses_the_cache(tmp_path, computed):
+    graph_layout(graph(EDGES), cache_dir=str(tmp_path))
+    changed = graph(EDGES + [("b", "d")])
+    assert graph_fingerprint(changed) != graph_fingerprint(graph(EDGES))
+    assert set(graph_layout(changed, cache_dir=str(tmp_path))) == {"a", "b", "c", "d"}
+    assert len(computed) == 2 and len(os.listdir(tmp_path)) == 2
+    directed = nx.DiGraph(EDGES)  ##the same edges, directed
+    graph_layout(directed, cache_dir=str(tmp_path))
+    assert len(computed) == 3
+
+
+def test_unwritable_cache_falls_back_to_memory(tmp_path, computed):
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    cache_dir = str(blocker / "layouts")  ##cannot be created, also not by root
+    pos = graph_layout(graph(EDGES), cache_dir=cache_dir)
+    assert set(pos) == {"a", "b", "c", "d"} and len(cache._memory) == 1
+    assert graph_layout(graph(EDGES), cache_dir=cache_dir) == pos and len(computed) == 1
+    assert os.listdir(tmp_path) == ["file"]
@@ -0,0 +1,78 @@
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+import algorithms.utils.LevelBFS as level_bfs
+from algorithms.utils.Budget import Budget
+from algorithms.utils.CSRGraph import CSRGraph
+from algorithms.utils.LevelBFS import LevelBFS
+
+
+@pytest.fixture(params=["scipy", "top-down"])
+def expansion(request, monkeypatch):
+    if request.param == "top-down":
+        monkeypatch.setattr(level_bfs, "sparse", None)
+    return request.param
+
+
+def check_tree(graph, reference, source, hops, pred):
+    lengths = nx.single_source_shortest_path_length(reference, source)
+    for node in range(graph.number_of_nodes()):
+        name = graph.names[node]
+        if name not in lengths:
+            assert np.isinf(hops[node]) and pred[node] == -1
+            continue
+        assert hops[node] == lengths[name]
+        if name != source:  ##the parent is one level up and has an edge to the node
+            parent = graph.names[pred[node]]
+            assert lengths[parent] == lengths[name] - 1 and reference.has_edge(parent, name)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("n,m", [(50, 60), (60, 600)])  ##sparse levels stay top-down, dense ones go bottom-up
+def test_hops_match_networkx(random_graph, expansion, directed, n, m):
+    nodes, edges, reference = random_graph(n, m, seed=n + m, directed=directed)
+    graph = CSRGraph.from_edges(nodes, edges, directed=directed)
+    search = LevelBFS(graph)
+    hops, pred = search.run("n0")
+    check_tree(graph, reference, "n0", hops, pred)
+    assert search.expanded == np.isfinite(hops).sum()
+    assert [len(layer) for layer in nx.bfs_layers(reference, "n0")] == \
+        np.bincount(hops[np.isfinite(hops)].astype(int)).tolist()
+
+
+def test_path_and_goal(random_graph, expansion):
+    nodes, edges, reference = random_graph(40, 80, seed=9)
+    graph = CSRGraph.from_edges(nodes, edges)
+    search = LevelBFS(graph)
+    for goal in nodes[1:]:
+        path = search.path("n0", goal)
+        if nx.has_path(reference, "n0", goal):
+            assert path[0] == "n0" and path[-1] == goal
+            assert len(path) - 1 == search.hops("n0", goal) == nx.shortest_path_length(reference, "n0", goal)
+            assert all(reference.has_edge(u, v) for u, v in zip(path, path[1:]))
+        else:
+            assert path == [] and search.hops("n0", goal) is None
+
+
+def test_blocked_edges_and_graph_changes(example, expansion):
+    graph = CSRGraph.from_edges(*example)
+    reference = graph.to_networkx()
+    search = LevelBFS(graph)
+    assert search.hops("a", "h") == nx.shortest_path_length(reference, "a", "h")
+    graph.set_stepcost("g", "h", math.inf)  ##the only edge into h
+    assert search.hops("a", "h") is None
+    graph.set_stepcost("a", "c", math.inf)
+    reference.remove_edges_from([("g", "h"), ("a", "c")])
+    check_tree(graph, reference, "a", *search.run("a"))
+
+
+def test_limits(example, expansion):
+    graph = CSRGraph.from_edges(*example)
+    search = LevelBFS(graph)
+    hops, _ = search.run("a", max_depth=2)
+    assert np.nanmax(np.where(np.isfinite(hops), hops, np.nan)) == 2
+    hops, _ = search.run("a", budget=Budget(max_expansions=1))
+    assert search.stopped == "expansions" and np.isfinite(hops).sum() == 3  ##a and its two children
@@ -0,0 +1,41 @@
+import networkx as nx
+import pytest
+
+from algorithms.informed.astar_graph import AStar
+from algorithms.informed.Astar_tree import AStarTree
+from algorithms.uninformed.BFS_graph import BFS
+from algorithms.uninformed.BFS_tree import BFS as BFS_tree
+from algorithms.uninformed.DFS import DFS
+from algorithms.uninformed.DFS_tree import BFS as DFS_tree
+from algorithms.uninformed.IDS import IDS
+from algorithms.uninformed.IDS_tree import IDS_tree
+from algorithms.uninformed.UCS import UCS
+
+ALL = [BFS, DFS, IDS, UCS, AStar, BFS_tree, DFS_tree, IDS_tree, AStarTree]
+
+
+@pytest.mark.parametrize("search", ALL)
+def test_every_search_solves_the_problem(search, example, example_graph, network_problem):
+    solution = search.solve(network_problem(example_graph, "a", "h", heuristic=example[0]))
+    assert solution.found and solution.path[0] == "a" and solution.path[-1] == "h"
+    assert nx.is_path(example_graph, solution.path)
+    assert solution.cost == nx.path_weight(example_graph, solution.path, "stepcost")
+
+
+@pytest.mark.parametrize("search", [BFS, BFS_tree, IDS, IDS_tree])
+def test_fewest_edges(search, random_graph, network_problem):
+    _, _, graph = random_graph(25, 40, seed=5)
+    reachable = nx.node_connected_component(graph, "n0")
+    for goal in sorted(reachable - {"n0"})[:6]:
+        solution = search.solve(network_problem(graph, "n0", goal))
+        assert len(solution.path) - 1 == nx.shortest_path_length(graph, "n0", goal)
+
+
+def test_uniform_cost_finds_the_cheapest_path(random_graph, network_problem):
+    _, _, graph = random_graph(40, 80, seed=11)
+    expected = nx.single_source_dijkstra_path_length(graph, "n0", weight="stepcost")
+    for goal in sorted(set(expected) - {"n0"})[:8]:
+        solution = UCS.solve(network_problem(graph, "n0", goal))
+        assert solution.cost == expected[goal]
+        assert nx.path_weight(graph, solution.path, "stepcost") == solution.cost
+
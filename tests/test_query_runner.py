@@ -0,0 +1,80 @@
+import io
+import json
+
+import networkx as nx
+import pytest
+
+import algorithms.utils.QueryRunner as runner
+from algorithms.utils.CSRGraph import CSRGraph
+
+answer_batch = runner._answer_batch
+
+
+def results(graph, queries, **options):
+    output = io.StringIO()
+    count = runner.run(graph, [json.dumps(query) if isinstance(query, dict) else query for query in queries],
+                       output, **options)
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert count == len(lines)
+    return sorted(lines, key=lambda line: line.get("id", line.get("line")))
+
+
+def exploding_batch(batch, defaults):
+    ## stands in for `_answer_batch` in the forked workers, fails the batch with line 2
+    if any(number == 2 for number, _ in batch):
+        raise RuntimeError("worker crashed")
+    return answer_batch(batch, defaults)
+
+
+@pytest.fixture
+def graph(split_example):
+    return CSRGraph.from_edges(*split_example)
+
+
+def test_bad_queries_get_error_lines(graph):
+    lines = results(graph, [
+        {"id": 1, "algorithm": "bfs", "start": ["a"], "goal": "h"},
+        {"id": 2, "algorithm": "bfs_levels", "start": "a", "goal": "h", "deadline": "x"},
+        {"id": 3, "algorithm": "astar", "start": "a", "goal": "h", "max_expansions": [1]},
+        {"id": 4, "algorithm": "astar", "start": "a", "goal": "nowhere"},
+        {"id": 5, "algorithm": "sorting", "start": "a", "goal": "h"},
+        {"id": 6, "algorithm": "dfs", "start": "a", "goal": "h", "prune": "path"},
+        {"id": 7, "start": "a"},
+        "not json",
+        {"id": 9, "algorithm": "astar", "start": "a", "goal": "h"},
+    ])
+    assert [line.get("id") for line in lines if "error" in line] == [1, 2, 3, 4, 5, 6, 7, None]
+    assert lines[-1]["id"] == 9 and lines[-1]["found"] and lines[-1]["path"][0] == "a"
+
+
+@pytest.mark.parametrize("algorithm", ["ids", "ids_tree", "dfs_tree", "bfs_tree", "ldfs_tree", "astar_tree"])
+def test_unreachable_goals_and_cycles_end(graph, algorithm):
+    unreachable, cyclic = results(graph, [{"id": 1, "algorithm": algorithm, "start": "a", "goal": "x"},
+                                          {"id": 2, "algorithm": algorithm, "start": "a", "goal": "h"}])
+    assert unreachable["found"] is False and not unreachable["path"]
+    assert cyclic["found"] and cyclic["path"][0] == "a" and cyclic["path"][-1] == "h"
+
+
+@pytest.mark.parametrize("algorithm", ["bfs", "bfs_levels"])
+def test_fewest_edges_match_networkx(random_graph, algorithm):
+    nodes, edges, reference = random_graph(40, 70, seed=6)
+    graph = CSRGraph.from_edges(nodes, edges)
+    queries = [{"id": i, "algorithm": algorithm, "start": "n0", "goal": f"n{i}"} for i in range(1, 40)]
+    lengths = nx.single_source_shortest_path_length(reference, "n0")
+    for line in results(graph, queries):
+        goal = f"n{line['id']}"
+        assert line["found"] == (goal in lengths)
+        if line["found"]:
+            assert len(line["path"]) - 1 == lengths[goal]
+            assert all(reference.has_edge(u, v) for u, v in zip(line["path"], line["path"][1:]))
+
+
+def test_workers_write_error_lines_for_a_failed_batch(graph, monkeypatch):
+    monkeypatch.setattr(runner, "_answer_batch", exploding_batch)
+    queries = [{"id": i, "algorithm": "ucs", "start": "a", "goal": "h"} for i in range(1, 7)]
+    lines = results(graph, queries, workers=2, batch_size=2)
+    failed = [line for line in lines if "error" in line]
+    assert [line["line"] for line in failed] == [1, 2] and "worker crashed" in failed[0]["error"]
+    assert [line["id"] for line in lines if "error" not in line] == [3, 4, 5, 6]
+    assert all(line["cost"] == nx.shortest_path_length(graph.to_networkx(), "a", "h", weight="stepcost")
+               for line in lines if "error" not in line)
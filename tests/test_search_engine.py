@@ -0,0 +1,96 @@
+import networkx as nx
+import pytest
+
+from algorithms.utils.SearchEngine import SearchEngine, SearchObserver
+
+
+class Generated(SearchObserver):
+    """Records the path of every generated node."""
+
+    def __init__(self):
+        self.paths = []
+
+    def on_generate(self, node):
+        self.paths.append([path_node.name for path_node in SearchEngine.path(node)])
+
+
+def engine_for(graph, goal, **options):
+    successors = lambda state: [(child, data["stepcost"]) for child, data in graph.adj[state].items()]
+    return SearchEngine(successors, lambda state: state == goal, **options)
+
+
+@pytest.mark.parametrize("policy", ["fifo", "lifo"])
+def test_path_pruning_generates_no_cycles(random_graph, policy):
+    _, _, graph = random_graph(12, 30, seed=2)
+    observer = Generated()
+    engine = engine_for(graph, None, policy=policy, tree=True, prune="path", observer=observer)
+    assert engine.run("n0") is None  ##no goal: every path without repeated states is generated
+    assert observer.paths and all(len(set(path)) == len(path) for path in observer.paths)
+    assert engine.pruned > 0
+    ## one generated node per simple path from n0
+    simple = sum(1 for target in graph if target != "n0" for _ in nx.all_simple_paths(graph, "n0", target))
+    assert engine.generated - 1 == simple
+
+
+def test_path_pruning_finds_the_tree_search_solution(random_graph):
+    _, _, graph = random_graph(30, 60, seed=4)
+    plain = engine_for(graph, "n7", tree=True).run("n0")
+    pruned = engine_for(graph, "n7", tree=True, prune="path").run("n0")
+    assert (plain is None) == (pruned is None)
+    if plain is not None:
+        assert plain.depth == pruned.depth == nx.shortest_path_length(graph, "n0", "n7")
+
+
+def test_table_pruning_keeps_the_cheapest_solution(random_graph):
+    _, _, graph = random_graph(30, 70, seed=8)
+    goal = engine_for(graph, "n9", policy="g", tree=True, prune="table").run("n0")
+    assert goal.sum_path_cost == nx.dijkstra_path_length(graph, "n0", "n9", weight="stepcost")
+
+
+def test_unknown_pruning_mode(random_graph):
+    with pytest.raises(ValueError):
+        engine_for(random_graph(3, 2, seed=0)[2], "n1", tree=True, prune="cycles")
+
+
+def test_iterative_deepening_stops_at_max_limit():
+    graph = nx.Graph()
+    graph.add_edge("a", "b", stepcost=1)
+    graph.add_node("c")
+    engine = engine_for(graph, "c", tree=True, iterative=True, max_limit=2)
+    assert engine.run("a") is None
+    assert engine.limit == 2
+
+
+def reachable_goals(graph, count):
+    return [goal for goal in nx.node_connected_component(graph, "n0") if goal != "n0"][:count]
+
+
+@pytest.mark.parametrize("tree", [False, True])
+def test_fifo_finds_the_fewest_edges(random_graph, tree):
+    _, _, graph = random_graph(20, 35, seed=3)
+    for goal in reachable_goals(graph, 6):
+        node = engine_for(graph, goal, tree=tree).run("n0")
+        assert node.name == goal and node.depth == nx.shortest_path_length(graph, "n0", goal)
+        path = [path_node.name for path_node in SearchEngine.path(node)]
+        assert path[0] == "n0" and nx.is_path(graph, path)
+
+
+@pytest.mark.parametrize("policy", ["g", "g+h"])
+def test_cost_ordered_tree_search_finds_the_cheapest_path(random_graph, policy):
+    _, _, graph = random_graph(12, 22, seed=6)
+    for goal in reachable_goals(graph, 4):
+        distances = nx.single_source_dijkstra_path_length(graph, goal, weight="stepcost")
+        heuristic = lambda state: distances[state] / 2  ##admissible
+        node = engine_for(graph, goal, policy=policy, tree=True, heuristic=heuristic).run("n0")
+        assert node.sum_path_cost == distances["n0"]
+
+
+def test_limit_and_iterative_deepening(random_graph):
+    _, _, graph = random_graph(15, 25, seed=9)
+    for goal in reachable_goals(graph, 5):
+        depth = nx.shortest_path_length(graph, "n0", goal)
+        ## the limit counts the nodes on a path
+        assert engine_for(graph, goal, policy="lifo", tree=True, limit=depth).run("n0") is None
+        assert engine_for(graph, goal, policy="lifo", tree=True, limit=depth + 1).run("n0").depth <= depth
+        engine = engine_for(graph, goal, policy="lifo", tree=True, iterative=True)
+        assert engine.run("n0").depth == depth and engine.limit == depth + 1
@@ -0,0 +1,70 @@
+import json
+
+import networkx as nx
+import pytest
+
+from algorithms.uninformed.BFS_graph import BFS
+from algorithms.uninformed.BFS_tree import BFS as BFS_tree
+from algorithms.utils.CSRGraph import CSRGraph
+from algorithms.utils.Problem import GraphProblem
+from algorithms.utils.SearchStats import NullStats, SearchStats, make_stats
+
+
+@pytest.fixture
+def problem(example):
+    return GraphProblem(CSRGraph.from_edges(*example), "a", "h")
+
+
+def test_counters_of_a_graph_search(example, problem):
+    stats = BFS.solve(problem, stats=True).stats
+    graph = nx.Graph()
+    graph.add_weighted_edges_from(example[1])
+    ## BFS reaches every node before h; each successor of an expanded node is generated or pruned once
+    assert stats.algorithm == "BFS_graph"
+    assert stats.expanded == len(graph) - 1 and stats.generated == len(graph) and stats.reopened == 0
+    assert stats.generated - 1 + stats.duplicates_pruned == sum(degree for node, degree in graph.degree if node != "h")
+    assert 1 <= stats.frontier_peak <= len(graph) and 0 < stats.frontier_mean <= stats.frontier_peak
+
+
+def test_tree_search_counts_reopened_states(problem):
+    solution = BFS_tree.solve(problem, stats=True)
+    stats = solution.stats
+    assert stats.expanded == solution.expanded and stats.generated == solution.generated
+    assert stats.reopened == stats.expanded - len(stats._seen) > 0
+    assert stats.duplicates_pruned == 0
+
+
+def test_timers_add_up(problem):
+    stats = BFS_tree.solve(problem, stats=True).stats
+    assert set(stats.timings) == {"expansion", "frontier", "goal_check"}
+    assert all(seconds >= 0 for seconds in stats.timings.values()) and stats.timings["expansion"] > 0
+    since = stats.clock()
+    before = stats.timings["frontier"]
+    assert stats.lap("frontier", since) >= since and stats.timings["frontier"] >= before
+
+
+def test_export_appends_json_lines(tmp_path, problem):
+    path = tmp_path / "stats.jsonl"
+    first = BFS.solve(problem, stats=True).stats
+    second = BFS_tree.solve(problem, stats=True).stats
+    first.export(str(path))
+    second.export(str(path))
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert lines == [json.loads(json.dumps(first.as_dict())), json.loads(json.dumps(second.as_dict()))]
+    assert [line["algorithm"] for line in lines] == ["BFS_graph", "BFS_tree"]
+    assert {"generated", "expanded", "frontier_mean", "time_expansion"} <= set(lines[0])
+
+
+def test_null_stats_collect_nothing(problem):
+    stats = make_stats(False, "BFS")
+    assert isinstance(stats, NullStats) and not stats.enabled
+    assert isinstance(make_stats(True), SearchStats) and make_stats(True).enabled
+    stats.generate(5)
+    stats.expand("a")
+    stats.prune(3)
+    stats.sample_frontier(7)
+    assert stats.lap("expansion", stats.clock()) == 0.0
+    assert (stats.generated, stats.expanded, stats.duplicates_pruned, stats.frontier_peak) == (0, 0, 0, 0)
+    assert sum(stats.timings.values()) == 0.0
+    solution = BFS.solve(problem)  ##stats off: the counts still come from the engine
+    assert not solution.stats.enabled and solution.stats.expanded == 0 and solution.expanded > 0
@@ -0,0 +1,58 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from algorithms.utils.CSRGraph import CSRGraph
+from algorithms.utils.ShortestPaths import shortest_path_tree
+from algorithms.utils.SharedGraph import SharedGraphStore, attach_graph, detach_graph
+
+
+def distances(graph):
+    ## runs in a worker process, the graph arrives as its block name
+    return shortest_path_tree(graph, "n0")[0].tolist(), graph.shared_name
+
+
+def test_attached_graph_shares_the_block(random_graph):
+    nodes, edges, _ = random_graph(30, 60, seed=31)
+    graph = CSRGraph.from_edges(nodes, edges)
+    with SharedGraphStore() as store:
+        name = store.publish(graph)
+        attached = attach_graph(name)
+        assert list(attached.names) == nodes
+        assert np.array_equal(attached.targets, graph.targets) and np.array_equal(attached.weights, graph.weights)
+        with pytest.raises(ValueError):
+            attached.weights[0] = 1.0  ##read-only for every process
+        assert pickle.loads(pickle.dumps(attached)).shared_name == name
+        assert len(pickle.dumps(attached)) < 200
+        detach_graph(attached)
+    assert store.versions == {} and store.current is None
+
+
+def test_workers_search_the_published_graph(random_graph):
+    nodes, edges, reference = random_graph(40, 80, seed=32)
+    graph = CSRGraph.from_edges(nodes, edges)
+    lengths = nx.single_source_dijkstra_path_length(reference, "n0", weight="stepcost")
+    expected = [lengths.get(name, float("inf")) for name in nodes]
+    with SharedGraphStore() as store:
+        attached = attach_graph(store.publish(graph))
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(distances, [attached] * 3))
+        detach_graph(attached)
+    assert all(result == (expected, store.prefix + "-v1") for result in results)
+
+
+def test_versions_are_released_separately(example):
+    graph = CSRGraph.from_edges(*example)
+    with SharedGraphStore() as store:
+        first = store.publish(graph)
+        second = store.publish(graph)
+        store.release(first)
+        assert list(store.versions) == [second] and store.current == second
+        attached = attach_graph(second)
+        assert attached.index("h") == graph.index("h")
+        detach_graph(attached)
+        with pytest.raises(FileNotFoundError):
+            attach_graph(first)
@@ -0,0 +1,37 @@
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from algorithms.utils.CSRGraph import CSRGraph
+from algorithms.utils.ShortestPaths import shortest_path_tree, tree_path
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_tree_matches_dijkstra(random_graph, directed):
+    nodes, edges, reference = random_graph(80, 200, seed=12, directed=directed)
+    graph = CSRGraph.from_edges(nodes, edges, directed=directed)
+    dist, pred = shortest_path_tree(graph, "n0")
+    lengths = nx.single_source_dijkstra_path_length(reference, "n0", weight="stepcost")
+    for node, name in enumerate(nodes):
+        if name not in lengths:
+            assert math.isinf(dist[node]) and pred[node] == -1 and tree_path(graph, dist, pred, name) == []
+            continue
+        assert dist[node] == lengths[name]
+        path = tree_path(graph, dist, pred, name)
+        assert path[0] == "n0" and path[-1] == name
+        assert nx.path_weight(reference, path, "stepcost") == lengths[name]
+
+
+def test_goal_stops_early_with_final_distances_only(random_graph):
+    nodes, edges, reference = random_graph(80, 200, seed=13)
+    graph = CSRGraph.from_edges(nodes, edges)
+    lengths = nx.single_source_dijkstra_path_length(reference, "n0", weight="stepcost")
+    goal = min((name for name in lengths if name != "n0"), key=lengths.get)
+    dist, pred = shortest_path_tree(graph, "n0", goal)
+    assert dist[graph.index(goal)] == lengths[goal]
+    settled = np.flatnonzero(np.isfinite(dist))
+    assert 2 <= len(settled) < len(lengths)
+    assert all(dist[node] == lengths[nodes[node]] for node in settled)
+    assert nx.path_weight(reference, tree_path(graph, dist, pred, goal), "stepcost") == lengths[goal]
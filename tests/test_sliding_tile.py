@@ -0,0 +1,72 @@
+import random
+
+import networkx as nx
+import pytest
+
+from algorithms.informed.astar_graph import AStar
+from algorithms.informed.Astar_tree import AStarTree
+from algorithms.problems.SlidingTile import SlidingTile, pack, unpack
+from algorithms.uninformed.BFS_graph import BFS
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("pdb"))
+
+
+def scramble(problem, moves, seed):
+    rng = random.Random(seed)
+    state, previous = problem.initial, None
+    for _ in range(moves):
+        previous, state = state, rng.choice([child for child, _ in problem.successors(state) if child != previous])
+    return state
+
+
+def state_graph(problem):
+    """The reachable states of a problem as networkx graph."""
+    graph, frontier = nx.Graph(), [problem.initial]
+    graph.add_node(problem.initial)
+    while frontier:
+        state = frontier.pop()
+        for child, _ in problem.successors(state):
+            if child not in graph:
+                frontier.append(child)
+            graph.add_edge(state, child)
+    return graph
+
+
+def test_pattern_databases_are_exact_on_the_2x2_board(cache_dir):
+    problem = SlidingTile(range(4), cache_dir=cache_dir)
+    distances = nx.single_source_shortest_path_length(state_graph(problem), problem.goal)
+    assert len(distances) == 12  ##half of the 4! boards
+    assert all(problem.h(state) == distance for state, distance in distances.items())
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_8_puzzle_solutions_are_optimal(cache_dir, seed):
+    goal = SlidingTile(range(9), cache_dir=cache_dir)
+    problem = SlidingTile(scramble(goal, 40, seed), size=3, cache_dir=cache_dir)
+    shortest = BFS.solve(problem)
+    solution = AStar.solve(problem)
+    assert solution.cost == shortest.cost and solution.expanded <= shortest.expanded
+    assert AStarTree.solve(problem).cost == shortest.cost  ##no duplicate detection, more expansions
+    assert problem.manhattan(problem.initial) <= problem.h(problem.initial) <= shortest.cost
+
+
+def test_solvable_parity(cache_dir):
+    tiles = list(range(9))
+    assert SlidingTile(tiles, cache_dir=cache_dir).solvable()
+    tiles[1], tiles[2] = tiles[2], tiles[1]
+    problem = SlidingTile(tiles, cache_dir=cache_dir)
+    assert problem.solvable() is False
+    assert AStar.solve(problem).node is None
+    ## the 4x4 board counts the blank row too
+    assert SlidingTile(scramble(SlidingTile(range(16), cache_dir=cache_dir), 25, 1), size=4,
+                       cache_dir=cache_dir).solvable()
+
+
+def test_state_encoding_round_trips(cache_dir):
+    problem = SlidingTile(range(9), cache_dir=cache_dir)
+    state = scramble(problem, 30, 7)
+    assert pack(unpack(state, 3)) == state
+    assert problem.from_key(problem.key(state)) == state
@@ -0,0 +1,62 @@
+import networkx as nx
+import pytest
+
+from algorithms.informed.Astar_tree import AStarTree
+from algorithms.utils.SearchEngine import SearchEngine, SearchObserver
+from algorithms.utils.SMAStar import SMAStarEngine
+
+
+class MemoryCheck(SearchObserver):
+    """Records the nodes in memory after every generated node."""
+
+    def __init__(self):
+        self.engine = None
+        self.used = []
+
+    def on_generate(self, node):
+        self.used.append(self.engine._used)
+
+
+def sma_star(graph, goal, memory, heuristic=None):
+    successors = lambda state: [(child, data["stepcost"]) for child, data in graph.adj[state].items()]
+    observer = MemoryCheck()
+    engine = SMAStarEngine(successors, lambda state: state == goal, memory, heuristic=heuristic, observer=observer)
+    observer.engine = engine
+    return engine, engine.run("n0"), observer.used
+
+
+@pytest.mark.parametrize("informed", [False, True])
+def test_memory_bound_and_optimal_cost(random_graph, informed):
+    _, _, graph = random_graph(30, 60, seed=51)
+    goal = "n13"
+    distances = nx.single_source_dijkstra_path_length(graph, goal, weight="stepcost")
+    heuristic = (lambda state: distances.get(state, 0) / 2) if informed else None
+    cheapest = nx.shortest_path_length(graph, "n0", goal, weight="stepcost")
+    ## at least one node more than the cheapest path
+    depth = min(len(path) for path in nx.all_shortest_paths(graph, "n0", goal, weight="stepcost"))
+    dropped = []
+    for memory in (depth + 1, depth + 4, 200):
+        engine, node, used = sma_star(graph, goal, memory, heuristic)
+        assert node is not None and node.sum_path_cost == cheapest
+        path = [path_node.name for path_node in reversed(SearchEngine.path(node))]
+        assert nx.path_weight(graph, path, "stepcost") == cheapest
+        assert max(used) <= memory
+        dropped.append(engine.dropped)
+    assert dropped[0] > 0 and dropped[-1] == 0  ##200 nodes hold the whole search
+
+
+def test_too_little_memory(random_graph):
+    _, _, graph = random_graph(30, 60, seed=51)
+    depth = nx.shortest_path_length(graph, "n0", "n13")
+    _, node, used = sma_star(graph, "n13", depth, None)  ##the shortest path has depth + 1 nodes
+    assert node is None and max(used) <= depth
+    with pytest.raises(ValueError):
+        sma_star(graph, "n13", 1)
+
+
+def test_solve_with_memory(example_graph, network_problem):
+    problem = network_problem(example_graph, "a", "h")
+    solution = AStarTree.solve(problem, memory=8)
+    assert solution.cost == nx.shortest_path_length(example_graph, "a", "h", weight="stepcost")
+    with pytest.raises(ValueError):
+        AStarTree.solve(problem, memory=8, limit=3)
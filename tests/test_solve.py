@@ -0,0 +1,82 @@
+import networkx as nx
+import pytest
+
+from algorithms.informed.astar_graph import AStar
+from algorithms.informed.Astar_tree import AStarTree
+from algorithms.uninformed.BFS_graph import BFS
+from algorithms.uninformed.BFS_tree import BFS as BFS_tree
+from algorithms.uninformed.DFS import DFS
+from algorithms.uninformed.DFS_tree import BFS as DFS_tree
+from algorithms.uninformed.IDS import IDS
+from algorithms.uninformed.IDS_tree import IDS_tree
+from algorithms.uninformed.UCS import UCS
+from algorithms.utils.Budget import Budget
+from algorithms.utils.CSRGraph import CSRGraph
+from algorithms.utils.Problem import GraphProblem
+
+ALL = [BFS, DFS, IDS, UCS, AStar, BFS_tree, DFS_tree, IDS_tree, AStarTree]
+
+
+def problem(nodes, edges, start, goal, directed=False):
+    return GraphProblem(CSRGraph.from_edges(nodes, edges, directed=directed), start, goal)
+
+
+@pytest.mark.parametrize("search", ALL)
+def test_unreachable_goal_is_answered_without_searching(search, split_example):
+    solution = search.solve(problem(*split_example, "a", "y"))
+    assert not solution.found
+    assert solution.expanded == 0
+
+
+@pytest.mark.parametrize("search", [IDS, IDS_tree, DFS_tree])
+def test_directed_dead_end_ends(search):
+    ## same component, but the only edge points away from the goal: deepening stops at the component size
+    nodes, edges = ["a", "b", "c"], (("a", "b", 1), ("b", "a", 1), ("c", "a", 1))
+    solution = search.solve(problem(nodes, edges, "a", "c", directed=True))
+    assert not solution.found
+
+
+@pytest.mark.parametrize("search", ALL)
+def test_every_search_reaches_the_goal(search, example):
+    solution = search.solve(problem(*example, "a", "h"))
+    assert solution.found
+    assert solution.path[0] == 0 and solution.path[-1] == 7
+
+
+@pytest.mark.parametrize("search", [BFS, BFS_tree, IDS, IDS_tree])
+def test_fewest_edges(search, random_graph):
+    nodes, edges, reference = random_graph(25, 40, seed=5)
+    graph = CSRGraph.from_edges(nodes, edges)
+    expected = nx.single_source_shortest_path_length(reference, "n0")
+    for goal in nodes[1:8]:
+        solution = search.solve(GraphProblem(graph, "n0", goal))
+        assert solution.found == (goal in expected)
+        if solution.found:
+            assert len(solution.path) - 1 == expected[goal]
+
+
+@pytest.mark.parametrize("search", [UCS, AStar, AStarTree])
+def test_cheapest_path(search, random_graph):
+    nodes, edges, reference = random_graph(40, 80, seed=11)
+    graph = CSRGraph.from_edges(nodes, edges)
+    expected = nx.single_source_dijkstra_path_length(reference, "n0", weight="stepcost")
+    for goal in nodes[1:10]:
+        solution = search.solve(GraphProblem(graph, "n0", goal))
+        assert solution.found == (goal in expected)
+        if solution.found:
+            assert solution.cost == expected[goal]
+            assert nx.path_weight(reference, GraphProblem(graph, "n0").names(solution.path), "stepcost") == solution.cost
+
+
+def test_budget_stops_with_a_partial_result(example):
+    solution = BFS_tree.solve(problem(*example, "a", "h"), budget=Budget(max_expansions=3))
+    assert solution.stopped == "expansions"
+    assert not solution.found
+    assert solution.best_path[0] == 0
+
+
+def test_component_index(split_example):
+    graph = CSRGraph.from_edges(*split_example)
+    labels, sizes = graph.components()
+    assert labels[graph.index("a")] != labels[graph.index("x")]
+    assert sorted(sizes.tolist()) == [2, 8]
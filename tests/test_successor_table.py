@@ -0,0 +1,49 @@
+import pytest
+
+from algorithms.informed.astar_graph import AStar
+from algorithms.informed.Astar_tree import AStarTree
+from algorithms.uninformed.BFS_graph import BFS
+from algorithms.uninformed.BFS_tree import BFS as BFS_tree
+from algorithms.uninformed.IDS_tree import IDS_tree
+from algorithms.utils.TreeNode import TreeNode
+
+
+class DirectedBFS(BFS_tree):
+    directed = True
+
+
+class DirectedIDS(IDS_tree):
+    directed = True
+
+
+def walk(search, node):
+    ## the successors as they were read from the graph on every expansion before the tables
+    return [(child, data["stepcost"]) for child, data in search._graph.adj[node].items()]
+
+
+@pytest.mark.parametrize("search", [BFS, AStar, BFS_tree, AStarTree, DirectedBFS, DirectedIDS])
+def test_table_matches_the_adjacency_walk(random_graph, search):
+    directed = search in (DirectedBFS, DirectedIDS)
+    names, edges, _ = random_graph(40, 90, seed=5, directed=directed)
+    nodes = {name: 0 for name in names}  ##no heuristic, the informed searches read it from a dict
+    run = search(nodes, edges, "n0", "n7", show=False)
+    table = run._successor_table()
+    assert table.keys() == set(nodes)
+    for node in nodes:
+        assert list(table[node]) == walk(run, node)
+    if directed:  ##only the edges from node1 to node2
+        assert sum(len(row) for row in table.values()) == len(edges)
+
+    class Walking(search):
+        def _successors(self, node):
+            return walk(self, node)
+    old = Walking(nodes, edges, "n0", "n7", show=False)
+    assert old._path == run._path and len(old._frames) == len(run._frames)
+
+
+def test_neighbors_argument_is_ignored():
+    parent = TreeNode("a")
+    with pytest.deprecated_call():
+        node = TreeNode("b", 2, ["c"], parent, "red", 3)
+    assert node.parent is parent and node.edge_color == "red" and node.path_cost == 3
+    assert node.sum_heuristic == 2 and not hasattr(node, "_neighbors")
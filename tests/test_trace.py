@@ -0,0 +1,112 @@
+import os
+
+import networkx as nx
+import pytest
+
+from algorithms.informed.astar_graph import AStar
+from algorithms.informed.Astar_tree import AStarTree
+from algorithms.uninformed.BFS_graph import BFS
+from algorithms.uninformed.BFS_tree import BFS as BFS_tree
+from algorithms.uninformed.IDS_tree import IDS_tree
+from algorithms.utils.Trace import DELTA, KEYFRAME, WINDOW, TraceReader, TraceWriter, open_trace
+
+
+def frames(count):
+    return [{"step": i, "nodes": {f"n{j}": j % 3 for j in range(40)}, "frontier": list(range(i))}
+            for i in range(count)]
+
+
+@pytest.mark.parametrize("keyframe", [1, 3, 16])
+def test_frames_round_trip(tmp_path, keyframe):
+    path, written = str(tmp_path / "t.trace"), frames(20)
+    with TraceWriter(path, keyframe=keyframe) as writer:
+        for frame in written:
+            writer.append(frame)
+    reader = TraceReader(path)
+    assert reader.complete and len(reader) == 20 and list(reader) == written
+    ## random access decompresses the keyframe of a delta frame first
+    assert [reader[i] for i in (19, 4, 0, 17, 5, -1)] == [written[i] for i in (19, 4, 0, 17, 5, -1)]
+    assert reader.context() is None
+    with pytest.raises(IndexError):
+        reader[20]
+    reader.close()
+
+
+def test_deltas_are_smaller_than_keyframes(tmp_path):
+    keyed, delta = str(tmp_path / "k.trace"), str(tmp_path / "d.trace")
+    for path, keyframe in ((keyed, 1), (delta, 16)):
+        with TraceWriter(path, keyframe=keyframe) as writer:
+            for frame in frames(32):
+                writer.append(frame)
+    assert os.path.getsize(delta) < os.path.getsize(keyed)
+
+
+def test_incomplete_trace_keeps_its_complete_records(tmp_path):
+    path, written = str(tmp_path / "t.trace"), frames(10)
+    writer = TraceWriter(path, keyframe=4)
+    for frame in written:
+        writer.append(frame)
+    writer._file.flush()
+    size = os.path.getsize(path)
+    os.truncate(path, size - 5)  ##a search killed while writing its last frame
+    reader = TraceReader(path)
+    assert not reader.complete and list(reader) == written[:9] and reader.context() is None
+    reader.close()
+    with pytest.raises(ValueError):
+        open_trace(path)
+    writer._file.close()
+
+
+def test_not_a_trace(tmp_path):
+    path = tmp_path / "t.trace"
+    path.write_bytes(b"0" * 64)
+    with pytest.raises(ValueError):
+        TraceReader(str(path))
+
+
+@pytest.mark.parametrize("search", [BFS, AStar, AStarTree, IDS_tree])
+def test_search_replays_from_its_trace(tmp_path, example, search):
+    path = str(tmp_path / "search.trace")
+    kept = search(*example, show=False)
+    traced = search(*example, show=False, trace=path)
+    replay = open_trace(path)
+    assert len(replay._frames) == len(kept._frames) == len(traced._frames)
+    assert replay._path == kept._path
+    graph = nx.Graph()
+    graph.add_weighted_edges_from(example[1])
+    if search is BFS:
+        assert len(replay._path) - 1 == nx.shortest_path_length(graph, "a", "h")
+    elif search is IDS_tree:
+        assert replay._end_leaf.depth == nx.shortest_path_length(graph, "a", "h")
+    elif search is AStar:
+        assert nx.path_weight(graph, replay._path, "weight") == nx.shortest_path_length(graph, "a", "h", weight="weight")
+    else:  ##tree searches keep node ids on the path
+        assert replay._end_leaf.sum_path_cost == nx.shortest_path_length(graph, "a", "h", weight="weight")
+
+
+@pytest.mark.parametrize("search", [BFS, BFS_tree])
+def test_long_paths_are_traced(tmp_path, search):
+    ## the solution and the search tree pickle as flat records, not one recursion level per node
+    names = [f"n{i}" for i in range(1000)]
+    path = str(tmp_path / "search.trace")
+    traced = search(names, tuple((u, v, 1) for u, v in zip(names, names[1:])), "n0", "n999", show=False, trace=path)
+    replay = open_trace(path)
+    assert len(replay._frames) == len(traced._frames) and replay._path == traced._path
+    assert len(replay._path) == 1000
+    node = replay._end_leaf if search is BFS_tree else replay._solution.node
+    assert node.depth == 999 and node.sum_path_cost == 999
+
+
+def test_large_frames_compress_against_their_keyframe(tmp_path, random_graph):
+    ## frames of 1000 nodes pickle to far more than the 32 KB zlib window
+    nodes, edges, _ = random_graph(1000, 2500, seed=7)
+    path = str(tmp_path / "search.trace")
+    BFS(nodes, edges, "n0", "n999", show=False, trace=path)
+    reader = TraceReader(path)
+    sizes = {KEYFRAME: [], DELTA: []}
+    for offset in reader._offsets:
+        kind, packed = reader._record(offset)
+        sizes[kind].append(len(packed))
+    assert len(reader._raw(1)) > 3 * WINDOW and len(sizes[DELTA]) > 10
+    assert sum(sizes[DELTA]) / len(sizes[DELTA]) < sum(sizes[KEYFRAME]) / len(sizes[KEYFRAME]) / 4
+    reader.close()
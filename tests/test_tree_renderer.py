@@ -0,0 +1,62 @@
+import matplotlib.pyplot as plt
+import pytest
+
+import algorithms.utils.TreeRenderer as renderer
+from algorithms.utils.TreeNode import TreeNode
+from algorithms.utils.TreeRenderer import TreeRenderer, collect_tree
+
+
+def snapshot(size, names="n"):
+    """A search tree of `size` nodes, node k below node (k - 1) // 2, as a new frame."""
+    nodes = [TreeNode(f"{names}0")]
+    for k in range(1, size):
+        nodes.append(TreeNode(f"{names}{k}", parent=nodes[(k - 1) // 2], path_cost=1, node_id=k))
+    return nodes[0]
+
+
+@pytest.fixture
+def layouts(monkeypatch):
+    calls = []
+
+    def counted(root):
+        calls.append(len(collect_tree(root)))
+        return renderer.tidy_layout(root)
+    monkeypatch.setattr(renderer, "tree_layout", counted)
+    return calls
+
+
+def test_live_frames_are_laid_out_when_the_tree_doubled(layouts):
+    fig, ax = plt.subplots()
+    view = TreeRenderer(ax, (), lambda node: node.name)
+    for size in range(1, 101):
+        view.update(snapshot(size))
+    assert layouts == [1, 2, 4, 8, 16, 32, 64]
+    pos, _ = view._layouts[0]
+    assert sorted(view._ids) == list(range(100)) == sorted(pos)
+    assert len(view._node_artist.get_offsets()) == 100 and len(view._edges) == 99
+    assert len(set(pos.values())) == 100  ##placed nodes do not overlap
+    for node in collect_tree(snapshot(100)).values():
+        if node.parent:
+            assert pos[node._id][1] < pos[node.parent._id][1]
+    assert all(view._label_artists[node_id].get_text() == f"n{node_id}" for node_id in range(100))
+    plt.close(fig)
+
+
+def test_restarted_tree_starts_a_new_layout(layouts):
+    fig, ax = plt.subplots()
+    view = TreeRenderer(ax, (), lambda node: node.name)
+    for size in (1, 2, 3):
+        view.update(snapshot(size))
+    view.update(snapshot(1, names="m"))
+    assert view._segments.segment_of == [0, 0, 0, 1] and layouts == [1, 2, 1]
+    plt.close(fig)
+
+
+def test_known_frames_are_laid_out_once_per_segment(layouts):
+    fig, ax = plt.subplots()
+    frames = [snapshot(size) for size in range(1, 30)]
+    view = TreeRenderer(ax, frames, lambda node: node.name)
+    for frame in frames:
+        view.update(frame)
+    assert layouts == [29]
+    plt.close(fig)
@@ -0,0 +1,40 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import networkx as nx
+import pytest
+
+from algorithms.informed.Astar_tree import AStarTree
+from algorithms.uninformed.BFS_tree import BFS as BFS_tree
+from algorithms.uninformed.DFS_tree import BFS as DFS_tree  ##the class keeps the name of the template it was copied from
+from algorithms.uninformed.IDS_tree import IDS_tree
+from algorithms.utils.TreeRenderer import collect_tree
+
+SEARCHES = [BFS_tree, DFS_tree, IDS_tree, AStarTree]
+
+
+@pytest.fixture
+def switch_often():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  ##threads interleave within a search step
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_searches_in_threads_number_their_own_nodes(example, switch_often):
+    graph = nx.Graph()
+    graph.add_weighted_edges_from(example[1])
+    alone = {search: search(*example, show=False)._path for search in SEARCHES}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        runs = list(pool.map(lambda search: (search, search(*example, show=False)), SEARCHES * 4))
+    for search, run in runs:
+        nodes = collect_tree(run._root)
+        assert sorted(nodes) == list(range(len(nodes)))  ##from 0, without gaps
+        assert run._path == alone[search]
+        path, node = [], run._end_leaf
+        while node is not None:
+            path.append(node)
+            node = node.parent
+        assert [node._id for node in reversed(path)] == run._path
+        names = [node.name for node in reversed(path)]
+        assert names[0] == "a" and names[-1] == "h" and nx.is_path(graph, names)